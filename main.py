@@ -2,16 +2,16 @@
 """ALM Orchestrator - Jira + Claude Code + GitHub integration daemon."""
 
 import argparse
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-
-from dotenv import load_dotenv
-
-from alm_orchestrator.config import Config, ConfigError
-from alm_orchestrator.daemon import Daemon
+from typing import Optional
 
 
 # Default paths and settings
@@ -29,6 +29,28 @@ LOG_FILE_EXTENSION = ".log"
 LOG_TIMESTAMP_FORMAT = "%Y%m%d-%H%M%S"
 
 
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders each second's timestamp only once.
+
+    Log formats here have one-second resolution, so records logged within
+    the same second share the formatted asctime string.
+    """
+
+    def __init__(self, fmt: str, datefmt: str):
+        super().__init__(fmt, datefmt=datefmt)
+        # (epoch second, formatted string); replaced as a single tuple so
+        # concurrent worker threads never see a mismatched pair
+        self._cached_time = (None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached_second, cached_text = self._cached_time
+        if second != cached_second:
+            cached_text = time.strftime(datefmt or self.datefmt, self.converter(second))
+            self._cached_time = (second, cached_text)
+        return cached_text
+
+
 def setup_logging(verbose: bool = False, logs_dir: str = DEFAULT_LOGS_DIR) -> None:
     """Configure dual logging: console + CSV file.
 
@@ -50,20 +72,25 @@ def setup_logging(verbose: bool = False, logs_dir: str = DEFAULT_LOGS_DIR) -> No
     # Console handler - CSV format for easy review
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.DEBUG if verbose else logging.INFO)
-    console_handler.setFormatter(logging.Formatter(
+    console_handler.setFormatter(CachedTimeFormatter(
         LOG_FORMAT_CONSOLE,
         datefmt=LOG_DATEFMT_CONSOLE
     ))
     root_logger.addHandler(console_handler)
 
-    # File handler - CSV format, DEBUG level
+    # File handler - CSV format, DEBUG level. Written from a background
+    # listener thread so callers only pay for a queue put.
     file_handler = logging.FileHandler(log_file)
     file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(logging.Formatter(
+    file_handler.setFormatter(CachedTimeFormatter(
         LOG_FORMAT_FILE,
         datefmt=LOG_DATEFMT_FILE
     ))
-    root_logger.addHandler(file_handler)
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
 
     logging.info(f"Logging to: {log_file}")
 
@@ -120,6 +147,12 @@ def main() -> int:
 
     args = parser.parse_args()
 
+    # Deferred so --help and argument errors don't pay for importing
+    # dotenv, jira, and PyGithub
+    from dotenv import load_dotenv
+    from alm_orchestrator.config import Config, ConfigError
+    from alm_orchestrator.daemon import Daemon
+
     setup_logging(args.verbose, args.logs_dir)
     logger = logging.getLogger(__name__)
 
@@ -3,7 +3,7 @@
 import logging
 import os
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Dict
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +13,46 @@ AI_LABEL_PREFIX = "ai-"
 TEMPLATE_EXTENSION = ".md"
 
 
+def format_banner(header: str) -> str:
+    """Format a comment header underlined with '=' and followed by a blank line.
+
+    Args:
+        header: The header text (e.g., "IMPACT ANALYSIS").
+
+    Returns:
+        The banner string, ready to prefix a comment body.
+    """
+    return f"{header}\n{'=' * len(header)}\n\n"
+
+
+BANNER_INVALID_ISSUE_TYPE = format_banner("INVALID ISSUE TYPE")
+RESPONSE_BLOCKED_COMMENT = (
+    f"{format_banner('AI RESPONSE BLOCKED')}"
+    "The AI agent's response was flagged by automated security checks "
+    "and has not been posted. Please review the issue manually."
+)
+
+
+def _scan_templates(prompts_dir: str) -> Dict[str, str]:
+    """Map template names (without extension) to their paths in prompts_dir.
+
+    Args:
+        prompts_dir: Path to directory containing prompt templates.
+
+    Returns:
+        Dict of template name to path. Empty if the directory is missing.
+    """
+    try:
+        with os.scandir(prompts_dir) as entries:
+            return {
+                entry.name[:-len(TEMPLATE_EXTENSION)]: entry.path
+                for entry in entries
+                if entry.name.endswith(TEMPLATE_EXTENSION) and entry.is_file()
+            }
+    except FileNotFoundError:
+        return {}
+
+
 class BaseAction(ABC):
     """Abstract base class for all AI actions.
 
@@ -28,6 +68,8 @@ class BaseAction(ABC):
         """
         self._prompts_dir = prompts_dir
         self._validator = validator
+        # Scan once; templates don't change while the daemon runs
+        self._templates = _scan_templates(prompts_dir)
 
     @property
     @abstractmethod
@@ -45,6 +87,9 @@ class BaseAction(ABC):
     ) -> str:
         """Execute the action for the given Jira issue.
 
+        Every path that returns must end with jira_client.finish_action(),
+        which posts the final comment and removes the processing label.
+
         Args:
             issue: The Jira issue object.
             jira_client: JiraClient instance for posting comments.
@@ -56,26 +101,35 @@ class BaseAction(ABC):
         """
         pass
 
-    def get_template_path(self) -> str:
-        """Get the path to this action's prompt template.
+    @property
+    def template_name(self) -> str:
+        """Template file name without extension. Override if it differs.
 
         Convention: ai-{name} label uses {name}.md template.
+        """
+        return self.label.replace(AI_LABEL_PREFIX, "")
+
+    def get_template_path(self) -> str:
+        """Get the path to this action's prompt template.
 
         Returns:
             Absolute path to the template file.
         """
-        template_name = self.label.replace(AI_LABEL_PREFIX, "") + TEMPLATE_EXTENSION
-        return os.path.join(self._prompts_dir, template_name)
+        name = self.template_name
+        path = self._templates.get(name)
+        if path is None:
+            path = os.path.join(self._prompts_dir, name + TEMPLATE_EXTENSION)
+        return path
 
     @property
-    def allowed_issue_types(self) -> list[str]:
+    def allowed_issue_types(self) -> frozenset[str]:
         """Issue types this action can run on. Override in subclasses.
 
         Returns:
-            List of allowed issue type names (e.g., ["Bug", "Story"]).
-            Empty list means no validation (all types allowed).
+            Set of allowed issue type names (e.g., {"Bug", "Story"}).
+            Empty set means no validation (all types allowed).
         """
-        return []
+        return frozenset()
 
     def validate_issue_type(self, issue, jira_client) -> bool:
         """Check if issue type is allowed. Posts rejection comment if not.
@@ -100,20 +154,15 @@ class BaseAction(ABC):
             f"Rejecting {issue.key}: {self.label} does not support issue type {issue_type}"
         )
 
-        # Post rejection comment
-        allowed_str = ", ".join(allowed)
-        header = "INVALID ISSUE TYPE"
+        allowed_str = ", ".join(sorted(allowed))
         comment = (
-            f"{header}\n"
-            f"{'=' * len(header)}\n\n"
+            f"{BANNER_INVALID_ISSUE_TYPE}"
             f"The {self.label} action only works on: {allowed_str}\n\n"
             f"This issue is a {issue_type}. "
             f"Please use an appropriate action for this issue type."
         )
-        jira_client.add_comment(issue.key, comment)
-
-        # Remove label
-        jira_client.remove_label(issue.key, self.label)
+        # Post rejection comment and remove the processing label in one edit
+        jira_client.finish_action(issue.key, comment)
 
         return False
 
@@ -124,13 +173,17 @@ class BaseAction(ABC):
         action_type: str,
         jira_client: Any
     ) -> bool:
-        """Validate response and post to Jira if safe.
+        """Validate response, post to Jira if safe, and remove the processing label.
+
+        The comment and label removal go out as a single Jira edit. The
+        label is removed even when the response is blocked, marking the
+        issue as processed.
 
         Args:
             issue_key: The Jira issue key.
             response: Claude's response text.
             action_type: The action type for structural validation.
-            jira_client: JiraClient for posting comments.
+            jira_client: JiraClient for posting comments and removing labels.
 
         Returns:
             True if response was posted, False if blocked.
@@ -152,16 +205,10 @@ class BaseAction(ABC):
             )
 
             # Post generic warning comment
-            header = "AI RESPONSE BLOCKED"
-            comment = (
-                f"{header}\n{'=' * len(header)}\n\n"
-                "The AI agent's response was flagged by automated security checks "
-                "and has not been posted. Please review the issue manually."
-            )
-            jira_client.add_comment(issue_key, comment)
+            jira_client.finish_action(issue_key, RESPONSE_BLOCKED_COMMENT)
 
             return False
 
         # Valid - post the response
-        jira_client.add_comment(issue_key, response)
+        jira_client.finish_action(issue_key, response)
         return True
@@ -1,16 +1,17 @@
 """Fix action handler for bug fixes that create PRs."""
 
 import logging
-import os
-from alm_orchestrator.actions.base import BaseAction
+from alm_orchestrator.actions.base import BaseAction, format_banner
 from alm_orchestrator.github_client import generate_branch_name
 
 logger = logging.getLogger(__name__)
 
 # Label and conventions for fixes
 LABEL_FIX = "ai-fix"
+ALLOWED_ISSUE_TYPES = frozenset({"Bug"})
 BRANCH_PREFIX_FIX = "fix-"
 COMMIT_PREFIX_FIX = "fix: "
+BANNER_FIX_CREATED = format_banner("FIX CREATED")
 
 
 class FixAction(BaseAction):
@@ -21,8 +22,8 @@ class FixAction(BaseAction):
         return LABEL_FIX
 
     @property
-    def allowed_issue_types(self) -> list[str]:
-        return ["Bug"]
+    def allowed_issue_types(self) -> frozenset[str]:
+        return ALLOWED_ISSUE_TYPES
 
     def execute(self, issue, jira_client, github_client, claude_executor) -> str:
         """Execute bug fix and create PR.
@@ -49,15 +50,14 @@ class FixAction(BaseAction):
             issue_key, jira_client
         )
 
-        # Clone and create branch
-        work_dir = github_client.clone_repo()
         branch_name = generate_branch_name(BRANCH_PREFIX_FIX, issue_key)
 
-        try:
+        # Check out the repo and create the branch
+        with github_client.workspace() as work_dir:
             github_client.create_branch(work_dir, branch_name)
 
             # Run Claude to implement the fix (read-write tools)
-            template_path = os.path.join(self._prompts_dir, "fix.md")
+            template_path = self.get_template_path()
             result = claude_executor.execute_with_template(
                 work_dir=work_dir,
                 template_path=template_path,
@@ -88,16 +88,14 @@ class FixAction(BaseAction):
             )
 
             # Format response with PR link and cost
-            header = "FIX CREATED"
             response = (
-                f"{header}\n"
-                f"{'=' * len(header)}\n\n"
+                f"{BANNER_FIX_CREATED}"
                 f"Pull Request: {pr.html_url}\n\n"
                 f"Review the changes and merge when ready."
                 f"\n\n---\n_Cost: ${result.cost_usd:.4f}_"
             )
 
-            # Validate and post
+            # Validate, post, and remove the label (even if blocked)
             posted = self._validate_and_post(
                 issue_key=issue_key,
                 response=response,
@@ -105,17 +103,11 @@ class FixAction(BaseAction):
                 jira_client=jira_client
             )
 
-            # Always remove the label to mark as processed (even if blocked)
-            jira_client.remove_label(issue_key, self.label)
-
             if posted:
                 return f"Fix PR created for {issue_key}: {pr.html_url}"
             else:
                 return f"Fix response blocked for {issue_key}"
 
-        finally:
-            github_client.cleanup(work_dir)
-
     def _build_prior_analysis_section(self, issue_key: str, jira_client) -> str:
         """Build the prior analysis section from investigation and recommendation.
 
@@ -1,9 +1,10 @@
 """Impact analysis action handler."""
 
-import os
-from alm_orchestrator.actions.base import BaseAction
+from alm_orchestrator.actions.base import BaseAction, format_banner
 
 LABEL_IMPACT = "ai-impact"
+ALLOWED_ISSUE_TYPES = frozenset({"Bug", "Story"})
+BANNER_IMPACT = format_banner("IMPACT ANALYSIS")
 
 
 class ImpactAction(BaseAction):
@@ -14,8 +15,8 @@ class ImpactAction(BaseAction):
         return LABEL_IMPACT
 
     @property
-    def allowed_issue_types(self) -> list[str]:
-        return ["Bug", "Story"]
+    def allowed_issue_types(self) -> frozenset[str]:
+        return ALLOWED_ISSUE_TYPES
 
     def execute(self, issue, jira_client, github_client, claude_executor) -> str:
         """Execute impact analysis.
@@ -37,10 +38,8 @@ class ImpactAction(BaseAction):
         if not self.validate_issue_type(issue, jira_client):
             return f"Rejected {issue_key}: invalid issue type"
 
-        work_dir = github_client.clone_repo()
-
-        try:
-            template_path = os.path.join(self._prompts_dir, "impact.md")
+        with github_client.workspace() as work_dir:
+            template_path = self.get_template_path()
             result = claude_executor.execute_with_template(
                 work_dir=work_dir,
                 template_path=template_path,
@@ -54,13 +53,12 @@ class ImpactAction(BaseAction):
             )
 
             # Format response with cost footer
-            header = "IMPACT ANALYSIS"
             response = (
-                f"{header}\n{'=' * len(header)}\n\n{result.content}"
+                f"{BANNER_IMPACT}{result.content}"
                 f"\n\n---\n_Cost: ${result.cost_usd:.4f}_"
             )
 
-            # Validate and post
+            # Validate, post, and remove the label (even if blocked)
             posted = self._validate_and_post(
                 issue_key=issue_key,
                 response=response,
@@ -68,13 +66,7 @@ class ImpactAction(BaseAction):
                 jira_client=jira_client
             )
 
-            # Always remove the label to mark as processed (even if blocked)
-            jira_client.remove_label(issue_key, self.label)
-
             if posted:
                 return f"Impact analysis complete for {issue_key}"
             else:
                 return f"Impact analysis response blocked for {issue_key}"
-
-        finally:
-            github_client.cleanup(work_dir)
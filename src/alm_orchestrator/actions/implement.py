@@ -1,8 +1,7 @@
 """Implement action handler for feature implementation."""
 
 import logging
-import os
-from alm_orchestrator.actions.base import BaseAction
+from alm_orchestrator.actions.base import BaseAction, format_banner
 from alm_orchestrator.github_client import generate_branch_name
 
 logger = logging.getLogger(__name__)
@@ -10,8 +9,11 @@ logger = logging.getLogger(__name__)
 
 # Label and conventions for features
 LABEL_IMPLEMENT = "ai-implement"
+ALLOWED_ISSUE_TYPES = frozenset({"Story"})
 BRANCH_PREFIX_FEATURE = "feature-"
 COMMIT_PREFIX_FEAT = "feat: "
+BANNER_IMPLEMENTATION_CREATED = format_banner("IMPLEMENTATION CREATED")
+INVALID_TICKET_COMMENT = format_banner("INVALID TICKET").rstrip()
 
 
 class ImplementAction(BaseAction):
@@ -22,8 +24,8 @@ class ImplementAction(BaseAction):
         return LABEL_IMPLEMENT
 
     @property
-    def allowed_issue_types(self) -> list[str]:
-        return ["Story"]
+    def allowed_issue_types(self) -> frozenset[str]:
+        return ALLOWED_ISSUE_TYPES
 
     def execute(self, issue, jira_client, github_client, claude_executor) -> str:
         """Execute feature implementation and create PR.
@@ -50,14 +52,13 @@ class ImplementAction(BaseAction):
             issue_key, jira_client
         )
 
-        work_dir = github_client.clone_repo()
         branch_name = generate_branch_name(BRANCH_PREFIX_FEATURE, issue_key)
 
-        try:
+        with github_client.workspace() as work_dir:
             github_client.create_branch(work_dir, branch_name)
 
             # Run Claude to implement the feature (read-write tools)
-            template_path = os.path.join(self._prompts_dir, "implement.md")
+            template_path = self.get_template_path()
             result = claude_executor.execute_with_template(
                 work_dir=work_dir,
                 template_path=template_path,
@@ -74,10 +75,7 @@ class ImplementAction(BaseAction):
             # Check if Claude rejected the ticket as invalid/unsafe
             if self._is_invalid_ticket(result.content):
                 logger.warning(f"Invalid ticket rejected: {issue_key}")
-                header = "INVALID TICKET"
-                comment = f"{header}\n{'=' * len(header)}"
-                jira_client.add_comment(issue_key, comment)
-                jira_client.remove_label(issue_key, self.label)
+                jira_client.finish_action(issue_key, INVALID_TICKET_COMMENT)
                 return f"Invalid ticket rejected for {issue_key}"
 
             commit_message = f"{COMMIT_PREFIX_FEAT}{summary}\n\nJira: {issue_key}"
@@ -97,16 +95,14 @@ class ImplementAction(BaseAction):
             )
 
             # Format response with PR link and cost
-            header = "IMPLEMENTATION CREATED"
             response = (
-                f"{header}\n"
-                f"{'=' * len(header)}\n\n"
+                f"{BANNER_IMPLEMENTATION_CREATED}"
                 f"Pull Request: {pr.html_url}\n\n"
                 f"Review the changes and merge when ready."
                 f"\n\n---\n_Cost: ${result.cost_usd:.4f}_"
             )
 
-            # Validate and post
+            # Validate, post, and remove the label (even if blocked)
             posted = self._validate_and_post(
                 issue_key=issue_key,
                 response=response,
@@ -114,17 +110,11 @@ class ImplementAction(BaseAction):
                 jira_client=jira_client
             )
 
-            # Always remove the label to mark as processed (even if blocked)
-            jira_client.remove_label(issue_key, self.label)
-
             if posted:
                 return f"Feature PR created for {issue_key}: {pr.html_url}"
             else:
                 return f"Implementation response blocked for {issue_key}"
 
-        finally:
-            github_client.cleanup(work_dir)
-
     def _is_invalid_ticket(self, content: str) -> bool:
         """Check if Claude's response indicates an invalid/unsafe ticket.
 
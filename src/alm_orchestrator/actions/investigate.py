@@ -1,9 +1,10 @@
 """Investigate action handler for root cause analysis."""
 
-import os
-from alm_orchestrator.actions.base import BaseAction
+from alm_orchestrator.actions.base import BaseAction, format_banner
 
 LABEL_INVESTIGATE = "ai-investigate"
+ALLOWED_ISSUE_TYPES = frozenset({"Bug"})
+BANNER_INVESTIGATION = format_banner("INVESTIGATION RESULTS")
 
 
 class InvestigateAction(BaseAction):
@@ -14,8 +15,8 @@ class InvestigateAction(BaseAction):
         return LABEL_INVESTIGATE
 
     @property
-    def allowed_issue_types(self) -> list[str]:
-        return ["Bug"]
+    def allowed_issue_types(self) -> frozenset[str]:
+        return ALLOWED_ISSUE_TYPES
 
     def execute(self, issue, jira_client, github_client, claude_executor) -> str:
         """Execute root cause investigation.
@@ -37,12 +38,10 @@ class InvestigateAction(BaseAction):
         if not self.validate_issue_type(issue, jira_client):
             return f"Rejected {issue_key}: invalid issue type"
 
-        # Clone the repo
-        work_dir = github_client.clone_repo()
-
-        try:
+        # Check out the repo; the workspace is removed when the block exits
+        with github_client.workspace() as work_dir:
             # Run Claude with the investigate template (read-only tools)
-            template_path = os.path.join(self._prompts_dir, "investigate.md")
+            template_path = self.get_template_path()
             result = claude_executor.execute_with_template(
                 work_dir=work_dir,
                 template_path=template_path,
@@ -56,9 +55,8 @@ class InvestigateAction(BaseAction):
             )
 
             # Format response with cost footer
-            header = "INVESTIGATION RESULTS"
             response = (
-                f"{header}\n{'=' * len(header)}\n\n{result.content}"
+                f"{BANNER_INVESTIGATION}{result.content}"
                 f"\n\n---\n_Cost: ${result.cost_usd:.4f}_"
             )
 
@@ -70,14 +68,7 @@ class InvestigateAction(BaseAction):
                 jira_client=jira_client
             )
 
-            # Always remove the label to mark as processed (even if blocked)
-            jira_client.remove_label(issue_key, self.label)
-
             if posted:
                 return f"Investigation complete for {issue_key}"
             else:
                 return f"Investigation response blocked for {issue_key}"
-
-        finally:
-            # Always cleanup
-            github_client.cleanup(work_dir)
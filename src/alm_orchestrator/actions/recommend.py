@@ -1,12 +1,13 @@
 """Recommendation action handler."""
 
 import logging
-import os
-from alm_orchestrator.actions.base import BaseAction
+from alm_orchestrator.actions.base import BaseAction, format_banner
 
 logger = logging.getLogger(__name__)
 
 LABEL_RECOMMEND = "ai-recommend"
+ALLOWED_ISSUE_TYPES = frozenset({"Bug", "Story"})
+BANNER_RECOMMENDATIONS = format_banner("RECOMMENDATIONS")
 
 
 class RecommendAction(BaseAction):
@@ -17,8 +18,8 @@ class RecommendAction(BaseAction):
         return LABEL_RECOMMEND
 
     @property
-    def allowed_issue_types(self) -> list[str]:
-        return ["Bug", "Story"]
+    def allowed_issue_types(self) -> frozenset[str]:
+        return ALLOWED_ISSUE_TYPES
 
     def execute(self, issue, jira_client, github_client, claude_executor) -> str:
         """Execute recommendation generation.
@@ -59,10 +60,8 @@ class RecommendAction(BaseAction):
             )
             investigation_section = ""
 
-        work_dir = github_client.clone_repo()
-
-        try:
-            template_path = os.path.join(self._prompts_dir, "recommend.md")
+        with github_client.workspace() as work_dir:
+            template_path = self.get_template_path()
             result = claude_executor.execute_with_template(
                 work_dir=work_dir,
                 template_path=template_path,
@@ -77,13 +76,12 @@ class RecommendAction(BaseAction):
             )
 
             # Format response with cost footer
-            header = "RECOMMENDATIONS"
             response = (
-                f"{header}\n{'=' * len(header)}\n\n{result.content}"
+                f"{BANNER_RECOMMENDATIONS}{result.content}"
                 f"\n\n---\n_Cost: ${result.cost_usd:.4f}_"
             )
 
-            # Validate and post
+            # Validate, post, and remove the label (even if blocked)
             posted = self._validate_and_post(
                 issue_key=issue_key,
                 response=response,
@@ -91,13 +89,7 @@ class RecommendAction(BaseAction):
                 jira_client=jira_client
             )
 
-            # Always remove the label to mark as processed (even if blocked)
-            jira_client.remove_label(issue_key, self.label)
-
             if posted:
                 return f"Recommendations complete for {issue_key}"
             else:
                 return f"Recommendations response blocked for {issue_key}"
-
-        finally:
-            github_client.cleanup(work_dir)
@@ -1,14 +1,21 @@
 """Security review action handler."""
 
 import logging
-import os
 
-from alm_orchestrator.actions.base import BaseAction
-from alm_orchestrator.utils.pr_extraction import find_pr_in_texts
+from alm_orchestrator.actions.base import (
+    BaseAction,
+    RESPONSE_BLOCKED_COMMENT,
+    format_banner,
+)
+from alm_orchestrator.utils.pr_extraction import extract_pr_number, find_pr_in_texts
 
 logger = logging.getLogger(__name__)
 
 LABEL_SECURITY_REVIEW = "ai-security-review"
+ALLOWED_ISSUE_TYPES = frozenset({"Bug", "Story"})
+BANNER_SECURITY_REVIEW = format_banner("SECURITY REVIEW")
+BANNER_SECURITY_REVIEW_COMPLETE = format_banner("SECURITY REVIEW COMPLETE")
+BANNER_SECURITY_REVIEW_FAILED = format_banner("SECURITY REVIEW FAILED")
 
 
 class SecurityReviewAction(BaseAction):
@@ -19,8 +26,12 @@ class SecurityReviewAction(BaseAction):
         return LABEL_SECURITY_REVIEW
 
     @property
-    def allowed_issue_types(self) -> list[str]:
-        return ["Bug", "Story"]
+    def template_name(self) -> str:
+        return "security_review"
+
+    @property
+    def allowed_issue_types(self) -> frozenset[str]:
+        return ALLOWED_ISSUE_TYPES
 
     def execute(self, issue, jira_client, github_client, claude_executor) -> str:
         """Execute security review on PR.
@@ -41,38 +52,32 @@ class SecurityReviewAction(BaseAction):
         if not self.validate_issue_type(issue, jira_client):
             return f"Rejected {issue_key}: invalid issue type"
 
-        # Fetch comments (sorted newest-first)
-        comments = jira_client.get_comments(issue_key)
-        comment_bodies = [c["body"] for c in comments]
-
-        # Search description first, then comments
-        pr_number = find_pr_in_texts(description, comment_bodies)
+        # Search description first; only fetch comments (newest-first) if needed
+        pr_number = extract_pr_number(description)
+        if not pr_number:
+            comments = jira_client.get_comments(issue_key)
+            pr_number = find_pr_in_texts("", [c["body"] for c in comments])
 
         if not pr_number:
-            header = "SECURITY REVIEW FAILED"
-            jira_client.add_comment(
+            jira_client.finish_action(
                 issue_key,
-                f"{header}\n"
-                f"{'=' * len(header)}\n\n"
+                f"{BANNER_SECURITY_REVIEW_FAILED}"
                 "Could not find PR number in issue description or comments. "
-                "Please include the PR URL or number."
+                "Please include the PR URL or number.",
             )
-            jira_client.remove_label(issue_key, self.label)
             return f"No PR found for {issue_key}"
 
         # Get PR info including head branch and changed files
         pr_info = github_client.get_pr_info(pr_number)
         changed_files = pr_info["changed_files"]
 
-        # Clone the PR's head branch to review the actual changes
-        work_dir = github_client.clone_repo(branch=pr_info["head_branch"])
-
-        try:
+        # Check out the PR's head to review the actual changes
+        with github_client.workspace(pr_number=pr_number) as work_dir:
             # Format changed files list for the prompt
             changed_files_text = "\n".join(f"- {f}" for f in changed_files)
 
             # Run Claude for security review (read-only tools)
-            template_path = os.path.join(self._prompts_dir, "security_review.md")
+            template_path = self.get_template_path()
             result = claude_executor.execute_with_template(
                 work_dir=work_dir,
                 template_path=template_path,
@@ -87,8 +92,7 @@ class SecurityReviewAction(BaseAction):
             )
 
             # Format the review response
-            header = "SECURITY REVIEW"
-            response = f"{header}\n{'=' * len(header)}\n\n{result.content}"
+            response = f"{BANNER_SECURITY_REVIEW}{result.content}"
 
             # Validate before posting
             validation = self._validator.validate(response, "security_review")
@@ -98,34 +102,20 @@ class SecurityReviewAction(BaseAction):
                 github_client.add_pr_comment(pr_number, response)
 
                 # Notify in Jira
-                complete_header = "SECURITY REVIEW COMPLETE"
                 jira_response = (
-                    f"{complete_header}\n"
-                    f"{'=' * len(complete_header)}\n\n"
+                    f"{BANNER_SECURITY_REVIEW_COMPLETE}"
                     f"Review posted to PR #{pr_number}"
                     f"\n\n---\n_Cost: ${result.cost_usd:.4f}_"
                 )
-                jira_client.add_comment(issue_key, jira_response)
+                jira_client.finish_action(issue_key, jira_response)
             else:
                 # Log warning (no sensitive content)
                 logger.warning(f"Suspicious response for {issue_key}: {validation.failure_reason}")
 
-                # Post generic warning to Jira
-                header = "AI RESPONSE BLOCKED"
-                jira_client.add_comment(
-                    issue_key,
-                    f"{header}\n{'=' * len(header)}\n\n"
-                    "The AI agent's response was flagged by automated security checks "
-                    "and has not been posted. Please review the issue manually."
-                )
-
-            # Always remove the label
-            jira_client.remove_label(issue_key, self.label)
+                # Post generic warning to Jira (label is always removed)
+                jira_client.finish_action(issue_key, RESPONSE_BLOCKED_COMMENT)
 
             if validation.is_valid:
                 return f"Security review complete for PR #{pr_number}"
             else:
                 return f"Security review response blocked for {issue_key}"
-
-        finally:
-            github_client.cleanup(work_dir)
@@ -2,17 +2,138 @@
 
 import json
 import logging
+import os
 import shutil
+import signal
 import subprocess
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from string import Template
+from typing import Callable, Dict, List, Optional, Tuple
 
-from alm_orchestrator.config import DEFAULT_CLAUDE_TIMEOUT_SECONDS
+from alm_orchestrator.config import DEFAULT_CLAUDE_TIMEOUT_SECONDS, DEFAULT_MAX_CONCURRENT_CLAUDE
 
 logger = logging.getLogger(__name__)
 
+CLAUDE_BINARY = "claude"
+LOG_RULE = "=" * 80
+LOG_TIMESTAMP_FORMAT = "%Y%m%d-%H%M%S"
+# Longest CLI error text carried in a ClaudeExecutorError, which gets logged
+MAX_ERROR_CHARS = 2000
+
+# Execution logs can be hundreds of KB; a single background writer keeps that
+# I/O off the worker threads. Its thread is joined at interpreter exit, so
+# queued logs are still written on shutdown.
+_log_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ccout-log")
+
+
+def _report_log_failure(future: Future) -> None:
+    """Surface errors from a background log write, which would otherwise be lost."""
+    error = future.exception()
+    if error is not None:
+        logger.warning(f"Failed to write Claude execution log: {error}")
+
+
+def _kill_process_group(proc: subprocess.Popen) -> None:
+    """SIGKILL a process and everything it spawned, if still running."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def _run_in_process_group(
+    cmd: List[str],
+    cwd: str,
+    timeout: float,
+    on_line: Optional[Callable[[bytes], None]] = None,
+    keep_stdout: bool = True,
+) -> subprocess.CompletedProcess:
+    """Run a command in its own session, killing the whole group on timeout.
+
+    subprocess.run(timeout=...) only kills the direct child; processes the
+    CLI spawned keep the output pipes open, so the call can overrun its
+    timeout by minutes. Killing the process group closes them immediately.
+
+    Stdout is read line by line as the process writes it, so callers can
+    act on streamed output before the command exits. Stderr is drained on a
+    helper thread so a chatty stderr can't block the child.
+
+    Args:
+        cmd: Command and arguments.
+        cwd: Working directory for the command.
+        timeout: Seconds to wait before killing the process group.
+        on_line: Optional callback invoked with each raw stdout line.
+        keep_stdout: If False, stdout lines are only passed to on_line and
+            the returned stdout is empty, so a long transcript isn't held
+            in memory.
+
+    Output is read as bytes and decoded once at the end, skipping the
+    universal-newline translation passes that text mode makes over the
+    whole (potentially multi-megabyte) output.
+
+    Returns:
+        CompletedProcess with text stdout and stderr.
+
+    Raises:
+        subprocess.TimeoutExpired: If the command did not finish in time.
+    """
+    stdout_lines: List[bytes] = []
+    stderr_parts: List[bytes] = []
+
+    with subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=True,
+    ) as proc:
+        timed_out = threading.Event()
+
+        def expire() -> None:
+            timed_out.set()
+            _kill_process_group(proc)
+
+        timer = threading.Timer(timeout, expire)
+        timer.daemon = True
+        drain = threading.Thread(
+            target=lambda: stderr_parts.append(proc.stderr.read()), daemon=True
+        )
+        timer.start()
+        drain.start()
+        try:
+            for line in proc.stdout:
+                if keep_stdout:
+                    stdout_lines.append(line)
+                if on_line is not None:
+                    on_line(line)
+            proc.wait()
+        except BaseException:
+            # Don't leave the CLI running if the callback fails
+            _kill_process_group(proc)
+            raise
+        finally:
+            timer.cancel()
+            drain.join()
+
+    stdout = b"".join(stdout_lines).decode("utf-8", errors="replace")
+    stderr = b"".join(stderr_parts).decode("utf-8", errors="replace")
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout, output=stdout, stderr=stderr)
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+
+def _parse_stream_event(line: bytes) -> Optional[dict]:
+    """Decode one stream-json line, or return None if it isn't a JSON object."""
+    try:
+        event = json.loads(line)
+    except ValueError:
+        return None
+    return event if isinstance(event, dict) else None
+
 
 class ClaudeExecutorError(Exception):
     """Raised when Claude Code execution fails."""
@@ -37,7 +158,8 @@ class ClaudeExecutor:
         prompts_dir: str,
         timeout_seconds: Optional[int] = None,
         log_output: bool = False,
-        logs_dir: str = "logs"
+        logs_dir: str = "logs",
+        max_concurrent: Optional[int] = None
     ):
         """Initialize the executor.
 
@@ -47,11 +169,28 @@ class ClaudeExecutor:
                            Defaults to 600 seconds (10 minutes).
             log_output: If True, log execution details to files.
             logs_dir: Directory for log files.
+            max_concurrent: Maximum Claude Code processes running at once
+                          across threads. Defaults to 2.
         """
         self._prompts_dir = Path(prompts_dir)
         self._timeout = timeout_seconds or DEFAULT_CLAUDE_TIMEOUT_SECONDS
         self._log_output = log_output
         self._logs_dir = Path(logs_dir)
+        # Prompt file path -> (mtime_ns, text) for templates and sandbox
+        # settings; edits are picked up without a restart
+        self._file_cache: Dict[str, Tuple[int, str]] = {}
+        # Resolve the CLI once rather than searching PATH on every spawn. The
+        # flags never vary, so the argv prefix is built once too; the prompt
+        # is the only per-call argument and goes last, after -p.
+        self._claude_path = shutil.which(CLAUDE_BINARY) or CLAUDE_BINARY
+        self._base_cmd: Tuple[str, ...] = (
+            self._claude_path, "--output-format", "stream-json", "--verbose", "-p",
+        )
+        # Each CLI process is memory-heavy; cap them independently of how
+        # many issues are being worked on in parallel
+        self._cli_slots = threading.BoundedSemaphore(
+            max_concurrent or DEFAULT_MAX_CONCURRENT_CLAUDE
+        )
 
     def _install_sandbox_settings(self, work_dir: str, action: str) -> None:
         """Install sandbox settings for an action to the working directory.
@@ -64,16 +203,19 @@ class ClaudeExecutor:
             FileNotFoundError: If the settings file doesn't exist.
         """
         settings_src = self._prompts_dir / f"{action}.json"
-        if not settings_src.exists():
+        try:
+            settings = self._read_prompt_file(str(settings_src))
+        except FileNotFoundError:
             raise FileNotFoundError(f"Sandbox settings not found: {settings_src}")
 
         # Create .claude directory if needed
         claude_dir = Path(work_dir) / ".claude"
         claude_dir.mkdir(exist_ok=True)
 
-        # Copy settings to settings.local.json (higher precedence than settings.json)
+        # Write settings to settings.local.json (higher precedence than settings.json).
+        # A private copy, not a link: Claude must not be able to edit the source.
         settings_dst = claude_dir / "settings.local.json"
-        shutil.copy(settings_src, settings_dst)
+        settings_dst.write_text(settings)
         logger.info(f"Installed sandbox settings for '{action}' to {settings_dst}")
 
     def execute(
@@ -85,6 +227,10 @@ class ClaudeExecutor:
     ) -> ClaudeResult:
         """Execute Claude Code with the given prompt in headless mode.
 
+        The CLI streams one JSON event per line (stream-json). Events are
+        parsed as they arrive rather than after the process exits, and the
+        final "result" event supplies the ClaudeResult.
+
         Args:
             work_dir: Working directory (the cloned repo).
             prompt: The prompt to send to Claude Code.
@@ -99,99 +245,91 @@ class ClaudeExecutor:
         """
         self._install_sandbox_settings(work_dir, action)
 
-        cmd = [
-            "claude",
-            "-p", prompt,
-            "--output-format", "json",
-        ]
+        cmd = [*self._base_cmd, prompt]
 
         logger.info(
             f"Executing Claude Code CLI in {work_dir} "
             f"(action={action}, timeout={self._timeout}s)"
         )
-        logger.info("Running command: claude -p <prompt> --output-format json")
-
-        start_time = time.monotonic()
-        try:
-            result = subprocess.run(
-                cmd,
-                cwd=work_dir,
-                capture_output=True,
-                text=True,
-                timeout=self._timeout,
-            )
-        except subprocess.TimeoutExpired as e:
-            raise ClaudeExecutorError(
-                f"Claude Code timed out after {self._timeout} seconds"
-            ) from e
-        finally:
-            elapsed = time.monotonic() - start_time
-            logger.info(f"Claude Code CLI completed in {elapsed:.1f}s")
-
-        # Optionally log execution details
-        if self._log_output and issue_key:
-            self._log_execution_details(
+        logger.info("Running command: claude --output-format stream-json --verbose -p <prompt>")
+
+        result_event: Optional[dict] = None
+        # The verbose transcript includes tool results and file contents;
+        # only the execution log needs it kept
+        log_run = self._log_output and bool(issue_key)
+
+        def handle_line(line: bytes) -> None:
+            nonlocal result_event
+            event = _parse_stream_event(line)
+            if event is None:
+                return
+            if event.get("type") == "result":
+                result_event = event
+
+        with self._cli_slots:
+            start_time = time.monotonic()
+            try:
+                result = _run_in_process_group(
+                    cmd,
+                    cwd=work_dir,
+                    timeout=self._timeout,
+                    on_line=handle_line,
+                    keep_stdout=log_run,
+                )
+            except subprocess.TimeoutExpired as e:
+                raise ClaudeExecutorError(
+                    f"Claude Code timed out after {self._timeout} seconds"
+                ) from e
+            finally:
+                elapsed = time.monotonic() - start_time
+                logger.info(f"Claude Code CLI completed in {elapsed:.1f}s")
+
+        # The result event was parsed while streaming; the log reuses it
+        data = result_event
+
+        # Optionally log execution details (written in the background)
+        if log_run:
+            future = _log_writer.submit(
+                self._log_execution_details,
                 issue_key=issue_key,
                 action=action,
                 prompt=prompt,
                 stdout=result.stdout,
                 stderr=result.stderr,
                 returncode=result.returncode,
-                elapsed=elapsed
+                elapsed=elapsed,
+                data=data,
             )
+            future.add_done_callback(_report_log_failure)
 
         if result.returncode != 0:
-            error_msg = result.stderr or result.stdout or "Unknown error"
-            raise ClaudeExecutorError(f"Claude Code failed: {error_msg}")
-
-        # Parse JSON output
-        try:
-            data = json.loads(result.stdout)
-
-            # Check for permission denials (potential prompt injection or missing permissions)
-            denials = data.get("permission_denials", [])
-            if denials:
-                denied_tools = [d.get("tool", "unknown") for d in denials]
-                logger.warning(
-                    f"Permission denials detected: {denied_tools}. "
-                    f"This may indicate prompt injection or insufficient permissions. "
-                    f"Details: {denials}"
-                )
-
-            # Extract cost from metadata if available, fallback to top-level
-            metadata = data.get("metadata", {})
-            cost_usd = metadata.get("cost_usd") or data.get("cost_usd", 0.0)
-
-            return ClaudeResult(
-                content=data.get("result", ""),
-                cost_usd=cost_usd,
-                duration_ms=data.get("duration_ms", 0),
-                session_id=data.get("session_id", ""),
-                permission_denials=denials,
-            )
-        except json.JSONDecodeError:
-            # Fall back to raw output if JSON parsing fails
-            return ClaudeResult(
-                content=result.stdout,
-                cost_usd=0.0,
-                duration_ms=0,
-                session_id="",
-                permission_denials=[],
+            error_msg = result.stderr or (data or {}).get("result") or "Unknown error"
+            raise ClaudeExecutorError(f"Claude Code failed: {error_msg[:MAX_ERROR_CHARS]}")
+
+        if data is None:
+            raise ClaudeExecutorError("Claude Code finished without a result event")
+
+        # Check for permission denials (potential prompt injection or missing permissions)
+        denials = data.get("permission_denials", [])
+        if denials:
+            denied_tools = [d.get("tool", "unknown") for d in denials]
+            logger.warning(
+                f"Permission denials detected: {denied_tools}. "
+                f"This may indicate prompt injection or insufficient permissions. "
+                f"Details: {denials}"
             )
 
-    @staticmethod
-    def _escape_format_string(value: str) -> str:
-        """Escape curly braces in user input to prevent format string injection.
-
-        Args:
-            value: The string value to escape.
+        # Extract cost from metadata if available, fallback to top-level
+        metadata = data.get("metadata", {})
+        cost_usd = metadata.get("cost_usd") or data.get("cost_usd", 0.0)
 
-        Returns:
-            String with { and } replaced by {{ and }}.
-        """
-        if not isinstance(value, str):
-            return value
-        return value.replace("{", "{{").replace("}", "}}")
+        return ClaudeResult(
+            content=data.get("result", ""),
+            cost_usd=cost_usd,
+            duration_ms=data.get("duration_ms", 0),
+            session_id=data.get("session_id", ""),
+            permission_denials=denials,
+        )
 
     def execute_with_template(
         self,
@@ -217,19 +355,39 @@ class ClaudeExecutor:
             ClaudeExecutorError: If execution fails.
             FileNotFoundError: If template doesn't exist.
         """
-        with open(template_path, "r") as f:
-            template = f.read()
-
-        # Escape curly braces in context values to prevent format string injection
-        # (SEC-001: user-controlled Jira content could contain {malicious} patterns)
-        safe_context = {
-            key: self._escape_format_string(value)
-            for key, value in context.items()
-        }
+        template = self._read_prompt_file(template_path)
 
-        prompt = template.format(**safe_context)
+        # ${name} placeholders are filled in a single pass and substituted
+        # values are never re-parsed, so user-controlled Jira content can't
+        # inject placeholders (SEC-001) and needs no escaping
+        prompt = Template(template).safe_substitute(context)
         return self.execute(work_dir, prompt, action, issue_key=issue_key)
 
+    def _read_prompt_file(self, path: str) -> str:
+        """Read a template or settings file, re-reading only when it changes.
+
+        A stat of the file is compared against the cached modification
+        time, so a warm cache costs one syscall and no reads.
+
+        Args:
+            path: Path to the file.
+
+        Returns:
+            The file text.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+        """
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._file_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(path, "r") as f:
+            text = f.read()
+        self._file_cache[path] = (mtime, text)
+        return text
+
     def _log_execution_details(
         self,
         issue_key: str,
@@ -238,7 +396,8 @@ class ClaudeExecutor:
         stdout: str,
         stderr: str,
         returncode: int,
-        elapsed: float
+        elapsed: float,
+        data: Optional[dict] = None
     ) -> None:
         """Log full execution details to a file.
 
@@ -250,60 +409,49 @@ class ClaudeExecutor:
             stderr: Standard error from Claude CLI.
             returncode: Process exit code.
             elapsed: Execution time in seconds.
+            data: Parsed JSON output from execute(), or None if not JSON.
         """
-        from datetime import datetime
-
         # Create logs directory if needed
         self._logs_dir.mkdir(parents=True, exist_ok=True)
 
         # Generate filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        timestamp = time.strftime(LOG_TIMESTAMP_FORMAT)
         log_file = self._logs_dir / f"ccout-{issue_key}-{timestamp}.txt"
 
-        # Try to extract Claude's response and cost from JSON
+        # Extract Claude's response and cost from the already-parsed JSON
         claude_response = None
         extracted_cost = None
-        try:
-            data = json.loads(stdout)
+        if data is not None:
             claude_response = data.get("result", "")
             # Extract cost from metadata or top-level
             metadata = data.get("metadata", {})
             extracted_cost = metadata.get("cost_usd") or data.get("cost_usd")
-        except (json.JSONDecodeError, AttributeError):
-            pass
 
-        # Write detailed log
+        # Assemble the whole log and write it in one call
+        parts = [
+            f"{LOG_RULE}\nCLAUDE CODE EXECUTION LOG\n{LOG_RULE}\n\n",
+            f"Issue Key: {issue_key}\n",
+            f"Action: {action}\n",
+            f"Timestamp: {timestamp}\n",
+            f"Duration: {elapsed:.2f}s\n",
+            f"Return Code: {returncode}\n",
+        ]
+        if extracted_cost is not None:
+            parts.append(f"Cost: ${extracted_cost:.4f}\n")
+        parts += [f"\n{LOG_RULE}\nPROMPT\n{LOG_RULE}\n", prompt]
+
+        # Add Claude's response section if available
+        if claude_response:
+            parts += [
+                f"\n\n{LOG_RULE}\nCLAUDE'S RESPONSE (extracted from JSON)\n{LOG_RULE}\n",
+                claude_response,
+            ]
+
+        parts += [
+            f"\n\n{LOG_RULE}\nSTDOUT (raw JSON output)\n{LOG_RULE}\n", stdout,
+            f"\n\n{LOG_RULE}\nSTDERR\n{LOG_RULE}\n", stderr, "\n",
+        ]
         with open(log_file, "w") as f:
-            f.write("=" * 80 + "\n")
-            f.write("CLAUDE CODE EXECUTION LOG\n")
-            f.write("=" * 80 + "\n\n")
-            f.write(f"Issue Key: {issue_key}\n")
-            f.write(f"Action: {action}\n")
-            f.write(f"Timestamp: {timestamp}\n")
-            f.write(f"Duration: {elapsed:.2f}s\n")
-            f.write(f"Return Code: {returncode}\n")
-            if extracted_cost is not None:
-                f.write(f"Cost: ${extracted_cost:.4f}\n")
-            f.write("\n" + "=" * 80 + "\n")
-            f.write("PROMPT\n")
-            f.write("=" * 80 + "\n")
-            f.write(prompt)
-
-            # Add Claude's response section if available
-            if claude_response:
-                f.write("\n\n" + "=" * 80 + "\n")
-                f.write("CLAUDE'S RESPONSE (extracted from JSON)\n")
-                f.write("=" * 80 + "\n")
-                f.write(claude_response)
-
-            f.write("\n\n" + "=" * 80 + "\n")
-            f.write("STDOUT (raw JSON output)\n")
-            f.write("=" * 80 + "\n")
-            f.write(stdout)
-            f.write("\n\n" + "=" * 80 + "\n")
-            f.write("STDERR\n")
-            f.write("=" * 80 + "\n")
-            f.write(stderr)
-            f.write("\n")
+            f.write("".join(parts))
 
         logger.info(f"Claude execution log written to: {log_file}")
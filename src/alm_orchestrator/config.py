@@ -13,6 +13,13 @@ class ConfigError(Exception):
 # Default values
 DEFAULT_POLL_INTERVAL_SECONDS = 30
 DEFAULT_CLAUDE_TIMEOUT_SECONDS = 600  # 10 minutes
+DEFAULT_MAX_CONCURRENT_ISSUES = 2
+DEFAULT_MAX_CONCURRENT_CLAUDE = 2
+# Jira Cloud rate limits are per account; staying under them avoids 429
+# backoff storms when several issues are processed at once
+DEFAULT_JIRA_REQUESTS_PER_SECOND = 5.0
+DEFAULT_JIRA_REQUEST_BURST = 10
+DEFAULT_CACHE_DIR = "~/.cache/alm-orchestrator"
 DEFAULT_ATLASSIAN_TOKEN_URL = "https://auth.atlassian.com/oauth/token"
 DEFAULT_ATLASSIAN_RESOURCES_URL = "https://api.atlassian.com/oauth/token/accessible-resources"
 DEFAULT_ATLASSIAN_API_URL_PATTERN = "https://api.atlassian.com/ex/jira/{cloud_id}"
@@ -31,11 +38,16 @@ class Config:
     jira_client_secret: str
     poll_interval_seconds: int = DEFAULT_POLL_INTERVAL_SECONDS
     claude_timeout_seconds: int = DEFAULT_CLAUDE_TIMEOUT_SECONDS
+    max_concurrent_issues: int = DEFAULT_MAX_CONCURRENT_ISSUES
+    max_concurrent_claude: int = DEFAULT_MAX_CONCURRENT_CLAUDE
+    jira_requests_per_second: float = DEFAULT_JIRA_REQUESTS_PER_SECOND
+    jira_request_burst: int = DEFAULT_JIRA_REQUEST_BURST
     anthropic_api_key: Optional[str] = None
     atlassian_token_url: str = DEFAULT_ATLASSIAN_TOKEN_URL
     atlassian_resources_url: str = DEFAULT_ATLASSIAN_RESOURCES_URL
     atlassian_api_url_pattern: str = DEFAULT_ATLASSIAN_API_URL_PATTERN
     github_clone_url_pattern: str = DEFAULT_GITHUB_CLONE_URL_PATTERN
+    cache_dir: str = DEFAULT_CACHE_DIR
 
     @property
     def github_owner(self) -> str:
@@ -79,6 +91,38 @@ class Config:
         except ValueError:
             raise ConfigError(f"CLAUDE_TIMEOUT_SECONDS must be an integer, got: {claude_timeout}")
 
+        max_concurrent = os.getenv("MAX_CONCURRENT_ISSUES", str(DEFAULT_MAX_CONCURRENT_ISSUES))
+        try:
+            max_concurrent_int = int(max_concurrent)
+        except ValueError:
+            raise ConfigError(f"MAX_CONCURRENT_ISSUES must be an integer, got: {max_concurrent}")
+        if max_concurrent_int < 1:
+            raise ConfigError(f"MAX_CONCURRENT_ISSUES must be at least 1, got: {max_concurrent_int}")
+
+        max_claude = os.getenv("MAX_CONCURRENT_CLAUDE", str(DEFAULT_MAX_CONCURRENT_CLAUDE))
+        try:
+            max_claude_int = int(max_claude)
+        except ValueError:
+            raise ConfigError(f"MAX_CONCURRENT_CLAUDE must be an integer, got: {max_claude}")
+        if max_claude_int < 1:
+            raise ConfigError(f"MAX_CONCURRENT_CLAUDE must be at least 1, got: {max_claude_int}")
+
+        jira_rate = os.getenv("JIRA_REQUESTS_PER_SECOND", str(DEFAULT_JIRA_REQUESTS_PER_SECOND))
+        try:
+            jira_rate_float = float(jira_rate)
+        except ValueError:
+            raise ConfigError(f"JIRA_REQUESTS_PER_SECOND must be a number, got: {jira_rate}")
+        if jira_rate_float <= 0:
+            raise ConfigError(f"JIRA_REQUESTS_PER_SECOND must be positive, got: {jira_rate_float}")
+
+        jira_burst = os.getenv("JIRA_REQUEST_BURST", str(DEFAULT_JIRA_REQUEST_BURST))
+        try:
+            jira_burst_int = int(jira_burst)
+        except ValueError:
+            raise ConfigError(f"JIRA_REQUEST_BURST must be an integer, got: {jira_burst}")
+        if jira_burst_int < 1:
+            raise ConfigError(f"JIRA_REQUEST_BURST must be at least 1, got: {jira_burst_int}")
+
         return cls(
             jira_url=os.environ["JIRA_URL"],
             jira_project_key=os.environ["JIRA_PROJECT_KEY"],
@@ -88,6 +132,10 @@ class Config:
             github_repo=os.environ["GITHUB_REPO"],
             poll_interval_seconds=poll_interval_int,
             claude_timeout_seconds=claude_timeout_int,
+            max_concurrent_issues=max_concurrent_int,
+            max_concurrent_claude=max_claude_int,
+            jira_requests_per_second=jira_rate_float,
+            jira_request_burst=jira_burst_int,
             anthropic_api_key=os.getenv("ANTHROPIC_API_KEY"),
             atlassian_token_url=os.getenv(
                 "ATLASSIAN_TOKEN_URL",
@@ -105,4 +153,5 @@ class Config:
                 "GITHUB_CLONE_URL_PATTERN",
                 DEFAULT_GITHUB_CLONE_URL_PATTERN
             ),
+            cache_dir=os.getenv("CACHE_DIR", DEFAULT_CACHE_DIR),
         )
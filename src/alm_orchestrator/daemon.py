@@ -2,7 +2,10 @@
 
 import logging
 import signal
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from jira import Issue
 
 from alm_orchestrator.config import Config
 from alm_orchestrator.jira_client import JiraClient
@@ -14,6 +17,9 @@ from alm_orchestrator.router import discover_actions
 
 logger = logging.getLogger(__name__)
 
+# Idle polls back off exponentially up to this multiple of the poll interval
+MAX_IDLE_BACKOFF_MULTIPLIER = 10
+
 
 class Daemon:
     """Long-running daemon that polls Jira and processes AI labels."""
@@ -29,6 +35,10 @@ class Daemon:
         self._config = config
         self._prompts_dir = prompts_dir
         self._running = False
+        # Set by stop() so an idle wait between polls ends immediately
+        self._wakeup = threading.Event()
+        # Issues returned by the latest poll; run() backs off only when zero
+        self._last_poll_issue_count = 0
         self._log_claude_output = log_claude_output
 
         # Initialize clients
@@ -37,7 +47,8 @@ class Daemon:
         self._claude = ClaudeExecutor(
             prompts_dir=prompts_dir,
             timeout_seconds=config.claude_timeout_seconds,
-            log_output=self._log_claude_output
+            log_output=self._log_claude_output,
+            max_concurrent=config.max_concurrent_claude,
         )
 
         # Initialize output validator
@@ -59,55 +70,123 @@ class Daemon:
     def stop(self) -> None:
         """Stop the daemon."""
         self._running = False
+        self._wakeup.set()
 
     def poll_once(self) -> int:
         """Execute a single poll cycle.
 
+        Issues are processed concurrently, up to max_concurrent_issues at a
+        time, and results are collected as each issue finishes. Labels on the
+        same issue are still handled one after another. An unexpected error
+        on one issue is logged without discarding the others' results.
+
         Returns:
             Number of issues processed.
         """
         issues = self._jira.fetch_issues_with_ai_labels()
+        self._last_poll_issue_count = len(issues)
         logger.info(f"Found {len(issues)} issue(s) with AI labels")
+        if not issues:
+            return 0
+
+        self._github.begin_poll_cycle()
+
+        max_workers = min(self._config.max_concurrent_issues, len(issues))
         processed = 0
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="issue") as executor:
+                futures = {executor.submit(self._process_issue, issue): issue for issue in issues}
+                for future in as_completed(futures):
+                    try:
+                        processed += future.result()
+                    except Exception as e:
+                        logger.error(f"Error processing {futures[future].key}: {e}")
+        finally:
+            self._github.end_poll_cycle()
+        return processed
 
-        for issue in issues:
-            ai_labels = self._jira.get_ai_labels(issue)
+    def _process_issue(self, issue: Issue) -> int:
+        """Run every routable AI label on a single issue.
 
-            for label in ai_labels:
-                if self._router.has_action(label):
-                    # Remove original label and mark as processing to prevent duplicate pickup
-                    self._jira.remove_label(issue.key, label)
-                    self._jira.add_label(issue.key, JiraClient.PROCESSING_LABEL)
+        Args:
+            issue: Jira issue to process.
 
+        Returns:
+            Number of actions that completed successfully.
+        """
+        processed = 0
+        ai_labels = self._jira.get_ai_labels(issue)
+
+        for label in ai_labels:
+            if self._router.has_action(label):
+                # Swap the original label for the processing label in one edit
+                # to prevent duplicate pickup
+                self._jira.update_labels(
+                    issue.key, add=[JiraClient.PROCESSING_LABEL], remove=[label]
+                )
+
+                # Set once an edit has removed the processing label: the
+                # action's final comment on success, the error comment on
+                # failure (fail fast, one edit)
+                label_removed = False
+                try:
+                    logger.info(f"Processing {issue.key} with action: {label}")
+                    action = self._router.get_action(label)
+                    result = action.execute(
+                        issue=issue,
+                        jira_client=self._jira,
+                        github_client=self._github,
+                        claude_executor=self._claude,
+                    )
+                    label_removed = True
+                    logger.info(f"Completed: {result}")
+                    processed += 1
+                except Exception as e:
+                    logger.error(f"Error processing {issue.key}/{label}: {e}")
+                    header = "ACTION FAILED"
+                    failure_comment = (
+                        f"{header}\n{'=' * len(header)}\n\nLabel: {label}\n\nCheck logs for details."
+                    )
                     try:
-                        logger.info(f"Processing {issue.key} with action: {label}")
-                        action = self._router.get_action(label)
-                        result = action.execute(
-                            issue=issue,
-                            jira_client=self._jira,
-                            github_client=self._github,
-                            claude_executor=self._claude,
+                        self._jira.finish_action(issue.key, failure_comment)
+                        label_removed = True
+                    except Exception as post_error:
+                        logger.error(
+                            f"Failed to post failure comment on {issue.key}: {post_error}"
                         )
-                        logger.info(f"Completed: {result}")
-                        processed += 1
-                    except Exception as e:
-                        logger.error(f"Error processing {issue.key}/{label}: {e}")
-                        # Post error to Jira as comment (fail fast)
-                        header = "ACTION FAILED"
-                        self._jira.add_comment(
-                            issue.key,
-                            f"{header}\n{'=' * len(header)}\n\nLabel: {label}\n\nCheck logs for details."
-                        )
-                    finally:
-                        # Always remove processing label
+                finally:
+                    # Also runs on KeyboardInterrupt/SystemExit, so the issue
+                    # is never left stuck in processing
+                    if not label_removed:
                         self._jira.remove_label(issue.key, JiraClient.PROCESSING_LABEL)
 
         return processed
 
+    def _next_poll_delay(self, idle_cycles: int) -> int:
+        """Seconds to wait before the next poll.
+
+        Args:
+            idle_cycles: Number of consecutive polls that found no issues.
+
+        Returns:
+            The poll interval doubled per idle cycle, capped at
+            MAX_IDLE_BACKOFF_MULTIPLIER times the configured interval.
+        """
+        base = self._config.poll_interval_seconds
+        multiplier = min(2 ** idle_cycles, MAX_IDLE_BACKOFF_MULTIPLIER)
+        return base * multiplier
+
     def run(self) -> None:
-        """Run the daemon loop."""
+        """Run the daemon loop.
+
+        Polls at the configured interval while there is work and backs off
+        while the board is idle. A poll that found issues counts as work even
+        if every action failed, so failing issues are retried promptly.
+        """
         self._running = True
+        self._wakeup.clear()
         poll_interval = self._config.poll_interval_seconds
+        idle_cycles = 0
 
         logger.info(f"Starting daemon, polling every {poll_interval} seconds")
 
@@ -116,13 +195,19 @@ class Daemon:
                 processed = self.poll_once()
                 if processed > 0:
                     logger.info(f"Processed {processed} issue(s)")
+                if self._last_poll_issue_count > 0:
+                    idle_cycles = 0
+                elif 2 ** idle_cycles < MAX_IDLE_BACKOFF_MULTIPLIER:
+                    # Stop counting once the backoff has reached its cap
+                    idle_cycles += 1
             except Exception as e:
                 logger.error(f"Error in poll cycle: {e}")
 
-            # Sleep in small increments to allow for quick shutdown
-            for _ in range(poll_interval):
-                if not self._running:
-                    break
-                time.sleep(1)
+            delay = self._next_poll_delay(idle_cycles)
+            if delay != poll_interval:
+                logger.debug(f"No work found, next poll in {delay} seconds")
+
+            # stop() sets the event, so shutdown doesn't wait out the delay
+            self._wakeup.wait(delay)
 
         logger.info("Daemon stopped")
@@ -1,20 +1,61 @@
 """GitHub API client for the ALM Orchestrator."""
 
+import base64
+import fcntl
+import json
 import logging
+import os
 import shutil
 import subprocess
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
-from github import Github
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import urlencode, urlsplit, urlunsplit
+from github import Github, GithubException
+from requests.adapters import DEFAULT_POOLSIZE
 from alm_orchestrator.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Deletes renamed-away work directories so cleanup() returns immediately
+_trash_remover = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cleanup")
+
 
 # Git/GitHub constants
 DEFAULT_BRANCH = "main"
 CLONE_DEPTH = 1
 TEMP_DIR_PREFIX = "alm-orchestrator-"
+MIRRORS_SUBDIR = "mirrors"
+PARTIAL_MIRROR_SUFFIX = ".partial"
+ETAG_CACHE_FILENAME = "gh-etags.json"
+# Cached responses kept on disk; least recently used entries are evicted
+ETAG_CACHE_MAX_ENTRIES = 256
+PR_FILES_PAGE_SIZE = 100
+TRASH_SUFFIX = ".trash"
+PR_HEAD_REF = "refs/pull/{number}/head"
+COMMIT_AND_PUSH_SCRIPT = 'git add -A && git commit -m "$1" && git push -u origin "$2"'
+
+# Everything get_pr_info() needs in one GraphQL round trip per 100 files
+PR_INFO_QUERY = """
+query($owner: String!, $name: String!, $number: Int!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      title
+      body
+      headRefName
+      baseRefName
+      files(first: 100, after: $cursor) {
+        nodes { path }
+        pageInfo { hasNextPage endCursor }
+      }
+    }
+  }
+}
+"""
 
 
 def generate_branch_name(prefix: str, issue_key: str) -> str:
@@ -41,8 +82,32 @@ class GitHubClient:
             config: Application configuration containing GitHub credentials.
         """
         self._config = config
-        self._github = Github(config.github_token)
+        # PyGithub keeps one keep-alive session. Size its pool so every
+        # concurrent worker can hold a connection instead of discarding
+        # and re-handshaking when the default pool overflows.
+        self._github = Github(
+            config.github_token,
+            pool_size=max(config.max_concurrent_issues, DEFAULT_POOLSIZE),
+        )
         self._repo = self._github.get_repo(config.github_repo)
+        self._mirror_dir = os.path.join(
+            os.path.expanduser(config.cache_dir),
+            MIRRORS_SUBDIR,
+            f"{config.github_owner}-{config.github_repo_name}.git",
+        )
+        # Serializes fetches and worktree bookkeeping on the shared mirror
+        self._mirror_lock = threading.Lock()
+        self._mirror_ready = False
+        # Refs already fetched into the mirror during this poll cycle
+        self._fetched_refs: set = set()
+        # Conditional-request cache: request key -> {"etag": ..., "data": ...},
+        # least recently used first. Saved once per poll cycle if it changed.
+        self._etag_cache_path = os.path.join(
+            os.path.expanduser(config.cache_dir), ETAG_CACHE_FILENAME
+        )
+        self._etag_cache: "OrderedDict[str, dict]" = self._load_etag_cache()
+        self._etag_cache_dirty = False
+        self._etag_lock = threading.Lock()
 
     def get_authenticated_clone_url(self) -> str:
         """Get clone URL with embedded auth token.
@@ -55,30 +120,198 @@ class GitHubClient:
             repo=self._config.github_repo
         )
 
-    def clone_repo(self, branch: str = DEFAULT_BRANCH) -> str:
-        """Clone the repository to a temporary directory.
+    def get_clone_url(self) -> str:
+        """Get the clone URL without credentials.
+
+        This is what the persistent mirror records as its remote, so the
+        token never lands in a git config that worktrees can read.
+
+        Returns:
+            HTTPS clone URL with any userinfo removed.
+        """
+        parts = urlsplit(self.get_authenticated_clone_url())
+        netloc = parts.netloc.rpartition("@")[2]
+        return urlunsplit(parts._replace(netloc=netloc))
+
+    def _git_auth_env(self) -> Dict[str, str]:
+        """Environment that authenticates git's HTTPS requests to GitHub.
+
+        The token is sent as an extra header configured through the
+        environment, so it appears in neither argv nor any git config file.
+        """
+        credentials = base64.b64encode(
+            f"x-access-token:{self._config.github_token}".encode()
+        ).decode()
+        return {
+            **os.environ,
+            "GIT_CONFIG_COUNT": "1",
+            "GIT_CONFIG_KEY_0": "http.extraheader",
+            "GIT_CONFIG_VALUE_0": f"Authorization: Basic {credentials}",
+        }
+
+    def clone_repo(
+        self, branch: str = DEFAULT_BRANCH, pr_number: Optional[int] = None
+    ) -> str:
+        """Check out the repository into a temporary directory.
+
+        Uses a blobless bare mirror under the cache directory, created on
+        first use. The tip of the requested ref is fetched at most once
+        per poll cycle, and each call gets its own detached worktree, so
+        repeated actions don't re-download the repository.
 
         Args:
-            branch: Branch to clone. Defaults to DEFAULT_BRANCH.
+            branch: Branch to check out. Defaults to DEFAULT_BRANCH.
+            pr_number: If given, check out the head of this PR instead of
+                a branch. GitHub's pull/<N>/head ref also covers PRs opened
+                from forks, whose head branch is not in this repository.
 
         Returns:
-            Path to the cloned repository working directory.
+            Path to the working directory.
 
         Raises:
-            subprocess.CalledProcessError: If git clone fails.
+            subprocess.CalledProcessError: If a git command fails.
         """
         work_dir = tempfile.mkdtemp(prefix=TEMP_DIR_PREFIX)
-        clone_url = self.get_authenticated_clone_url()
+        if pr_number is None:
+            source_ref = f"refs/heads/{branch}"
+            remote_ref = f"refs/remotes/origin/{branch}"
+            target = f"branch: {branch}"
+        else:
+            source_ref = remote_ref = PR_HEAD_REF.format(number=pr_number)
+            target = f"PR #{pr_number}"
+
+        logger.info(f"Checking out {self._config.github_repo} ({target}) to {work_dir}")
+        with self._locked_mirror():
+            self._ensure_mirror()
+            if source_ref not in self._fetched_refs:
+                self._git_mirror(
+                    "fetch", "--depth", str(CLONE_DEPTH), "--filter=blob:none",
+                    "--no-tags", "origin", f"+{source_ref}:{remote_ref}",
+                )
+                self._fetched_refs.add(source_ref)
+            self._git_mirror("worktree", "add", "--detach", work_dir, remote_ref)
+        logger.info(f"Checkout completed: {work_dir}")
 
-        logger.info(f"Cloning {self._config.github_repo} (branch: {branch}) to {work_dir}")
-        subprocess.run(
-            ["git", "clone", "--depth", str(CLONE_DEPTH), "--branch", branch, clone_url, work_dir],
-            check=True,
+        return work_dir
+
+    @contextmanager
+    def workspace(
+        self, branch: str = DEFAULT_BRANCH, pr_number: Optional[int] = None
+    ) -> Iterator[str]:
+        """Check out the repository for the duration of a with block.
+
+        Pairs clone_repo() with cleanup(), so the working directory is
+        removed even when the block raises.
+
+        Args:
+            branch: Branch to check out. Defaults to DEFAULT_BRANCH.
+            pr_number: If given, check out the head of this PR instead.
+
+        Yields:
+            Path to the working directory.
+        """
+        work_dir = self.clone_repo(branch=branch, pr_number=pr_number)
+        try:
+            yield work_dir
+        finally:
+            self.cleanup(work_dir)
+
+    def begin_poll_cycle(self) -> None:
+        """Forget which refs were fetched, so the next checkout refetches.
+
+        Called by the daemon at the start of each poll cycle. Actions within
+        one cycle share a single fetch per branch or PR.
+        """
+        with self._mirror_lock:
+            self._fetched_refs.clear()
+
+    def end_poll_cycle(self) -> None:
+        """Persist the ETag cache if this cycle changed it.
+
+        Called by the daemon once all of a cycle's actions have finished.
+        """
+        with self._etag_lock:
+            if self._etag_cache_dirty:
+                self._save_etag_cache()
+                self._etag_cache_dirty = False
+
+    @contextmanager
+    def _locked_mirror(self) -> Iterator[None]:
+        """Hold the mirror lock for this process and for other daemons.
+
+        The thread lock serializes workers in this process; an exclusive
+        flock on a sibling lockfile keeps concurrent daemons sharing the same
+        cache directory from fetching or pruning the mirror at the same time.
+        """
+        with self._mirror_lock:
+            os.makedirs(os.path.dirname(self._mirror_dir), mode=0o700, exist_ok=True)
+            with open(f"{self._mirror_dir}.lock", "w") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _ensure_mirror(self) -> None:
+        """Create the bare mirror if needed and point it at a tokenless URL.
+
+        The mirror is cloned next to its final path and renamed into place,
+        so an interrupted clone is never mistaken for a mirror. An existing
+        mirror git can't open is discarded and cloned again.
+
+        Must be called inside _locked_mirror().
+        """
+        if self._mirror_ready:
+            return
+
+        clone_url = self.get_clone_url()
+        if os.path.isdir(self._mirror_dir) and self._mirror_is_valid():
+            # Also scrubs a token that older versions stored in the remote
+            self._git_mirror("remote", "set-url", "origin", clone_url)
+        else:
+            logger.info(f"Creating repository mirror: {self._mirror_dir}")
+            shutil.rmtree(self._mirror_dir, ignore_errors=True)
+            partial_dir = f"{self._mirror_dir}{PARTIAL_MIRROR_SUFFIX}"
+            shutil.rmtree(partial_dir, ignore_errors=True)
+            os.makedirs(partial_dir, mode=0o700)
+            subprocess.run(
+                [
+                    "git", "clone", "--bare", "--filter=blob:none", "--no-tags",
+                    "--depth", str(CLONE_DEPTH), "--branch", DEFAULT_BRANCH,
+                    clone_url, partial_dir,
+                ],
+                check=True,
+                capture_output=True,
+                env=self._git_auth_env(),
+            )
+            os.rename(partial_dir, self._mirror_dir)
+        self._mirror_ready = True
+
+    def _mirror_is_valid(self) -> bool:
+        """Return True if git can open the mirror as a bare repository."""
+        result = subprocess.run(
+            # --git-dir, so a broken mirror can't resolve to an enclosing repo
+            ["git", "--git-dir", self._mirror_dir, "rev-parse", "--is-bare-repository"],
             capture_output=True,
         )
-        logger.info(f"Clone completed: {work_dir}")
+        if result.returncode != 0:
+            logger.warning(f"Discarding unusable repository mirror: {self._mirror_dir}")
+            return False
+        return True
 
-        return work_dir
+    def _git_mirror(self, *args: str, check: bool = True) -> None:
+        """Run a git command against the shared mirror.
+
+        Args:
+            *args: Git subcommand and arguments.
+            check: Raise if the command fails.
+        """
+        subprocess.run(
+            ["git", "-C", self._mirror_dir, *args],
+            check=check,
+            capture_output=True,
+            env=self._git_auth_env(),
+        )
 
     def create_branch(self, work_dir: str, branch_name: str) -> None:
         """Create and checkout a new branch.
@@ -113,39 +346,55 @@ class GitHubClient:
         Raises:
             subprocess.CalledProcessError: If any git command fails.
         """
-        logger.info(f"Staging all changes")
+        logger.info(f"Committing and pushing {branch} for {issue_key}")
+        # One shell runs the whole chain, so the three git steps cost a single
+        # fork from this process. Message and branch are passed as positional
+        # arguments, never interpolated into the script.
         subprocess.run(
-            ["git", "add", "-A"],
-            cwd=work_dir,
-            check=True,
-            capture_output=True,
-        )
-
-        logger.info(f"Committing changes for {issue_key}")
-        subprocess.run(
-            ["git", "commit", "-m", message],
-            cwd=work_dir,
-            check=True,
-            capture_output=True,
-        )
-
-        logger.info(f"Pushing branch: {branch}")
-        subprocess.run(
-            ["git", "push", "-u", "origin", branch],
+            ["sh", "-c", COMMIT_AND_PUSH_SCRIPT, "sh", message, branch],
             cwd=work_dir,
             check=True,
             capture_output=True,
+            env=self._git_auth_env(),
         )
         logger.info(f"Push completed: {branch}")
 
     def cleanup(self, work_dir: str) -> None:
         """Remove the temporary working directory.
 
+        The directory is renamed out of the way and deleted on a background
+        thread, so large checkouts don't hold up the worker. When a mirror
+        exists, also prunes the worktree record and deletes any local branch
+        the action created, so the mirror doesn't accumulate refs.
+
         Args:
             work_dir: Path to remove.
         """
         logger.info(f"Cleaning up work directory: {work_dir}")
-        shutil.rmtree(work_dir, ignore_errors=True)
+        has_mirror = os.path.isdir(self._mirror_dir)
+        local_branch = self._get_checked_out_branch(work_dir) if has_mirror else None
+
+        trash_dir = f"{work_dir}{TRASH_SUFFIX}"
+        try:
+            os.rename(work_dir, trash_dir)
+        except OSError:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        else:
+            _trash_remover.submit(shutil.rmtree, trash_dir, ignore_errors=True)
+        if has_mirror:
+            with self._locked_mirror():
+                self._git_mirror("worktree", "prune", check=False)
+                if local_branch:
+                    self._git_mirror("branch", "-D", local_branch, check=False)
+
+    def _get_checked_out_branch(self, work_dir: str) -> Optional[str]:
+        """Return the branch checked out in a worktree, or None if detached."""
+        result = subprocess.run(
+            ["git", "-C", work_dir, "symbolic-ref", "--short", "-q", "HEAD"],
+            capture_output=True,
+            text=True,
+        )
+        return result.stdout.strip() or None
 
     def create_pull_request(
         self,
@@ -189,6 +438,9 @@ class GitHubClient:
     def get_pr_info(self, pr_number: int) -> dict:
         """Get PR information including head branch, changed files, and description.
 
+        Uses a single GraphQL query, falling back to conditional REST
+        requests if GraphQL fails.
+
         Args:
             pr_number: The PR number.
 
@@ -196,16 +448,161 @@ class GitHubClient:
             Dict with keys: head_branch, base_branch, changed_files, title, body.
         """
         logger.info(f"Getting PR info for #{pr_number}")
-        pr = self._repo.get_pull(pr_number)
-        changed_files = [f.filename for f in pr.get_files()]
+        try:
+            return self.get_pr_info_graphql(pr_number)
+        except GithubException as e:
+            logger.warning(f"GraphQL PR lookup failed ({e.status}), falling back to REST")
+            return self._get_pr_info_rest(pr_number)
+
+    def get_pr_info_graphql(self, pr_number: int) -> dict:
+        """Get PR information with the GraphQL API.
+
+        Args:
+            pr_number: The PR number.
+
+        Returns:
+            Same dict shape as get_pr_info().
+
+        Raises:
+            GithubException: If the query fails.
+        """
+        variables = {
+            "owner": self._config.github_owner,
+            "name": self._config.github_repo_name,
+            "number": pr_number,
+            "cursor": None,
+        }
+        changed_files = []
+        while True:
+            _, response = self._github.requester.graphql_query(PR_INFO_QUERY, variables)
+            pr = response["data"]["repository"]["pullRequest"]
+            files = pr["files"]
+            changed_files.extend(node["path"] for node in files["nodes"])
+            if not files["pageInfo"]["hasNextPage"]:
+                break
+            variables["cursor"] = files["pageInfo"]["endCursor"]
+
         return {
-            "head_branch": pr.head.ref,
-            "base_branch": pr.base.ref,
+            "head_branch": pr["headRefName"],
+            "base_branch": pr["baseRefName"],
             "changed_files": changed_files,
-            "title": pr.title,
-            "body": pr.body or "",
+            "title": pr["title"],
+            "body": pr["body"] or "",
         }
 
+    def _get_pr_info_rest(self, pr_number: int) -> dict:
+        """Get PR information with conditional REST requests.
+
+        An unchanged PR costs only 304s, which don't count against the
+        rate limit.
+
+        Args:
+            pr_number: The PR number.
+
+        Returns:
+            Same dict shape as get_pr_info().
+        """
+        pr_url = f"{self._repo.url}/pulls/{pr_number}"
+        pr = self._conditional_get(pr_url)
+
+        changed_files = []
+        page = 1
+        while True:
+            files = self._conditional_get(
+                f"{pr_url}/files", {"per_page": PR_FILES_PAGE_SIZE, "page": page}
+            )
+            changed_files.extend(f["filename"] for f in files)
+            if len(files) < PR_FILES_PAGE_SIZE:
+                break
+            page += 1
+
+        return {
+            "head_branch": pr["head"]["ref"],
+            "base_branch": pr["base"]["ref"],
+            "changed_files": changed_files,
+            "title": pr["title"],
+            "body": pr["body"] or "",
+        }
+
+    def _conditional_get(self, url: str, parameters: Optional[dict] = None) -> Any:
+        """GET a REST resource, revalidating any cached copy with its ETag.
+
+        Args:
+            url: API URL of the resource.
+            parameters: Optional query parameters.
+
+        Returns:
+            The decoded JSON response, or the cached copy on 304 Not Modified.
+
+        Raises:
+            GithubException: If GitHub returns an error status.
+        """
+        key = f"{url}?{urlencode(sorted(parameters.items()))}" if parameters else url
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+            if cached is not None:
+                self._etag_cache.move_to_end(key)
+        headers = {"If-None-Match": cached["etag"]} if cached else None
+
+        status, response_headers, body = self._github.requester.requestJson(
+            "GET", url, parameters=parameters, headers=headers
+        )
+        if status == 304:
+            if cached is not None:
+                logger.debug(f"Not modified: {key}")
+                return cached["data"]
+            # Nothing to revalidate against; ask again for the full body
+            status, response_headers, body = self._github.requester.requestJson(
+                "GET", url, parameters=parameters
+            )
+        if status >= 400 or status == 304:
+            raise GithubException(status, body, response_headers)
+
+        data = json.loads(body)
+        etag = response_headers.get("etag")
+        if etag and (cached is None or cached["etag"] != etag):
+            with self._etag_lock:
+                self._etag_cache[key] = {"etag": etag, "data": data}
+                self._etag_cache.move_to_end(key)
+                while len(self._etag_cache) > ETAG_CACHE_MAX_ENTRIES:
+                    self._etag_cache.popitem(last=False)
+                self._etag_cache_dirty = True
+        return data
+
+    def _load_etag_cache(self) -> "OrderedDict[str, dict]":
+        """Load the persisted ETag cache, or start empty if unreadable.
+
+        Malformed entries are dropped, and only the newest
+        ETAG_CACHE_MAX_ENTRIES are kept.
+        """
+        try:
+            with open(self._etag_cache_path, "r") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return OrderedDict()
+        if not isinstance(entries, dict):
+            return OrderedDict()
+        cache = OrderedDict(
+            (key, entry) for key, entry in entries.items()
+            if isinstance(entry, dict) and entry.get("etag") and "data" in entry
+        )
+        while len(cache) > ETAG_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+        return cache
+
+    def _save_etag_cache(self) -> None:
+        """Persist the ETag cache. Must be called with the ETag lock held."""
+        try:
+            os.makedirs(os.path.dirname(self._etag_cache_path), mode=0o700, exist_ok=True)
+            tmp_path = f"{self._etag_cache_path}.tmp"
+            # Encode in one C-accelerated call; json.dump streams many small writes
+            payload = json.dumps(self._etag_cache, separators=(",", ":"))
+            with open(tmp_path, "w") as f:
+                f.write(payload)
+            os.replace(tmp_path, self._etag_cache_path)
+        except OSError as e:
+            logger.warning(f"Could not save ETag cache: {e}")
+
     def get_pr_by_branch(self, branch: str):
         """Find an open PR for a given branch.
 
@@ -216,10 +613,12 @@ class GitHubClient:
             PullRequest object if found, None otherwise.
         """
         logger.info(f"Looking up PR for branch: {branch}")
+        # The head filter is exact on the server, so the first result (if any)
+        # is the PR; only the first page is requested
         prs = self._repo.get_pulls(state="open", head=f"{self._config.github_owner}:{branch}")
-        for pr in prs:
-            if pr.head.ref == branch:
-                logger.info(f"Found PR #{pr.number} for branch: {branch}")
-                return pr
-        logger.info(f"No PR found for branch: {branch}")
-        return None
+        pr = next(iter(prs), None)
+        if pr is None:
+            logger.info(f"No PR found for branch: {branch}")
+            return None
+        logger.info(f"Found PR #{pr.number} for branch: {branch}")
+        return pr
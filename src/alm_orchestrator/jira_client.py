@@ -1,12 +1,15 @@
 """Jira API client for the ALM Orchestrator."""
 
+import json
 import logging
 import time
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 
 import requests
 from jira import JIRA, Issue
+from jira.client import TokenAuth
 from alm_orchestrator.config import Config
+from alm_orchestrator.utils.rate_limit import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +42,8 @@ class OAuthTokenManager:
         self._access_token: Optional[str] = None
         self._expires_at: Optional[float] = None
         self._cloud_id: Optional[str] = None
+        # Reuse one connection pool for token refreshes and resource lookups
+        self._session = requests.Session()
 
     def get_token(self) -> str:
         """Get a valid access token, refreshing if necessary."""
@@ -71,7 +76,7 @@ class OAuthTokenManager:
 
     def _refresh_token(self) -> None:
         """Fetch a new access token using client credentials."""
-        response = requests.post(
+        response = self._session.post(
             self._token_url,
             data={
                 "grant_type": OAUTH_GRANT_TYPE,
@@ -91,7 +96,7 @@ class OAuthTokenManager:
 
     def _fetch_cloud_id(self) -> None:
         """Fetch the cloud ID from accessible resources."""
-        response = requests.get(
+        response = self._session.get(
             self._resources_url,
             headers={
                 "Authorization": f"Bearer {self._access_token}",
@@ -119,9 +124,14 @@ class JiraClient:
         "ai-code-review",
         "ai-security-review",
     ])
+    # Sorted once so get_ai_labels() returns a stable order without sorting
+    AI_LABELS_ORDERED = tuple(sorted(AI_LABELS))
 
     PROCESSING_LABEL = "ai-processing"
-    MAX_RESULTS = 50
+
+    # Fields the daemon and actions actually read. Projecting the search keeps
+    # payloads small and lets get_comments() reuse the polled issues.
+    ISSUE_FIELDS = "summary,description,issuetype,labels,comment"
 
     def __init__(self, config: Config):
         """Initialize Jira client with configuration.
@@ -138,7 +148,27 @@ class JiraClient:
             api_url_pattern=config.atlassian_api_url_pattern,
         )
         self._jira: Optional[JIRA] = None
+        # Bearer token the JIRA client's session currently sends
+        self._jira_token: Optional[str] = None
+        # Client-side pacing of every HTTP request, shared by all worker
+        # threads. Retry-After on 429 is still honored by the jira library's
+        # ResilientSession.
+        self._rate_limiter = TokenBucket(
+            config.jira_requests_per_second, config.jira_request_burst
+        )
         self._account_id: Optional[str] = None
+        # Issues returned by the most recent poll, keyed by issue key
+        self._issue_cache: Dict[str, Issue] = {}
+        # Comments fetched from Jira this poll, for issues whose search
+        # result did not carry the full comment list
+        self._comment_cache: Dict[str, list] = {}
+        # The poll query only depends on configuration, so build it once
+        labels_clause = ", ".join(f'"{label}"' for label in self.AI_LABELS_ORDERED)
+        self._poll_jql = (
+            f'project = {config.jira_project_key} '
+            f'AND labels in ({labels_clause}) '
+            f'AND labels != "{self.PROCESSING_LABEL}"'
+        )
         self._fetch_account_id()
 
     @property
@@ -149,16 +179,18 @@ class JiraClient:
     def _get_jira(self) -> JIRA:
         """Get a JIRA client with a valid access token.
 
-        The client is recreated when the token is refreshed to ensure
-        the Bearer token in the Authorization header is always valid.
+        The client and its pooled, keep-alive session are created once.
+        When the token is refreshed, only the session's Bearer auth is
+        swapped, so open connections survive the refresh.
 
         For OAuth 2.0 service accounts, we use api.atlassian.com with
         the cloudId instead of the direct instance URL.
+
+        The session is paced on first use; see _pace_session().
         """
         # Get current token (will refresh if needed)
         token = self._token_manager.get_token()
 
-        # Recreate client if token was refreshed or doesn't exist yet
         if self._jira is None:
             # Service accounts must use api.atlassian.com endpoint
             api_url = self._token_manager.get_api_url()
@@ -166,8 +198,30 @@ class JiraClient:
                 server=api_url,
                 token_auth=token,
             )
+            self._pace_session(self._jira._session)
+        elif token != self._jira_token:
+            self._jira._session.auth = TokenAuth(token)
+        self._jira_token = token
         return self._jira
 
+    def _pace_session(self, session: requests.Session) -> None:
+        """Take a rate limiter token before every HTTP request on a session.
+
+        Wrapping send() rather than the client methods paces each request,
+        including every page of a paged search and the library's retries.
+
+        Args:
+            session: The JIRA client's requests session.
+        """
+        send = session.send
+        rate_limiter = self._rate_limiter
+
+        def paced_send(request, **kwargs):
+            rate_limiter.acquire()
+            return send(request, **kwargs)
+
+        session.send = paced_send
+
     def _fetch_account_id(self) -> None:
         """Fetch and cache the service account's Jira account ID."""
         jira = self._get_jira()
@@ -179,18 +233,23 @@ class JiraClient:
         """Fetch all issues in the project that have at least one AI label.
 
         Excludes issues currently being processed (ai-processing label).
+        Only ISSUE_FIELDS are requested, every page of matches is fetched,
+        and the results are cached for the rest of the poll cycle so
+        per-issue reads don't hit Jira again.
 
         Returns:
             List of Jira issues with AI labels.
         """
-        labels_clause = ", ".join(f'"{label}"' for label in self.AI_LABELS)
-        jql = (
-            f'project = {self._config.jira_project_key} '
-            f'AND labels in ({labels_clause}) '
-            f'AND labels != "{self.PROCESSING_LABEL}"'
+        # maxResults=False pages through every match (nextPageToken on
+        # Cloud, startAt on Server) instead of stopping at the first page
+        issues = self._get_jira().search_issues(
+            self._poll_jql,
+            maxResults=False,
+            fields=self.ISSUE_FIELDS,
         )
-
-        return self._get_jira().search_issues(jql, maxResults=self.MAX_RESULTS)
+        self._issue_cache = {issue.key: issue for issue in issues}
+        self._comment_cache = {}
+        return issues
 
     def get_ai_labels(self, issue: Issue) -> List[str]:
         """Extract AI labels from an issue.
@@ -199,10 +258,10 @@ class JiraClient:
             issue: Jira issue object.
 
         Returns:
-            List of AI label strings found on the issue.
+            List of AI label strings found on the issue, in sorted order.
         """
-        issue_labels = set(issue.fields.labels)
-        return sorted(list(issue_labels & self.AI_LABELS))
+        issue_labels = issue.fields.labels
+        return [label for label in self.AI_LABELS_ORDERED if label in issue_labels]
 
     def get_issue_description(self, issue: Issue) -> str:
         """Get the description text from an issue.
@@ -234,6 +293,71 @@ class JiraClient:
             body: The comment text (supports Jira markup).
         """
         self._get_jira().add_comment(issue_key, body)
+        # Cached comments are now stale; later reads must go to Jira
+        self._forget_issue(issue_key)
+
+    def finish_action(self, issue_key: str, body: str) -> None:
+        """Post an action's final comment and remove the processing label.
+
+        The daemon swaps the action label for PROCESSING_LABEL when it picks
+        an issue up, so this one PUT is the only Jira edit needed to finish
+        the action.
+
+        Args:
+            issue_key: The issue key (e.g., "TEST-123").
+            body: The comment text (supports Jira markup).
+        """
+        self._update_issue(issue_key, {
+            "comment": [{"add": {"body": body}}],
+            "labels": [{"remove": self.PROCESSING_LABEL}],
+        })
+        # Cached comments and labels are now stale
+        self._forget_issue(issue_key)
+
+    def _forget_issue(self, issue_key: str) -> None:
+        """Drop everything cached for an issue after it was modified."""
+        self._issue_cache.pop(issue_key, None)
+        self._comment_cache.pop(issue_key, None)
+
+    def _update_issue(self, issue_key: str, update: dict) -> None:
+        """Apply Jira edit operations to an issue with a single PUT.
+
+        Unlike Issue.update(), this does not reload the issue afterwards.
+
+        Args:
+            issue_key: The issue key (e.g., "TEST-123").
+            update: Jira "update" operations keyed by field name.
+        """
+        jira = self._get_jira()
+        jira._session.put(
+            jira._get_url(f"issue/{issue_key}"),
+            data=json.dumps({"update": update}),
+        )
+
+    def update_labels(
+        self,
+        issue_key: str,
+        add: Sequence[str] = (),
+        remove: Sequence[str] = (),
+    ) -> None:
+        """Add and remove labels on a Jira issue in a single edit.
+
+        Uses "add"/"remove" edit operations, so the issue is not read first
+        and concurrent label changes are not overwritten. Removals are
+        applied before additions. Adding a label the issue already has, or
+        removing one it lacks, is a no-op in Jira.
+
+        Args:
+            issue_key: The issue key (e.g., "TEST-123").
+            add: Labels to add.
+            remove: Labels to remove.
+        """
+        operations = [{"remove": label} for label in remove]
+        operations.extend({"add": label} for label in add)
+        if not operations:
+            return
+        # Cached comments stay valid; only comment writes make them stale
+        self._update_issue(issue_key, {"labels": operations})
 
     def add_label(self, issue_key: str, label: str) -> None:
         """Add a label to a Jira issue.
@@ -242,12 +366,7 @@ class JiraClient:
             issue_key: The issue key (e.g., "TEST-123").
             label: The label to add.
         """
-        issue = self._get_jira().issue(issue_key)
-        current_labels = list(issue.fields.labels)
-
-        if label not in current_labels:
-            current_labels.append(label)
-            issue.update(fields={"labels": current_labels})
+        self.update_labels(issue_key, add=[label])
 
     def remove_label(self, issue_key: str, label: str) -> None:
         """Remove a label from a Jira issue.
@@ -256,12 +375,7 @@ class JiraClient:
             issue_key: The issue key (e.g., "TEST-123").
             label: The label to remove.
         """
-        issue = self._get_jira().issue(issue_key)
-        current_labels = list(issue.fields.labels)
-
-        if label in current_labels:
-            current_labels.remove(label)
-            issue.update(fields={"labels": current_labels})
+        self.update_labels(issue_key, remove=[label])
 
     def get_comments(self, issue_key: str) -> List[dict]:
         """Get comments for an issue, sorted newest-first.
@@ -269,12 +383,19 @@ class JiraClient:
         Args:
             issue_key: The issue key (e.g., "TEST-123").
 
+        Uses the issue from the current poll when its comment list is
+        complete, otherwise fetches the comments from Jira once and reuses
+        them until the issue is next modified.
+
         Returns:
             List of comment dicts with body, author_id, and created fields,
             ordered from newest to oldest.
         """
-        issue = self._get_jira().issue(issue_key, fields="comment")
-        comments = issue.fields.comment.comments
+        comments = self._get_cached_comments(issue_key)
+        if comments is None:
+            issue = self._get_jira().issue(issue_key, fields="comment")
+            comments = issue.fields.comment.comments
+            self._comment_cache[issue_key] = comments
         sorted_comments = sorted(
             comments,
             key=lambda c: c.created,
@@ -289,6 +410,25 @@ class JiraClient:
             for c in sorted_comments
         ]
 
+    def _get_cached_comments(self, issue_key: str) -> Optional[list]:
+        """Return comments from the poll cache, or None if unavailable.
+
+        Search results may carry a truncated comment page, so the cache is
+        only used when it holds every comment on the issue.
+        """
+        if issue_key in self._comment_cache:
+            return self._comment_cache[issue_key]
+        issue = self._issue_cache.get(issue_key)
+        if issue is None:
+            return None
+        comment_field = getattr(issue.fields, "comment", None)
+        if comment_field is None:
+            return None
+        comments = comment_field.comments
+        if getattr(comment_field, "total", len(comments)) > len(comments):
+            return None
+        return comments
+
     def get_comment_by_header(self, issue_key: str, header: str) -> Optional[str]:
         """Get the most recent comment from this service account matching a header.
 
@@ -1,26 +1,40 @@
 """Output validation for Claude responses."""
 
+import hashlib
 import logging
 import math
 import re
+import threading
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List, Pattern, Tuple
+from typing import List, Optional, Pattern, Tuple
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Result of validating Claude's response."""
     is_valid: bool
     failure_reason: str  # Generic, no sensitive content
 
 
-# Credential detection patterns
+# Results are immutable, so the common outcomes are shared instead of
+# allocated on every call
+_VALID_RESULT = ValidationResult(is_valid=True, failure_reason="")
+_HIGH_ENTROPY_RESULT = ValidationResult(is_valid=False, failure_reason="high_entropy_string")
+
+
+# Number of recent validation results remembered by each OutputValidator
+RESULT_CACHE_SIZE = 256
+
+
+# Credential detection patterns. Case-insensitive patterns use scoped (?i:...)
+# groups so they can be joined into one alternation.
 CREDENTIAL_PATTERNS = [
     # AWS
     r"AKIA[0-9A-Z]{16}",  # AWS Access Key ID
-    r"(?i)aws.{0,20}secret.{0,20}['\"][0-9a-zA-Z/+]{40}['\"]",
+    r"(?i:aws.{0,20}secret.{0,20}['\"][0-9a-zA-Z/+]{40}['\"])",
 
     # Private keys
     r"-----BEGIN (RSA |EC |DSA |OPENSSH )?PRIVATE KEY-----",
@@ -30,32 +44,46 @@ CREDENTIAL_PATTERNS = [
     r"eyJ[a-zA-Z0-9_-]*\.eyJ[a-zA-Z0-9_-]*\.[a-zA-Z0-9_-]*",
 
     # Generic API keys / tokens
-    r"(?i)(api[_-]?key|apikey|secret[_-]?key|access[_-]?token)['\"]?\s*[:=]\s*['\"][a-zA-Z0-9_\-]{20,}['\"]",
+    r"(?i:(api[_-]?key|apikey|secret[_-]?key|access[_-]?token)['\"]?\s*[:=]\s*['\"][a-zA-Z0-9_\-]{20,}['\"])",
 
     # Environment variable assignments
-    r"(?i)(PASSWORD|SECRET|TOKEN|CREDENTIAL|API_KEY)\s*=\s*['\"]?[^\s'\"]{8,}",
+    r"(?i:(PASSWORD|SECRET|TOKEN|CREDENTIAL|API_KEY)\s*=\s*['\"]?[^\s'\"]{8,})",
 ]
 
+# One alternation scans a response once instead of once per pattern. Compiled
+# at import so every OutputValidator shares it.
+_CREDENTIAL_PATTERN: Pattern = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in CREDENTIAL_PATTERNS)
+)
+
 
 class OutputValidator:
     """Validates Claude's responses before posting to Jira/GitHub."""
 
     def __init__(self, entropy_threshold: float = 4.5, min_entropy_length: int = 20):
-        """Initialize the validator with credential patterns.
+        """Initialize the validator with its entropy settings.
 
         Args:
             entropy_threshold: Shannon entropy threshold for flagging suspicious strings.
             min_entropy_length: Minimum string length to check for high entropy.
         """
         self._entropy_threshold = entropy_threshold
-        self._min_entropy_length = min_entropy_length
-        self._credential_patterns: List[Pattern] = [
-            re.compile(pattern) for pattern in CREDENTIAL_PATTERNS
-        ]
+        # Only words long enough to be entropy-checked are matched at all
+        self._candidate_pattern: Pattern = re.compile(rf"\S{{{min_entropy_length},}}")
+        # Entropy never exceeds log2 of the number of distinct characters, so
+        # words with at most this many distinct characters cannot be flagged
+        self._max_safe_alphabet = int(2 ** entropy_threshold)
+        # Recent results keyed by a digest of the response, so large
+        # responses aren't held in memory. Shared by worker threads.
+        self._result_cache: "OrderedDict[bytes, ValidationResult]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def validate(self, response: str, action: str) -> ValidationResult:
         """Check response for secrets.
 
+        Results for the last RESULT_CACHE_SIZE distinct responses are
+        remembered, so validating the same text again skips the scan.
+
         Args:
             response: Claude's response text.
             action: The action type (investigate, fix, etc).
@@ -63,6 +91,32 @@ class OutputValidator:
         Returns:
             ValidationResult indicating if response is safe to post.
         """
+        key = hashlib.blake2b(
+            response.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        with self._cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+                return cached
+
+        result = self._scan(response)
+
+        with self._cache_lock:
+            self._result_cache[key] = result
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return result
+
+    def _scan(self, response: str) -> ValidationResult:
+        """Run the credential and entropy checks on a response.
+
+        Args:
+            response: The response text to check.
+
+        Returns:
+            ValidationResult for the response.
+        """
         # Check for credentials
         has_creds, reason = self._has_credentials(response)
         if has_creds:
@@ -70,9 +124,20 @@ class OutputValidator:
 
         # Check for high-entropy strings
         if self._has_high_entropy_strings(response):
-            return ValidationResult(is_valid=False, failure_reason="high_entropy_string")
+            return _HIGH_ENTROPY_RESULT
+
+        return _VALID_RESULT
+
+    def stream(self, action: str) -> "StreamingValidation":
+        """Start validating a response that arrives in chunks.
 
-        return ValidationResult(is_valid=True, failure_reason="")
+        Args:
+            action: The action type (investigate, fix, etc).
+
+        Returns:
+            A StreamingValidation to feed chunks into.
+        """
+        return StreamingValidation(self, action)
 
     def _has_credentials(self, response: str) -> Tuple[bool, str]:
         """Check for leaked secrets/credentials.
@@ -83,9 +148,8 @@ class OutputValidator:
         Returns:
             Tuple of (found, reason) where reason is "credential_detected" if found.
         """
-        for pattern in self._credential_patterns:
-            if pattern.search(response):
-                return (True, "credential_detected")
+        if _CREDENTIAL_PATTERN.search(response):
+            return (True, "credential_detected")
 
         return (False, "")
 
@@ -98,12 +162,12 @@ class OutputValidator:
         Returns:
             True if high-entropy strings found that may be leaked secrets.
         """
-        # Split into words, check each for high entropy
-        words = re.findall(r'\S+', response)
+        # Check each word of at least min_entropy_length characters
+        for match in self._candidate_pattern.finditer(response):
+            word = match.group()
 
-        for word in words:
-            # Skip short strings
-            if len(word) < self._min_entropy_length:
+            # Skip words whose alphabet is too small to reach the threshold
+            if len(set(word)) <= self._max_safe_alphabet:
                 continue
 
             # Calculate Shannon entropy
@@ -127,16 +191,76 @@ class OutputValidator:
         if not s:
             return 0.0
 
-        # Count character frequencies
-        char_counts: Dict[str, int] = {}
-        for char in s:
-            char_counts[char] = char_counts.get(char, 0) + 1
-
-        # Calculate entropy
+        # Counter tallies characters in C; only the distinct counts are
+        # visited in Python. H = log2(n) - sum(c * log2(c)) / n avoids a
+        # division per character class.
         length = len(s)
-        entropy = 0.0
-        for count in char_counts.values():
-            probability = count / length
-            entropy -= probability * math.log2(probability)
+        log2 = math.log2
+        return log2(length) - sum(
+            count * log2(count) for count in Counter(s).values()
+        ) / length
+
+
+class StreamingValidation:
+    """Incremental validation of a response that arrives in chunks.
+
+    Complete lines are checked as they arrive so a leaked secret can be
+    rejected before the rest of the output is read. Only complete lines are
+    checked, so end the response with a newline; a key split across lines
+    by whitespace is only caught by validating the whole text.
+    """
+
+    def __init__(self, validator: OutputValidator, action: str):
+        """Initialize streaming validation.
+
+        Args:
+            validator: The validator whose checks to apply.
+            action: The action type (investigate, fix, etc).
+        """
+        self._validator = validator
+        self._action = action
+        self._parts: List[str] = []
+        self._pending = ""
+        self._failure: Optional[ValidationResult] = None
+
+    @property
+    def failure(self) -> Optional[ValidationResult]:
+        """The failing result, or None while the response is still valid."""
+        return self._failure
+
+    @property
+    def rejected(self) -> bool:
+        """True once any fed content has failed validation."""
+        return self._failure is not None
+
+    @property
+    def text(self) -> str:
+        """All content fed so far."""
+        return "".join(self._parts)
+
+    def feed(self, chunk: str) -> bool:
+        """Add a chunk of output and check any newly completed lines.
+
+        Args:
+            chunk: The next piece of the response.
 
-        return entropy
+        Returns:
+            True if the response has been rejected.
+        """
+        if self._failure is not None:
+            return True
+
+        self._parts.append(chunk)
+        complete, newline, self._pending = (self._pending + chunk).rpartition("\n")
+        if newline:
+            self._failure = self._check(complete)
+        return self._failure is not None
+
+    def _check(self, text: str) -> Optional[ValidationResult]:
+        """Return a failing result if text is unsafe, None otherwise.
+
+        Scans directly rather than through validate(), so partial responses
+        don't crowd full results out of its cache.
+        """
+        result = self._validator._scan(text)
+        return None if result.is_valid else result
@@ -1,6 +1,7 @@
 """Label-to-action routing for the ALM Orchestrator."""
 
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple, Type
 from alm_orchestrator.actions.base import BaseAction
 
 
@@ -37,9 +38,10 @@ class LabelRouter:
         Raises:
             UnknownLabelError: If no action is registered for the label.
         """
-        if label not in self._actions:
-            raise UnknownLabelError(f"No action registered for label: {label}")
-        return self._actions[label]
+        try:
+            return self._actions[label]
+        except KeyError:
+            raise UnknownLabelError(f"No action registered for label: {label}") from None
 
     def has_action(self, label: str) -> bool:
         """Check if an action is registered for a label.
@@ -71,24 +73,18 @@ class LabelRouter:
         return [type(action).__name__ for action in self._actions.values()]
 
 
-def discover_actions(prompts_dir: str, validator: Any = None) -> LabelRouter:
-    """Auto-discover and register all action handlers.
-
-    Scans the actions package for BaseAction subclasses,
-    instantiates each with prompts_dir and validator, and registers them.
+@lru_cache(maxsize=None)
+def _discover_action_classes() -> Tuple[Type[BaseAction], ...]:
+    """Import the actions package once and return its BaseAction subclasses.
 
-    Args:
-        prompts_dir: Path to prompt templates directory.
-        validator: Optional OutputValidator instance for response validation.
-
-    Returns:
-        LabelRouter with all discovered actions registered.
+    The set of action modules is fixed for the life of the process, so the
+    package walk and imports only happen on the first call.
     """
     import importlib
     import pkgutil
     from alm_orchestrator import actions
 
-    router = LabelRouter()
+    classes = []
 
     # Iterate through all modules in the actions package
     for importer, modname, ispkg in pkgutil.iter_modules(actions.__path__):
@@ -98,12 +94,32 @@ def discover_actions(prompts_dir: str, validator: Any = None) -> LabelRouter:
         module = importlib.import_module(f"alm_orchestrator.actions.{modname}")
 
         # Find all BaseAction subclasses in this module
-        for name in dir(module):
-            obj = getattr(module, name)
+        for obj in vars(module).values():
             if (isinstance(obj, type) and
                 issubclass(obj, BaseAction) and
                 obj is not BaseAction):
-                action = obj(prompts_dir, validator=validator)
-                router.register(action.label, action)
+                classes.append(obj)
+
+    return tuple(classes)
+
+
+def discover_actions(prompts_dir: str, validator: Any = None) -> LabelRouter:
+    """Auto-discover and register all action handlers.
+
+    Scans the actions package for BaseAction subclasses,
+    instantiates each with prompts_dir and validator, and registers them.
+
+    Args:
+        prompts_dir: Path to prompt templates directory.
+        validator: Optional OutputValidator instance for response validation.
+
+    Returns:
+        LabelRouter with all discovered actions registered.
+    """
+    router = LabelRouter()
+
+    for action_class in _discover_action_classes():
+        action = action_class(prompts_dir, validator=validator)
+        router.register(action.label, action)
 
     return router
@@ -1,9 +1,18 @@
 """Utility functions for extracting PR references from text."""
 
 import re
+from itertools import chain
 from typing import List, Optional
 
 
+# GitHub PR URL; takes precedence over any textual reference
+_PR_URL_RE = re.compile(r"github\.com/[^/]+/[^/]+/pull/(\d+)", re.IGNORECASE)
+
+# "PR #42" / "PR: 42" or "Pull Request: #42", in one pass. "PR" must start
+# a word, so "Apr 2024" or "MyPR: 12" are not PR references.
+_PR_LABEL_RE = re.compile(r"\b(?:PR|Pull Request)[:\s#]+(\d+)", re.IGNORECASE)
+
+
 def extract_pr_number(text: str) -> Optional[int]:
     """Extract PR number from a single text string.
 
@@ -12,21 +21,19 @@ def extract_pr_number(text: str) -> Optional[int]:
     - Pull Request: #42
     - PR #42
 
+    A GitHub PR URL anywhere in the text wins over "PR"/"Pull Request"
+    references; otherwise the first such reference wins. "PR" only counts
+    at the start of a word.
+
     Args:
         text: Text to search for PR reference.
 
     Returns:
         PR number if found, None otherwise.
     """
-    patterns = [
-        r"github\.com/[^/]+/[^/]+/pull/(\d+)",
-        r"PR[:\s#]+(\d+)",
-        r"Pull Request[:\s#]+(\d+)",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            return int(match.group(1))
+    match = _PR_URL_RE.search(text) or _PR_LABEL_RE.search(text)
+    if match:
+        return int(match.group(1))
     return None
 
 
@@ -40,12 +47,8 @@ def find_pr_in_texts(description: str, comments: List[str]) -> Optional[int]:
     Returns:
         PR number if found, None otherwise.
     """
-    pr_number = extract_pr_number(description)
-    if pr_number:
-        return pr_number
-
-    for comment in comments:
-        pr_number = extract_pr_number(comment)
+    for text in chain((description,), comments):
+        pr_number = extract_pr_number(text)
         if pr_number:
             return pr_number
 
@@ -0,0 +1,43 @@
+"""Client-side request pacing for external APIs."""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket that blocks callers to hold a request rate.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``, so
+    short bursts go through immediately while sustained traffic is paced.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum tokens held, i.e. the allowed burst size.
+        """
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available.
+
+        The token is reserved under the lock and the wait happens outside it,
+        so concurrent callers queue up in order without holding each other.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
@@ -1 +1,19 @@
 """Tests for action handlers."""
+
+from unittest.mock import MagicMock
+
+from alm_orchestrator.github_client import GitHubClient
+
+
+def make_github_mock() -> MagicMock:
+    """Create a GitHubClient mock whose workspace() runs the real pairing.
+
+    clone_repo and cleanup stay mocks, so tests configure and assert on them
+    directly while actions use the workspace() context manager. The mock is
+    specced against GitHubClient so calls to methods it lacks fail loudly.
+    """
+    client = MagicMock(spec=GitHubClient)
+    client.workspace.side_effect = (
+        lambda *args, **kwargs: GitHubClient.workspace(client, *args, **kwargs)
+    )
+    return client
@@ -0,0 +1,43 @@
+"""Shared fixtures for action handler tests."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from alm_orchestrator.claude_executor import ClaudeExecutor
+from alm_orchestrator.jira_client import JiraClient
+from tests.test_actions import make_github_mock
+
+
+@pytest.fixture
+def mock_issue():
+    """A Bug issue with a summary and description; tests override fields."""
+    issue = MagicMock()
+    issue.key = "TEST-123"
+    issue.fields.summary = "Test summary"
+    issue.fields.description = "Test description"
+    issue.fields.issuetype.name = "Bug"
+    return issue
+
+
+@pytest.fixture
+def mock_jira():
+    """A JiraClient mock with no existing comments.
+
+    Specced against JiraClient so a misspelled method fails the test
+    instead of silently returning another mock.
+    """
+    client = MagicMock(spec=JiraClient)
+    client.get_comments.return_value = []
+    return client
+
+
+@pytest.fixture
+def mock_github():
+    """A GitHubClient mock whose workspace() runs the real pairing."""
+    return make_github_mock()
+
+
+@pytest.fixture
+def mock_claude():
+    """A ClaudeExecutor mock."""
+    return MagicMock(spec=ClaudeExecutor)
@@ -2,6 +2,7 @@
 
 import pytest
 from unittest.mock import MagicMock
+from tests.test_actions import make_github_mock
 from alm_orchestrator.actions.code_review import CodeReviewAction
 from alm_orchestrator.claude_executor import ClaudeResult
 
@@ -13,39 +14,27 @@ class TestCodeReviewAction:
 
     def test_allowed_issue_types(self):
         action = CodeReviewAction(prompts_dir="/tmp/prompts", validator=MagicMock())
-        assert action.allowed_issue_types == ["Bug", "Story"]
+        assert action.allowed_issue_types == frozenset({"Bug", "Story"})
 
-    def test_execute_rejects_invalid_issue_type(self):
+    def test_execute_rejects_invalid_issue_type(
+        self, mock_issue, mock_jira, mock_github, mock_claude
+    ):
         """Execute returns early for non-Bug/Story issue types."""
-        mock_issue = MagicMock()
-        mock_issue.key = "TEST-123"
         mock_issue.fields.issuetype.name = "Task"
-        mock_issue.fields.description = "Test description"
-
-        mock_jira = MagicMock()
-        mock_github = MagicMock()
-        mock_claude = MagicMock()
 
         action = CodeReviewAction(prompts_dir="/tmp/prompts", validator=MagicMock())
         result = action.execute(mock_issue, mock_jira, mock_github, mock_claude)
 
         mock_github.clone_repo.assert_not_called()
         mock_claude.execute_with_template.assert_not_called()
-        mock_jira.add_comment.assert_called_once()
-        assert "INVALID ISSUE TYPE" in mock_jira.add_comment.call_args[0][1]
+        mock_jira.finish_action.assert_called_once()
+        assert "INVALID ISSUE TYPE" in mock_jira.finish_action.call_args[0][1]
         assert "Rejected" in result
 
-    def test_execute_reviews_pr(self, mocker):
-        mock_issue = MagicMock()
-        mock_issue.key = "TEST-123"
+    def test_execute_reviews_pr(self, mock_issue, mock_jira, mock_github, mock_claude):
         mock_issue.fields.summary = "Review fix for orphaned recipes"
         mock_issue.fields.description = "PR: https://github.com/owner/repo/pull/42"
-        mock_issue.fields.issuetype.name = "Bug"
 
-        mock_jira = MagicMock()
-        mock_jira.get_comments.return_value = []
-
-        mock_github = MagicMock()
         mock_github.get_pr_info.return_value = {
             "head_branch": "feature/fix-recipes",
             "base_branch": "main",
@@ -61,7 +50,6 @@ class TestCodeReviewAction:
             duration_ms=5000,
             session_id="test-session"
         )
-        mock_claude = MagicMock()
         mock_claude.execute_with_template.return_value = mock_result
 
         action = CodeReviewAction(prompts_dir="/tmp/prompts", validator=MagicMock())
@@ -70,8 +58,9 @@ class TestCodeReviewAction:
         # Verify PR info was fetched
         mock_github.get_pr_info.assert_called_once_with(42)
 
-        # Verify repo was cloned with PR's head branch
-        mock_github.clone_repo.assert_called_once_with(branch="feature/fix-recipes")
+        # Verify the PR's head was checked out, which also works for forks
+        mock_github.clone_repo.assert_called_once()
+        assert mock_github.clone_repo.call_args.kwargs["pr_number"] == 42
 
         # Verify Claude was invoked with correct action and changed files
         mock_claude.execute_with_template.assert_called_once()
@@ -86,34 +75,20 @@ class TestCodeReviewAction:
         assert pr_number == 42
         assert "Code Review" in comment
 
-        # Verify Jira label removed
-        mock_jira.remove_label.assert_called_with("TEST-123", "ai-code-review")
-
         # Verify cleanup
         mock_github.cleanup.assert_called_once()
 
-    def test_execute_no_pr_found(self, mocker):
-        mock_issue = MagicMock()
-        mock_issue.key = "TEST-123"
-        mock_issue.fields.summary = "Review something"
+    def test_execute_no_pr_found(self, mock_issue, mock_jira, mock_github, mock_claude):
         mock_issue.fields.description = "No PR link here"
-        mock_issue.fields.issuetype.name = "Bug"
-
-        mock_jira = MagicMock()
-        mock_jira.get_comments.return_value = []
-        mock_github = MagicMock()
-        mock_claude = MagicMock()
 
         action = CodeReviewAction(prompts_dir="/tmp/prompts", validator=MagicMock())
         result = action.execute(mock_issue, mock_jira, mock_github, mock_claude)
 
         # Should post error comment and remove label
-        mock_jira.add_comment.assert_called_once()
-        comment = mock_jira.add_comment.call_args[0][1]
+        mock_jira.finish_action.assert_called_once()
+        comment = mock_jira.finish_action.call_args[0][1]
         assert "Could not find PR" in comment
 
-        mock_jira.remove_label.assert_called_with("TEST-123", "ai-code-review")
-
         # Should NOT clone or invoke Claude
         mock_github.clone_repo.assert_not_called()
         mock_claude.execute_with_template.assert_not_called()
@@ -140,7 +115,7 @@ class TestCodeReviewPRInComments:
 
     @pytest.fixture
     def mock_github_client(self):
-        client = MagicMock()
+        client = make_github_mock()
         client.get_pr_info.return_value = {
             "head_branch": "feature/test-branch",
             "base_branch": "main",
@@ -187,6 +162,17 @@ class TestCodeReviewPRInComments:
         call_args = mock_github_client.add_pr_comment.call_args
         assert call_args[0][0] == 1  # PR from description, not comments
 
+    def test_skips_comment_fetch_when_pr_in_description(
+        self, action, mock_issue, mock_jira_client, mock_github_client, mock_claude_executor
+    ):
+        """Test that comments are not fetched when the description has a PR."""
+        mock_issue.fields.description = "PR #1"
+
+        action.execute(mock_issue, mock_jira_client, mock_github_client, mock_claude_executor)
+
+        mock_jira_client.get_comments.assert_not_called()
+        assert mock_github_client.add_pr_comment.call_args[0][0] == 1
+
     def test_error_message_mentions_comments(
         self, action, mock_issue, mock_jira_client, mock_github_client, mock_claude_executor
     ):
@@ -195,6 +181,6 @@ class TestCodeReviewPRInComments:
 
         action.execute(mock_issue, mock_jira_client, mock_github_client, mock_claude_executor)
 
-        call_args = mock_jira_client.add_comment.call_args
+        call_args = mock_jira_client.finish_action.call_args
         error_message = call_args[0][1]
         assert "comments" in error_message.lower()
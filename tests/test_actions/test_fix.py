@@ -2,6 +2,7 @@
 
 import pytest
 from unittest.mock import MagicMock
+from tests.test_actions import make_github_mock
 from alm_orchestrator.actions.fix import FixAction
 from alm_orchestrator.claude_executor import ClaudeResult
 
@@ -13,7 +14,7 @@ class TestFixAction:
 
     def test_allowed_issue_types(self):
         action = FixAction(prompts_dir="/tmp/prompts", validator=MagicMock())
-        assert action.allowed_issue_types == ["Bug"]
+        assert action.allowed_issue_types == frozenset({"Bug"})
 
     def test_execute_rejects_invalid_issue_type(self):
         """Execute returns early for non-Bug issue types."""
@@ -22,7 +23,7 @@ class TestFixAction:
         mock_issue.fields.issuetype.name = "Story"
 
         mock_jira = MagicMock()
-        mock_github = MagicMock()
+        mock_github = make_github_mock()
         mock_claude = MagicMock()
 
         action = FixAction(prompts_dir="/tmp/prompts", validator=MagicMock())
@@ -33,9 +34,8 @@ class TestFixAction:
         mock_claude.execute_with_template.assert_not_called()
 
         # Should post rejection comment and remove label
-        mock_jira.add_comment.assert_called_once()
-        assert "INVALID ISSUE TYPE" in mock_jira.add_comment.call_args[0][1]
-        mock_jira.remove_label.assert_called_once_with("TEST-123", "ai-fix")
+        mock_jira.finish_action.assert_called_once()
+        assert "INVALID ISSUE TYPE" in mock_jira.finish_action.call_args[0][1]
 
         # Should return rejection message
         assert "Rejected" in result
@@ -54,7 +54,7 @@ class TestFixAction:
         mock_pr.number = 42
         mock_pr.html_url = "https://github.com/owner/repo/pull/42"
 
-        mock_github = MagicMock()
+        mock_github = make_github_mock()
         mock_github.clone_repo.return_value = "/tmp/work-dir"
         mock_github.create_pull_request.return_value = mock_pr
 
@@ -89,13 +89,10 @@ class TestFixAction:
         assert "TEST-123" in pr_kwargs["title"] or "TEST-123" in pr_kwargs["body"]
 
         # Verify Jira comment with PR link
-        mock_jira.add_comment.assert_called()
-        comment_body = mock_jira.add_comment.call_args[0][1]
+        mock_jira.finish_action.assert_called()
+        comment_body = mock_jira.finish_action.call_args[0][1]
         assert "pull/42" in comment_body or mock_pr.html_url in comment_body
 
-        # Verify label removed
-        mock_jira.remove_label.assert_called_with("TEST-123", "ai-fix")
-
         # Verify cleanup
         mock_github.cleanup.assert_called_once_with("/tmp/work-dir")
 
@@ -108,7 +105,7 @@ class TestFixAction:
         mock_issue.fields.issuetype.name = "Bug"
 
         mock_jira = MagicMock()
-        mock_github = MagicMock()
+        mock_github = make_github_mock()
         mock_github.clone_repo.return_value = "/tmp/work-dir"
 
         mock_claude = MagicMock()
@@ -138,7 +135,7 @@ class TestFixAction:
             "RECOMMENDATIONS\n===============\n\nOption 1: Do X."
         )
 
-        mock_github = MagicMock()
+        mock_github = make_github_mock()
         mock_github.clone_repo.return_value = "/tmp/work-dir"
 
         mock_pr = MagicMock()
@@ -183,7 +180,7 @@ class TestFixAction:
         )
         mock_jira.get_recommendation_comment.return_value = None
 
-        mock_github = MagicMock()
+        mock_github = make_github_mock()
         mock_github.clone_repo.return_value = "/tmp/work-dir"
 
         mock_pr = MagicMock()
@@ -232,7 +229,7 @@ class TestFixAction:
             "RECOMMENDATIONS\n===============\n\nOption 1: Do X."
         )
 
-        mock_github = MagicMock()
+        mock_github = make_github_mock()
         mock_github.clone_repo.return_value = "/tmp/work-dir"
 
         mock_pr = MagicMock()
@@ -279,7 +276,7 @@ class TestFixAction:
         mock_jira.get_investigation_comment.return_value = None
         mock_jira.get_recommendation_comment.return_value = None
 
-        mock_github = MagicMock()
+        mock_github = make_github_mock()
         mock_github.clone_repo.return_value = "/tmp/work-dir"
 
         mock_pr = MagicMock()
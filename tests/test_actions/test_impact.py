@@ -2,6 +2,7 @@
 
 import pytest
 from unittest.mock import MagicMock
+from tests.test_actions import make_github_mock
 from alm_orchestrator.actions.impact import ImpactAction
 from alm_orchestrator.claude_executor import ClaudeResult
 
@@ -13,7 +14,7 @@ class TestImpactAction:
 
     def test_allowed_issue_types(self):
         action = ImpactAction(prompts_dir="/tmp/prompts", validator=MagicMock())
-        assert action.allowed_issue_types == ["Bug", "Story"]
+        assert action.allowed_issue_types == frozenset({"Bug", "Story"})
 
     def test_execute_rejects_invalid_issue_type(self):
         """Execute returns early for non-Bug/Story issue types."""
@@ -22,7 +23,7 @@ class TestImpactAction:
         mock_issue.fields.issuetype.name = "Task"
 
         mock_jira = MagicMock()
-        mock_github = MagicMock()
+        mock_github = make_github_mock()
         mock_claude = MagicMock()
 
         action = ImpactAction(prompts_dir="/tmp/prompts", validator=MagicMock())
@@ -30,8 +31,8 @@ class TestImpactAction:
 
         mock_github.clone_repo.assert_not_called()
         mock_claude.execute_with_template.assert_not_called()
-        mock_jira.add_comment.assert_called_once()
-        assert "INVALID ISSUE TYPE" in mock_jira.add_comment.call_args[0][1]
+        mock_jira.finish_action.assert_called_once()
+        assert "INVALID ISSUE TYPE" in mock_jira.finish_action.call_args[0][1]
         assert "Rejected" in result
 
     def test_execute_flow(self):
@@ -43,7 +44,7 @@ class TestImpactAction:
         mock_issue.fields.issuetype.name = "Bug"
 
         mock_jira = MagicMock()
-        mock_github = MagicMock()
+        mock_github = make_github_mock()
         mock_github.clone_repo.return_value = "/tmp/work-dir"
 
         mock_result = ClaudeResult(
@@ -60,7 +61,6 @@ class TestImpactAction:
 
         mock_github.clone_repo.assert_called_once()
         mock_claude.execute_with_template.assert_called_once()
-        mock_jira.add_comment.assert_called_once()
-        assert "IMPACT ANALYSIS" in mock_jira.add_comment.call_args[0][1]
-        mock_jira.remove_label.assert_called_once_with("TEST-123", "ai-impact")
+        mock_jira.finish_action.assert_called_once()
+        assert "IMPACT ANALYSIS" in mock_jira.finish_action.call_args[0][1]
         mock_github.cleanup.assert_called_once()
@@ -2,6 +2,7 @@
 
 import pytest
 from unittest.mock import MagicMock
+from tests.test_actions import make_github_mock
 from alm_orchestrator.actions.implement import ImplementAction
 from alm_orchestrator.claude_executor import ClaudeResult
 
@@ -9,7 +10,7 @@ from alm_orchestrator.claude_executor import ClaudeResult
 class TestImplementAction:
     def test_allowed_issue_types(self):
         action = ImplementAction(prompts_dir="/tmp/prompts", validator=MagicMock())
-        assert action.allowed_issue_types == ["Story"]
+        assert action.allowed_issue_types == frozenset({"Story"})
 
     def test_execute_includes_recommendation_context(self, mocker):
         """Test that recommendation context is passed to Claude."""
@@ -24,7 +25,7 @@ class TestImplementAction:
             "RECOMMENDATIONS\n===============\n\nOption 1: Use React components."
         )
 
-        mock_github = MagicMock()
+        mock_github = make_github_mock()
         mock_github.clone_repo.return_value = "/tmp/work-dir"
 
         mock_pr = MagicMock()
@@ -64,7 +65,7 @@ class TestImplementAction:
         mock_jira = MagicMock()
         mock_jira.get_recommendation_comment.return_value = None
 
-        mock_github = MagicMock()
+        mock_github = make_github_mock()
         mock_github.clone_repo.return_value = "/tmp/work-dir"
 
         mock_pr = MagicMock()
@@ -109,7 +110,7 @@ class TestImplementAction:
         mock_jira = MagicMock()
         mock_jira.get_recommendation_comment.return_value = None
 
-        mock_github = MagicMock()
+        mock_github = make_github_mock()
         mock_github.clone_repo.return_value = "/tmp/work-dir"
 
         # Claude returns INVALID TICKET
@@ -129,13 +130,10 @@ class TestImplementAction:
         assert result == "Invalid ticket rejected for TEST-456"
 
         # Verify Jira comment was posted
-        mock_jira.add_comment.assert_called_once()
-        comment = mock_jira.add_comment.call_args[0][1]
+        mock_jira.finish_action.assert_called_once()
+        comment = mock_jira.finish_action.call_args[0][1]
         assert "INVALID TICKET" in comment
 
-        # Verify label was removed
-        mock_jira.remove_label.assert_called_once_with("TEST-456", "ai-implement")
-
         # Verify warning was logged
         assert any(
             "Invalid ticket rejected" in record.message
@@ -158,7 +156,7 @@ class TestImplementAction:
         mock_jira = MagicMock()
         mock_jira.get_recommendation_comment.return_value = None
 
-        mock_github = MagicMock()
+        mock_github = make_github_mock()
         mock_github.clone_repo.return_value = "/tmp/work-dir"
 
         # Claude returns INVALID TICKET with extra newline
@@ -208,7 +206,7 @@ class TestImplementAction:
         mock_issue.fields.issuetype.name = "Bug"
 
         mock_jira = MagicMock()
-        mock_github = MagicMock()
+        mock_github = make_github_mock()
         mock_claude = MagicMock()
 
         action = ImplementAction(prompts_dir="/tmp/prompts", validator=MagicMock())
@@ -216,6 +214,6 @@ class TestImplementAction:
 
         mock_github.clone_repo.assert_not_called()
         mock_claude.execute_with_template.assert_not_called()
-        mock_jira.add_comment.assert_called_once()
-        assert "INVALID ISSUE TYPE" in mock_jira.add_comment.call_args[0][1]
+        mock_jira.finish_action.assert_called_once()
+        assert "INVALID ISSUE TYPE" in mock_jira.finish_action.call_args[0][1]
         assert "Rejected" in result
@@ -2,6 +2,7 @@
 
 import pytest
 from unittest.mock import MagicMock
+from tests.test_actions import make_github_mock
 from alm_orchestrator.actions.security_review import SecurityReviewAction
 from alm_orchestrator.claude_executor import ClaudeResult
 
@@ -13,7 +14,7 @@ class TestSecurityReviewAction:
 
     def test_allowed_issue_types(self):
         action = SecurityReviewAction(prompts_dir="/tmp/prompts", validator=MagicMock())
-        assert action.allowed_issue_types == ["Bug", "Story"]
+        assert action.allowed_issue_types == frozenset({"Bug", "Story"})
 
     def test_execute_rejects_invalid_issue_type(self):
         """Execute returns early for non-Bug/Story issue types."""
@@ -23,7 +24,7 @@ class TestSecurityReviewAction:
         mock_issue.fields.description = "Some description"
 
         mock_jira = MagicMock()
-        mock_github = MagicMock()
+        mock_github = make_github_mock()
         mock_claude = MagicMock()
 
         action = SecurityReviewAction(prompts_dir="/tmp/prompts", validator=MagicMock())
@@ -31,8 +32,8 @@ class TestSecurityReviewAction:
 
         mock_github.clone_repo.assert_not_called()
         mock_claude.execute_with_template.assert_not_called()
-        mock_jira.add_comment.assert_called_once()
-        assert "INVALID ISSUE TYPE" in mock_jira.add_comment.call_args[0][1]
+        mock_jira.finish_action.assert_called_once()
+        assert "INVALID ISSUE TYPE" in mock_jira.finish_action.call_args[0][1]
         assert "Rejected" in result
 
     def test_execute_reviews_pr(self, mocker):
@@ -45,7 +46,7 @@ class TestSecurityReviewAction:
         mock_jira = MagicMock()
         mock_jira.get_comments.return_value = []
 
-        mock_github = MagicMock()
+        mock_github = make_github_mock()
         mock_github.get_pr_info.return_value = {
             "head_branch": "feature/auth-changes",
             "base_branch": "main",
@@ -70,8 +71,9 @@ class TestSecurityReviewAction:
         # Verify PR info was fetched
         mock_github.get_pr_info.assert_called_once_with(42)
 
-        # Verify repo was cloned with PR's head branch
-        mock_github.clone_repo.assert_called_once_with(branch="feature/auth-changes")
+        # Verify the PR's head was checked out, which also works for forks
+        mock_github.clone_repo.assert_called_once()
+        assert mock_github.clone_repo.call_args.kwargs["pr_number"] == 42
 
         # Verify Claude was invoked with correct action and changed files
         mock_claude.execute_with_template.assert_called_once()
@@ -86,9 +88,6 @@ class TestSecurityReviewAction:
         assert pr_number == 42
         assert "Security Review" in comment
 
-        # Verify Jira label removed
-        mock_jira.remove_label.assert_called_with("TEST-123", "ai-security-review")
-
         # Verify cleanup
         mock_github.cleanup.assert_called_once()
 
@@ -101,19 +100,17 @@ class TestSecurityReviewAction:
 
         mock_jira = MagicMock()
         mock_jira.get_comments.return_value = []
-        mock_github = MagicMock()
+        mock_github = make_github_mock()
         mock_claude = MagicMock()
 
         action = SecurityReviewAction(prompts_dir="/tmp/prompts", validator=MagicMock())
         result = action.execute(mock_issue, mock_jira, mock_github, mock_claude)
 
         # Should post error comment and remove label
-        mock_jira.add_comment.assert_called_once()
-        comment = mock_jira.add_comment.call_args[0][1]
+        mock_jira.finish_action.assert_called_once()
+        comment = mock_jira.finish_action.call_args[0][1]
         assert "Could not find PR" in comment
 
-        mock_jira.remove_label.assert_called_with("TEST-123", "ai-security-review")
-
         # Should NOT clone or invoke Claude
         mock_github.clone_repo.assert_not_called()
         mock_claude.execute_with_template.assert_not_called()
@@ -140,7 +137,7 @@ class TestSecurityReviewPRInComments:
 
     @pytest.fixture
     def mock_github_client(self):
-        client = MagicMock()
+        client = make_github_mock()
         client.get_pr_info.return_value = {
             "head_branch": "feature/test-branch",
             "base_branch": "main",
@@ -175,6 +172,17 @@ class TestSecurityReviewPRInComments:
         call_args = mock_github_client.add_pr_comment.call_args
         assert call_args[0][0] == 42
 
+    def test_skips_comment_fetch_when_pr_in_description(
+        self, action, mock_issue, mock_jira_client, mock_github_client, mock_claude_executor
+    ):
+        """Test that comments are not fetched when the description has a PR."""
+        mock_issue.fields.description = "PR #1"
+
+        action.execute(mock_issue, mock_jira_client, mock_github_client, mock_claude_executor)
+
+        mock_jira_client.get_comments.assert_not_called()
+        assert mock_github_client.add_pr_comment.call_args[0][0] == 1
+
     def test_error_message_mentions_comments(
         self, action, mock_issue, mock_jira_client, mock_github_client, mock_claude_executor
     ):
@@ -183,6 +191,6 @@ class TestSecurityReviewPRInComments:
 
         action.execute(mock_issue, mock_jira_client, mock_github_client, mock_claude_executor)
 
-        call_args = mock_jira_client.add_comment.call_args
+        call_args = mock_jira_client.finish_action.call_args
         error_message = call_args[0][1]
         assert "comments" in error_message.lower()
@@ -1,15 +1,30 @@
 """Tests for Claude Code CLI executor."""
 
 import json
+import os
 import subprocess
+import threading
+import time
+from functools import lru_cache
 import pytest
 from unittest.mock import MagicMock
-from alm_orchestrator.claude_executor import ClaudeExecutor, ClaudeExecutorError, ClaudeResult
+from alm_orchestrator.claude_executor import (
+    ClaudeExecutor,
+    ClaudeExecutorError,
+    ClaudeResult,
+    _log_writer,
+    _run_in_process_group,
+)
 
 
+@lru_cache
 def mock_json_response(content: str, cost: float = 0.01, duration: int = 5000) -> str:
-    """Create a mock JSON response from Claude Code."""
-    return json.dumps({
+    """Create a mock stream-json response from Claude Code.
+
+    Cached, since most tests ask for the same few payloads.
+    """
+    return mock_stream_response({
+        "type": "result",
         "result": content,
         "cost_usd": cost,
         "duration_ms": duration,
@@ -17,6 +32,33 @@ def mock_json_response(content: str, cost: float = 0.01, duration: int = 5000) -
     })
 
 
+def mock_stream_response(result_event: dict) -> str:
+    """Create mock stream-json output ending in the given result event."""
+    init_event = {"type": "system", "subtype": "init", "session_id": "test-session-123"}
+    return f"{json.dumps(init_event)}\n{json.dumps(result_event)}\n"
+
+
+def cli_output(returncode: int = 0, stdout: str = "", stderr: str = ""):
+    """Side effect for _run_in_process_group that streams stdout to on_line."""
+    def run(cmd, cwd, timeout, on_line=None, keep_stdout=True):
+        if on_line is not None:
+            for line in stdout.encode().splitlines(keepends=True):
+                on_line(line)
+        return MagicMock(returncode=returncode, stdout=stdout, stderr=stderr)
+    return run
+
+
+@pytest.fixture
+def patched_run(mocker):
+    """Patch _run_in_process_group to stream a successful "Done" result.
+
+    Tests needing other output or a failure override side_effect.
+    """
+    mock_run = mocker.patch("alm_orchestrator.claude_executor._run_in_process_group")
+    mock_run.side_effect = cli_output(stdout=mock_json_response("Done"))
+    return mock_run
+
+
 @pytest.fixture
 def prompts_dir(tmp_path):
     """Create a mock prompts directory with settings files."""
@@ -36,9 +78,8 @@ def work_dir(tmp_path):
 
 
 class TestClaudeExecutor:
-    def test_execute_runs_claude_cli(self, mocker, prompts_dir, work_dir):
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+    def test_execute_runs_claude_cli(self, patched_run, prompts_dir, work_dir):
+        patched_run.side_effect = cli_output(
             returncode=0,
             stdout=mock_json_response("Analysis complete. The root cause is..."),
             stderr=""
@@ -53,44 +94,29 @@ class TestClaudeExecutor:
 
         assert isinstance(result, ClaudeResult)
         assert "Analysis complete" in result.content
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args
+        patched_run.assert_called_once()
+        call_args = patched_run.call_args
         assert call_args[1]["cwd"] == str(work_dir)
 
-    def test_execute_with_timeout(self, mocker, prompts_dir, work_dir):
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout=mock_json_response("Done"),
-            stderr=""
-        )
-
+    def test_execute_with_timeout(self, patched_run, prompts_dir, work_dir):
         executor = ClaudeExecutor(prompts_dir=str(prompts_dir), timeout_seconds=300)
         executor.execute(work_dir=str(work_dir), prompt="Do something", action="investigate")
 
-        call_args = mock_run.call_args
+        call_args = patched_run.call_args
         assert call_args[1]["timeout"] == 300
 
-    def test_execute_uses_default_timeout(self, mocker, prompts_dir, work_dir):
+    def test_execute_uses_default_timeout(self, patched_run, prompts_dir, work_dir):
         """Verify default timeout is used when none specified."""
         from alm_orchestrator.config import DEFAULT_CLAUDE_TIMEOUT_SECONDS
 
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout=mock_json_response("Done"),
-            stderr=""
-        )
-
         executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
         executor.execute(work_dir=str(work_dir), prompt="Do something", action="investigate")
 
-        call_args = mock_run.call_args
+        call_args = patched_run.call_args
         assert call_args[1]["timeout"] == DEFAULT_CLAUDE_TIMEOUT_SECONDS
 
-    def test_execute_handles_nonzero_exit(self, mocker, prompts_dir, work_dir):
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+    def test_execute_handles_nonzero_exit(self, patched_run, prompts_dir, work_dir):
+        patched_run.side_effect = cli_output(
             returncode=1,
             stdout="",
             stderr="Error: something went wrong"
@@ -102,9 +128,8 @@ class TestClaudeExecutor:
 
         assert "something went wrong" in str(exc_info.value)
 
-    def test_execute_handles_timeout(self, mocker, prompts_dir, work_dir):
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.side_effect = subprocess.TimeoutExpired(cmd="claude", timeout=300)
+    def test_execute_handles_timeout(self, patched_run, prompts_dir, work_dir):
+        patched_run.side_effect = subprocess.TimeoutExpired(cmd="claude", timeout=300)
 
         executor = ClaudeExecutor(prompts_dir=str(prompts_dir), timeout_seconds=300)
         with pytest.raises(ClaudeExecutorError) as exc_info:
@@ -112,9 +137,8 @@ class TestClaudeExecutor:
 
         assert "timed out" in str(exc_info.value).lower()
 
-    def test_execute_uses_json_output(self, mocker, prompts_dir, work_dir):
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+    def test_execute_uses_stream_json_output(self, patched_run, prompts_dir, work_dir):
+        patched_run.side_effect = cli_output(
             returncode=0,
             stdout=mock_json_response("Output"),
             stderr=""
@@ -123,17 +147,82 @@ class TestClaudeExecutor:
         executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
         executor.execute(work_dir=str(work_dir), prompt="Investigate", action="investigate")
 
-        cmd = mock_run.call_args[0][0]
+        cmd = patched_run.call_args[0][0]
         assert "-p" in cmd
-        assert "--output-format" in cmd
-        assert "json" in cmd
+        assert cmd[cmd.index("--output-format") + 1] == "stream-json"
+        assert "--verbose" in cmd
         # Should NOT have legacy flags
         assert "--allowedTools" not in cmd
         assert "--permission-mode" not in cmd
 
-    def test_execute_parses_json_metadata(self, mocker, prompts_dir, work_dir):
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+    def test_execute_skips_non_json_lines(self, patched_run, prompts_dir, work_dir):
+        patched_run.side_effect = cli_output(stdout="not json\n" + mock_json_response("Done"))
+
+        executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
+        result = executor.execute(work_dir=str(work_dir), prompt="Go", action="investigate")
+
+        assert result.content == "Done"
+
+    def test_execute_without_result_event_raises(self, patched_run, prompts_dir, work_dir):
+        """The raw transcript is never returned as the action output."""
+        init_event = {"type": "system", "subtype": "init"}
+        patched_run.side_effect = cli_output(stdout=f"{json.dumps(init_event)}\n")
+
+        executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
+        with pytest.raises(ClaudeExecutorError, match="without a result event"):
+            executor.execute(work_dir=str(work_dir), prompt="Go", action="investigate")
+
+    def test_execute_error_omits_transcript(self, patched_run, prompts_dir, work_dir):
+        """A failed run reports stderr, truncated, and never the stdout transcript."""
+        patched_run.side_effect = cli_output(
+            returncode=1, stdout='{"type": "user", "secret": "file contents"}\n', stderr="x" * 5000
+        )
+
+        executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
+        with pytest.raises(ClaudeExecutorError) as exc_info:
+            executor.execute(work_dir=str(work_dir), prompt="Go", action="investigate")
+
+        assert "file contents" not in str(exc_info.value)
+        assert len(str(exc_info.value)) < 2100
+
+    def test_execute_keeps_transcript_only_for_logging(self, patched_run, prompts_dir, work_dir, tmp_path):
+        executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
+        executor.execute(work_dir=str(work_dir), prompt="Go", action="investigate", issue_key="TEST-1")
+        assert patched_run.call_args[1]["keep_stdout"] is False
+
+        executor = ClaudeExecutor(
+            prompts_dir=str(prompts_dir), log_output=True, logs_dir=str(tmp_path / "logs")
+        )
+        executor.execute(work_dir=str(work_dir), prompt="Go", action="investigate", issue_key="TEST-1")
+        _log_writer.submit(lambda: None).result()
+        assert patched_run.call_args[1]["keep_stdout"] is True
+
+    def test_narration_is_not_validated(self, patched_run, prompts_dir, work_dir):
+        """Only the final result is validated (by the action), not narration."""
+        narration = {"type": "assistant", "message": {"content": [
+            {"type": "text", "text": "The lockfile hash is aB3$xZ9!mK7@pL2&qR5#wT8"},
+        ]}}
+        stdout = f"{json.dumps(narration)}\n" + mock_json_response("Done", cost=0.5)
+        patched_run.side_effect = cli_output(stdout=stdout)
+
+        executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
+        result = executor.execute(work_dir=str(work_dir), prompt="Go", action="investigate")
+
+        assert result.content == "Done"
+        assert result.cost_usd == 0.5
+        assert result.session_id == "test-session-123"
+
+    def test_resolves_claude_binary_once(self, patched_run, mocker, prompts_dir, work_dir):
+        mock_which = mocker.patch("shutil.which", return_value="/usr/local/bin/claude")
+        executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
+        executor.execute(work_dir=str(work_dir), prompt="One", action="investigate")
+        executor.execute(work_dir=str(work_dir), prompt="Two", action="investigate")
+
+        mock_which.assert_called_once_with("claude")
+        assert patched_run.call_args[0][0][0] == "/usr/local/bin/claude"
+
+    def test_execute_parses_json_metadata(self, patched_run, prompts_dir, work_dir):
+        patched_run.side_effect = cli_output(
             returncode=0,
             stdout=mock_json_response("Result", cost=0.05, duration=10000),
             stderr=""
@@ -147,11 +236,92 @@ class TestClaudeExecutor:
         assert result.duration_ms == 10000
         assert result.session_id == "test-session-123"
 
+    def test_execute_respects_max_concurrent(self, mocker, prompts_dir, work_dir):
+        """No more than max_concurrent CLI processes run at once."""
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        run_done = cli_output(stdout=mock_json_response("Done"))
+
+        def fake_run(cmd, cwd, timeout, **kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return run_done(cmd, cwd, timeout, **kwargs)
+
+        mocker.patch("alm_orchestrator.claude_executor._run_in_process_group", side_effect=fake_run)
+
+        executor = ClaudeExecutor(prompts_dir=str(prompts_dir), max_concurrent=2)
+        threads = [
+            threading.Thread(
+                target=executor.execute,
+                kwargs={"work_dir": str(work_dir), "prompt": "Go", "action": "investigate"},
+            )
+            for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak == 2
+
+
+class TestExecutionLog:
+    def test_log_reuses_parsed_output(self, patched_run, mocker, prompts_dir, work_dir, tmp_path):
+        patched_run.side_effect = cli_output(
+            returncode=0,
+            stdout=mock_json_response("Logged result", cost=0.25),
+            stderr=""
+        )
+        loads_spy = mocker.spy(json, "loads")
+        logs_dir = tmp_path / "logs"
+
+        executor = ClaudeExecutor(
+            prompts_dir=str(prompts_dir), log_output=True, logs_dir=str(logs_dir)
+        )
+        executor.execute(
+            work_dir=str(work_dir), prompt="Test", action="investigate", issue_key="TEST-1"
+        )
+
+        # The writer is single-threaded, so this runs after the log is written
+        _log_writer.submit(lambda: None).result()
+        # One parse per streamed line; nothing is re-parsed for the log
+        assert loads_spy.call_count == 2
+        log_text = next(logs_dir.glob("ccout-TEST-1-*.txt")).read_text()
+        assert "Cost: $0.2500" in log_text
+        assert "CLAUDE'S RESPONSE (extracted from JSON)\n" in log_text
+        assert "Logged result" in log_text
+
+
+    def test_log_written_off_calling_thread(self, patched_run, mocker, prompts_dir, work_dir, tmp_path):
+        writer_threads = []
+        mocker.patch.object(
+            ClaudeExecutor,
+            "_log_execution_details",
+            side_effect=lambda **kwargs: writer_threads.append(threading.current_thread()),
+        )
+
+        executor = ClaudeExecutor(
+            prompts_dir=str(prompts_dir), log_output=True, logs_dir=str(tmp_path / "logs")
+        )
+        executor.execute(
+            work_dir=str(work_dir), prompt="Test", action="investigate", issue_key="TEST-1"
+        )
+        _log_writer.submit(lambda: None).result()
+
+        assert len(writer_threads) == 1
+        assert writer_threads[0] is not threading.current_thread()
+
 
 class TestClaudeExecutorTemplate:
-    def test_execute_with_template(self, mocker, prompts_dir, work_dir):
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+    def test_execute_with_template(self, patched_run, prompts_dir, work_dir):
+        patched_run.side_effect = cli_output(
             returncode=0,
             stdout=mock_json_response("Template result"),
             stderr=""
@@ -159,7 +329,7 @@ class TestClaudeExecutorTemplate:
 
         # Create a temp template file
         template_file = prompts_dir / "test_template.md"
-        template_file.write_text("Investigate {issue_key}: {issue_summary}")
+        template_file.write_text("Investigate ${issue_key}: ${issue_summary}")
 
         executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
         result = executor.execute_with_template(
@@ -174,22 +344,77 @@ class TestClaudeExecutorTemplate:
 
         assert result.content == "Template result"
         # Verify the prompt was formatted
-        call_args = mock_run.call_args[0][0]
+        call_args = patched_run.call_args[0][0]
         prompt_idx = call_args.index("-p") + 1
         assert "TEST-123" in call_args[prompt_idx]
         assert "Bug in recipe deletion" in call_args[prompt_idx]
 
-    def test_execute_with_template_escapes_format_strings(self, mocker, prompts_dir, work_dir):
+    def test_execute_with_template_reads_template_once(self, patched_run, mocker, prompts_dir, work_dir):
+        patched_run.side_effect = cli_output(
+            returncode=0,
+            stdout=mock_json_response("Template result"),
+            stderr=""
+        )
+
+        template_file = prompts_dir / "test_template.md"
+        template_file.write_text("Investigate ${issue_key}")
+
+        mock_open = mocker.patch("builtins.open", wraps=open)
+
+        executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
+        for key in ("TEST-1", "TEST-2"):
+            executor.execute_with_template(
+                work_dir=str(work_dir),
+                template_path=str(template_file),
+                context={"issue_key": key},
+                action="investigate"
+            )
+
+        template_opens = [c for c in mock_open.call_args_list if c[0][0] == str(template_file)]
+        assert len(template_opens) == 1
+        call_args = patched_run.call_args[0][0]
+        assert call_args[call_args.index("-p") + 1] == "Investigate TEST-2"
+
+    def test_execute_with_template_rereads_modified_template(self, patched_run, prompts_dir, work_dir):
+        patched_run.side_effect = cli_output(
+            returncode=0,
+            stdout=mock_json_response("Template result"),
+            stderr=""
+        )
+
+        template_file = prompts_dir / "test_template.md"
+        template_file.write_text("Investigate ${issue_key}")
+        os.utime(template_file, ns=(1_000_000_000, 1_000_000_000))
+
+        executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
+        executor.execute_with_template(
+            work_dir=str(work_dir),
+            template_path=str(template_file),
+            context={"issue_key": "TEST-1"},
+            action="investigate"
+        )
+        template_file.write_text("Review ${issue_key}")
+        os.utime(template_file, ns=(2_000_000_000, 2_000_000_000))
+        executor.execute_with_template(
+            work_dir=str(work_dir),
+            template_path=str(template_file),
+            context={"issue_key": "TEST-2"},
+            action="investigate"
+        )
+
+        call_args = patched_run.call_args[0][0]
+        assert call_args[call_args.index("-p") + 1] == "Review TEST-2"
+
+    def test_execute_with_template_escapes_format_strings(self, patched_run, prompts_dir, work_dir):
         """SEC-001: Verify format string injection is prevented."""
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+        patched_run.side_effect = cli_output(
             returncode=0,
             stdout=mock_json_response("Safe result"),
             stderr=""
         )
 
         template_file = prompts_dir / "test_template.md"
-        template_file.write_text("Issue: {issue_key}\nDescription: {issue_description}")
+        template_file.write_text("Issue: ${issue_key}\nDescription: ${issue_description}")
 
         executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
         # Malicious input with format string attack
@@ -207,51 +432,56 @@ class TestClaudeExecutorTemplate:
         assert result.content == "Safe result"
 
         # Verify the curly braces were escaped (not interpreted)
-        call_args = mock_run.call_args[0][0]
+        call_args = patched_run.call_args[0][0]
         prompt_idx = call_args.index("-p") + 1
         prompt = call_args[prompt_idx]
         assert "{__class__}" in prompt  # Literal braces in output
         assert "{config.github_token}" in prompt
 
+    def test_execute_with_template_does_not_expand_placeholders_in_values(
+        self, patched_run, prompts_dir, work_dir
+    ):
+        """SEC-001: Placeholders inside user content are left as literal text."""
+        patched_run.side_effect = cli_output(
+            returncode=0,
+            stdout=mock_json_response("Safe result"),
+            stderr=""
+        )
 
-class TestEscapeFormatString:
-    """Tests for the _escape_format_string helper."""
-
-    def test_escapes_single_braces(self):
-        assert ClaudeExecutor._escape_format_string("{foo}") == "{{foo}}"
-
-    def test_escapes_multiple_braces(self):
-        result = ClaudeExecutor._escape_format_string("a {x} b {y} c")
-        assert result == "a {{x}} b {{y}} c"
-
-    def test_handles_nested_braces(self):
-        result = ClaudeExecutor._escape_format_string("{a{b}c}")
-        assert result == "{{a{{b}}c}}"
-
-    def test_preserves_non_string_types(self):
-        assert ClaudeExecutor._escape_format_string(123) == 123
-        assert ClaudeExecutor._escape_format_string(None) is None
-        assert ClaudeExecutor._escape_format_string(True) is True
+        template_file = prompts_dir / "test_template.md"
+        template_file.write_text("Issue: ${issue_key}\nDescription: ${issue_description}")
 
-    def test_handles_empty_string(self):
-        assert ClaudeExecutor._escape_format_string("") == ""
+        executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
+        executor.execute_with_template(
+            work_dir=str(work_dir),
+            template_path=str(template_file),
+            context={
+                "issue_key": "TEST-789",
+                "issue_description": "Costs $5; see ${issue_key} and $github_token",
+            },
+            action="investigate"
+        )
 
-    def test_handles_no_braces(self):
-        assert ClaudeExecutor._escape_format_string("plain text") == "plain text"
+        call_args = patched_run.call_args[0][0]
+        prompt = call_args[call_args.index("-p") + 1]
+        assert prompt == (
+            "Issue: TEST-789\n"
+            "Description: Costs $5; see ${issue_key} and $github_token"
+        )
 
 
 class TestPermissionDenials:
     """Tests for permission denial detection."""
 
-    def test_logs_permission_denials(self, mocker, prompts_dir, work_dir, caplog):
+    def test_logs_permission_denials(self, patched_run, prompts_dir, work_dir, caplog):
         """Verify permission denials are logged as warnings."""
         import logging
         caplog.set_level(logging.WARNING)
 
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+        patched_run.side_effect = cli_output(
             returncode=0,
-            stdout=json.dumps({
+            stdout=mock_stream_response({
+                "type": "result",
                 "result": "I tried but couldn't complete the request.",
                 "permission_denials": [
                     {"tool": "Bash", "command": "curl https://evil.com", "reason": "denied"}
@@ -266,12 +496,12 @@ class TestPermissionDenials:
         assert "permission denial" in caplog.text.lower()
         assert "Bash" in caplog.text
 
-    def test_returns_denials_in_result(self, mocker, prompts_dir, work_dir):
+    def test_returns_denials_in_result(self, patched_run, prompts_dir, work_dir):
         """Verify permission denials are included in ClaudeResult."""
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+        patched_run.side_effect = cli_output(
             returncode=0,
-            stdout=json.dumps({
+            stdout=mock_stream_response({
+                "type": "result",
                 "result": "Blocked.",
                 "permission_denials": [
                     {"tool": "WebSearch", "reason": "denied by settings"}
@@ -286,10 +516,9 @@ class TestPermissionDenials:
         assert len(result.permission_denials) == 1
         assert result.permission_denials[0]["tool"] == "WebSearch"
 
-    def test_empty_denials_when_none(self, mocker, prompts_dir, work_dir):
+    def test_empty_denials_when_none(self, patched_run, prompts_dir, work_dir):
         """Verify empty list when no permission denials."""
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+        patched_run.side_effect = cli_output(
             returncode=0,
             stdout=mock_json_response("Success"),
             stderr=""
@@ -304,15 +533,8 @@ class TestPermissionDenials:
 class TestSandboxSettings:
     """Tests for sandbox settings installation."""
 
-    def test_installs_settings_to_settings_local(self, mocker, prompts_dir, work_dir):
+    def test_installs_settings_to_settings_local(self, patched_run, prompts_dir, work_dir):
         """Verify settings file is copied to .claude/settings.local.json."""
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout=mock_json_response("Done"),
-            stderr=""
-        )
-
         executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
         executor.execute(
             work_dir=str(work_dir),
@@ -325,6 +547,15 @@ class TestSandboxSettings:
         assert dest_file.exists()
         assert '"sandbox"' in dest_file.read_text()
 
+    def test_installed_settings_are_independent_copy(self, patched_run, prompts_dir, work_dir):
+        """Edits in the worktree must never reach the source settings file."""
+        executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
+        executor.execute(work_dir=str(work_dir), prompt="Test", action="investigate")
+
+        dest_file = work_dir / ".claude" / "settings.local.json"
+        dest_file.write_text('{"sandbox": {"enabled": false}}')
+        assert (prompts_dir / "investigate.json").read_text() == '{"sandbox": {"enabled": true}}'
+
     def test_raises_on_missing_settings(self, mocker, prompts_dir, work_dir):
         """Verify FileNotFoundError when settings file doesn't exist."""
         executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
@@ -336,15 +567,8 @@ class TestSandboxSettings:
                 action="nonexistent"
             )
 
-    def test_no_legacy_cli_flags(self, mocker, prompts_dir, work_dir):
+    def test_no_legacy_cli_flags(self, patched_run, prompts_dir, work_dir):
         """Verify sandbox mode doesn't use legacy CLI flags."""
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout=mock_json_response("Done"),
-            stderr=""
-        )
-
         executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
         executor.execute(
             work_dir=str(work_dir),
@@ -352,6 +576,89 @@ class TestSandboxSettings:
             action="investigate"
         )
 
-        cmd = mock_run.call_args[0][0]
+        cmd = patched_run.call_args[0][0]
         assert "--allowedTools" not in cmd
         assert "--permission-mode" not in cmd
+
+
+class TestRunInProcessGroup:
+    def test_returns_output_and_exit_code(self, tmp_path):
+        result = _run_in_process_group(
+            ["sh", "-c", "echo out; echo err >&2; exit 3"],
+            cwd=str(tmp_path),
+            timeout=10,
+        )
+
+        assert result.returncode == 3
+        assert result.stdout == "out\n"
+        assert result.stderr == "err\n"
+
+    def test_streams_lines_before_process_exits(self, tmp_path):
+        """on_line sees each line while the process is still running."""
+        flag = tmp_path / "seen"
+        lines = []
+
+        def on_line(line):
+            lines.append(line)
+            flag.touch()
+
+        result = _run_in_process_group(
+            ["sh", "-c", f"echo first; while [ ! -e {flag} ]; do sleep 0.05; done; echo second"],
+            cwd=str(tmp_path),
+            timeout=5,
+            on_line=on_line,
+        )
+
+        assert lines == [b"first\n", b"second\n"]
+        assert result.stdout == "first\nsecond\n"
+
+    def test_undecodable_output_is_replaced(self, tmp_path):
+        result = _run_in_process_group(
+            ["sh", "-c", "printf '\\377ok'"],
+            cwd=str(tmp_path),
+            timeout=10,
+        )
+
+        assert result.stdout == "\ufffdok"
+
+    def test_keep_stdout_false_only_streams(self, tmp_path):
+        lines = []
+
+        result = _run_in_process_group(
+            ["sh", "-c", "echo out"],
+            cwd=str(tmp_path),
+            timeout=10,
+            on_line=lines.append,
+            keep_stdout=False,
+        )
+
+        assert lines == [b"out\n"]
+        assert result.stdout == ""
+
+    def test_callback_error_kills_process(self, tmp_path):
+        """An exception from on_line stops the command instead of waiting."""
+        def on_line(line):
+            raise RuntimeError("stop")
+
+        start = time.monotonic()
+        with pytest.raises(RuntimeError):
+            _run_in_process_group(
+                ["sh", "-c", "echo first; sleep 30"],
+                cwd=str(tmp_path),
+                timeout=60,
+                on_line=on_line,
+            )
+
+        assert time.monotonic() - start < 10
+
+    def test_timeout_kills_child_processes(self, tmp_path):
+        """A background grandchild holding the pipe must not delay the timeout."""
+        start = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired):
+            _run_in_process_group(
+                ["sh", "-c", "sleep 30 & sleep 30"],
+                cwd=str(tmp_path),
+                timeout=0.5,
+            )
+
+        assert time.monotonic() - start < 10
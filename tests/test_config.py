@@ -66,6 +66,89 @@ class TestConfig:
 
         assert "CLAUDE_TIMEOUT_SECONDS must be an integer" in str(exc_info.value)
 
+    def test_custom_max_concurrent_issues(self, monkeypatch):
+        monkeypatch.setenv("JIRA_URL", "https://test.atlassian.net")
+        monkeypatch.setenv("JIRA_CLIENT_ID", "test-client-id")
+        monkeypatch.setenv("JIRA_CLIENT_SECRET", "test-client-secret")
+        monkeypatch.setenv("JIRA_PROJECT_KEY", "TEST")
+        monkeypatch.setenv("GITHUB_TOKEN", "ghp_test")
+        monkeypatch.setenv("GITHUB_REPO", "owner/repo")
+        monkeypatch.setenv("MAX_CONCURRENT_ISSUES", "4")
+
+        config = Config.from_env()
+
+        assert config.max_concurrent_issues == 4
+
+    def test_invalid_max_concurrent_issues_raises_error(self, monkeypatch):
+        monkeypatch.setenv("JIRA_URL", "https://test.atlassian.net")
+        monkeypatch.setenv("JIRA_CLIENT_ID", "test-client-id")
+        monkeypatch.setenv("JIRA_CLIENT_SECRET", "test-client-secret")
+        monkeypatch.setenv("JIRA_PROJECT_KEY", "TEST")
+        monkeypatch.setenv("GITHUB_TOKEN", "ghp_test")
+        monkeypatch.setenv("GITHUB_REPO", "owner/repo")
+        monkeypatch.setenv("MAX_CONCURRENT_ISSUES", "0")
+
+        with pytest.raises(ConfigError) as exc_info:
+            Config.from_env()
+
+        assert "MAX_CONCURRENT_ISSUES must be at least 1" in str(exc_info.value)
+
+    def test_custom_max_concurrent_claude(self, monkeypatch):
+        monkeypatch.setenv("JIRA_URL", "https://test.atlassian.net")
+        monkeypatch.setenv("JIRA_CLIENT_ID", "test-client-id")
+        monkeypatch.setenv("JIRA_CLIENT_SECRET", "test-client-secret")
+        monkeypatch.setenv("JIRA_PROJECT_KEY", "TEST")
+        monkeypatch.setenv("GITHUB_TOKEN", "ghp_test")
+        monkeypatch.setenv("GITHUB_REPO", "owner/repo")
+        monkeypatch.setenv("MAX_CONCURRENT_CLAUDE", "1")
+
+        config = Config.from_env()
+
+        assert config.max_concurrent_claude == 1
+
+    def test_invalid_max_concurrent_claude_raises_error(self, monkeypatch):
+        monkeypatch.setenv("JIRA_URL", "https://test.atlassian.net")
+        monkeypatch.setenv("JIRA_CLIENT_ID", "test-client-id")
+        monkeypatch.setenv("JIRA_CLIENT_SECRET", "test-client-secret")
+        monkeypatch.setenv("JIRA_PROJECT_KEY", "TEST")
+        monkeypatch.setenv("GITHUB_TOKEN", "ghp_test")
+        monkeypatch.setenv("GITHUB_REPO", "owner/repo")
+        monkeypatch.setenv("MAX_CONCURRENT_CLAUDE", "many")
+
+        with pytest.raises(ConfigError) as exc_info:
+            Config.from_env()
+
+        assert "MAX_CONCURRENT_CLAUDE must be an integer" in str(exc_info.value)
+
+    def test_custom_jira_rate_limit(self, monkeypatch):
+        monkeypatch.setenv("JIRA_URL", "https://test.atlassian.net")
+        monkeypatch.setenv("JIRA_CLIENT_ID", "test-client-id")
+        monkeypatch.setenv("JIRA_CLIENT_SECRET", "test-client-secret")
+        monkeypatch.setenv("JIRA_PROJECT_KEY", "TEST")
+        monkeypatch.setenv("GITHUB_TOKEN", "ghp_test")
+        monkeypatch.setenv("GITHUB_REPO", "owner/repo")
+        monkeypatch.setenv("JIRA_REQUESTS_PER_SECOND", "2.5")
+        monkeypatch.setenv("JIRA_REQUEST_BURST", "3")
+
+        config = Config.from_env()
+
+        assert config.jira_requests_per_second == 2.5
+        assert config.jira_request_burst == 3
+
+    def test_invalid_jira_rate_limit_raises_error(self, monkeypatch):
+        monkeypatch.setenv("JIRA_URL", "https://test.atlassian.net")
+        monkeypatch.setenv("JIRA_CLIENT_ID", "test-client-id")
+        monkeypatch.setenv("JIRA_CLIENT_SECRET", "test-client-secret")
+        monkeypatch.setenv("JIRA_PROJECT_KEY", "TEST")
+        monkeypatch.setenv("GITHUB_TOKEN", "ghp_test")
+        monkeypatch.setenv("GITHUB_REPO", "owner/repo")
+        monkeypatch.setenv("JIRA_REQUESTS_PER_SECOND", "0")
+
+        with pytest.raises(ConfigError) as exc_info:
+            Config.from_env()
+
+        assert "JIRA_REQUESTS_PER_SECOND must be positive" in str(exc_info.value)
+
     def test_raises_on_missing_required(self, monkeypatch):
         # Clear all env vars
         for key in ["JIRA_URL", "JIRA_CLIENT_ID", "JIRA_CLIENT_SECRET", "JIRA_PROJECT_KEY",
@@ -1,14 +1,23 @@
 """Tests for main daemon loop."""
 
+import threading
+import time
+
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
+from alm_orchestrator.claude_executor import ClaudeExecutor
 from alm_orchestrator.daemon import Daemon
 from alm_orchestrator.config import Config
+from alm_orchestrator.github_client import GitHubClient
+from alm_orchestrator.jira_client import JiraClient
 from alm_orchestrator.output_validator import OutputValidator
+from alm_orchestrator.router import LabelRouter
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_config():
+    # Config is frozen, so one instance is safely shared by the module
     return Config(
         jira_url="https://test.atlassian.net",
         jira_project_key="TEST",
@@ -21,133 +30,219 @@ def mock_config():
     )
 
 
-class TestDaemon:
-    def test_initialization(self, mock_config, mocker):
-        mocker.patch("alm_orchestrator.daemon.JiraClient")
-        mocker.patch("alm_orchestrator.daemon.GitHubClient")
-        mocker.patch("alm_orchestrator.daemon.ClaudeExecutor")
-        mocker.patch("alm_orchestrator.daemon.discover_actions")
+@pytest.fixture
+def clients(mocker):
+    """Patch the daemon's collaborators with specced mocks.
+
+    The router routes every label to one mock action, and Jira returns no
+    issues until a test configures fetch_issues_with_ai_labels.
+    """
+    jira = MagicMock(spec=JiraClient)
+    jira.fetch_issues_with_ai_labels.return_value = []
+    jira.get_ai_labels.return_value = ["ai-investigate"]
+    action = MagicMock()
+    router = MagicMock(spec=LabelRouter)
+    router.has_action.return_value = True
+    router.get_action.return_value = action
+    router.action_count = 1
+    router.action_names = ["InvestigateAction"]
+
+    github = MagicMock(spec=GitHubClient)
+    claude = MagicMock(spec=ClaudeExecutor)
+
+    jira_class = mocker.patch("alm_orchestrator.daemon.JiraClient", return_value=jira)
+    jira_class.PROCESSING_LABEL = JiraClient.PROCESSING_LABEL
+    mocker.patch("alm_orchestrator.daemon.GitHubClient", return_value=github)
+    mocker.patch("alm_orchestrator.daemon.ClaudeExecutor", return_value=claude)
+    mocker.patch("alm_orchestrator.daemon.discover_actions", return_value=router)
+    return SimpleNamespace(jira=jira, github=github, claude=claude, router=router, action=action)
+
+
+def make_issues(*keys):
+    """Create mock Jira issues with the given keys."""
+    issues = []
+    for key in keys:
+        issue = MagicMock()
+        issue.key = key
+        issues.append(issue)
+    return issues
 
+
+class TestDaemon:
+    def test_initialization(self, mock_config, clients):
         daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
 
         assert daemon is not None
         assert daemon._running is False
 
-    def test_single_poll_processes_issues(self, mock_config, mocker):
-        mock_jira = MagicMock()
-        mock_github = MagicMock()
-        mock_claude = MagicMock()
-
-        mock_issue = MagicMock()
-        mock_issue.key = "TEST-123"
-        mock_issue.fields.labels = ["ai-investigate"]
-        mock_jira.fetch_issues_with_ai_labels.return_value = [mock_issue]
-        mock_jira.get_ai_labels.return_value = ["ai-investigate"]
-
-        mocker.patch("alm_orchestrator.daemon.JiraClient", return_value=mock_jira)
-        mocker.patch("alm_orchestrator.daemon.GitHubClient", return_value=mock_github)
-        mocker.patch("alm_orchestrator.daemon.ClaudeExecutor", return_value=mock_claude)
-
-        mock_action = MagicMock()
-        mock_router = MagicMock()
-        mock_router.has_action.return_value = True
-        mock_router.get_action.return_value = mock_action
-        mocker.patch("alm_orchestrator.daemon.discover_actions", return_value=mock_router)
+    def test_single_poll_processes_issues(self, mock_config, clients):
+        clients.jira.fetch_issues_with_ai_labels.return_value = make_issues("TEST-123")
 
         daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
         processed = daemon.poll_once()
 
         # Verify action was executed
-        mock_action.execute.assert_called_once()
+        clients.action.execute.assert_called_once()
         assert processed == 1
+        clients.github.end_poll_cycle.assert_called_once()
+
+    def test_poll_removes_original_label_and_adds_processing_label(self, mock_config, clients):
+        clients.jira.fetch_issues_with_ai_labels.return_value = make_issues("TEST-123")
+
+        daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
+        daemon.poll_once()
 
-    def test_poll_removes_original_label_and_adds_processing_label(self, mock_config, mocker):
-        mock_jira = MagicMock()
-        mock_github = MagicMock()
-        mock_claude = MagicMock()
+        # Original label swapped for the processing label in one edit; the
+        # action's final comment removes the processing label
+        clients.jira.update_labels.assert_called_once_with(
+            "TEST-123", add=["ai-processing"], remove=["ai-investigate"]
+        )
+        clients.jira.remove_label.assert_not_called()
+        clients.jira.add_label.assert_not_called()
 
-        mock_issue = MagicMock()
-        mock_issue.key = "TEST-123"
-        mock_jira.fetch_issues_with_ai_labels.return_value = [mock_issue]
-        mock_jira.get_ai_labels.return_value = ["ai-investigate"]
+    def test_poll_handles_action_error(self, mock_config, clients):
+        clients.jira.fetch_issues_with_ai_labels.return_value = make_issues("TEST-123")
+        clients.action.execute.side_effect = Exception("Action failed")
 
-        mock_jira_class = mocker.patch("alm_orchestrator.daemon.JiraClient", return_value=mock_jira)
-        mock_jira_class.PROCESSING_LABEL = "ai-processing"
-        mocker.patch("alm_orchestrator.daemon.GitHubClient", return_value=mock_github)
-        mocker.patch("alm_orchestrator.daemon.ClaudeExecutor", return_value=mock_claude)
+        daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
+        daemon.poll_once()
 
-        mock_router = MagicMock()
-        mock_router.has_action.return_value = True
-        mocker.patch("alm_orchestrator.daemon.discover_actions", return_value=mock_router)
+        # Original label removed upfront
+        clients.jira.update_labels.assert_called_once_with(
+            "TEST-123", add=["ai-processing"], remove=["ai-investigate"]
+        )
+
+        # Error comment and processing label removal go out in one edit
+        clients.jira.finish_action.assert_called_once()
+        issue_key, comment = clients.jira.finish_action.call_args[0]
+        assert issue_key == "TEST-123"
+        assert "FAILED" in comment.upper()
+        assert "ai-investigate" in comment
+        clients.jira.add_comment.assert_not_called()
+        clients.jira.remove_label.assert_not_called()
+
+    def test_interrupted_action_removes_processing_label(self, mock_config, clients):
+        clients.jira.fetch_issues_with_ai_labels.return_value = make_issues("TEST-123")
+        clients.action.execute.side_effect = KeyboardInterrupt
+
+        daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
+        with pytest.raises(KeyboardInterrupt):
+            daemon._process_issue(make_issues("TEST-123")[0])
+
+        clients.jira.remove_label.assert_called_once_with("TEST-123", "ai-processing")
+        clients.jira.finish_action.assert_not_called()
+
+    def test_failed_error_comment_still_removes_processing_label(self, mock_config, clients):
+        clients.jira.fetch_issues_with_ai_labels.return_value = make_issues("TEST-123")
+        clients.action.execute.side_effect = Exception("Action failed")
+        clients.jira.finish_action.side_effect = Exception("Jira unavailable")
 
         daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
         daemon.poll_once()
 
-        # Verify original label removed, processing label added, then processing label removed
-        remove_calls = mock_jira.remove_label.call_args_list
-        assert len(remove_calls) == 2
-        assert remove_calls[0] == mocker.call("TEST-123", "ai-investigate")
-        assert remove_calls[1] == mocker.call("TEST-123", "ai-processing")
-        mock_jira.add_label.assert_called_once_with("TEST-123", "ai-processing")
-
-    def test_poll_handles_action_error(self, mock_config, mocker):
-        mock_jira = MagicMock()
-        mock_github = MagicMock()
-        mock_claude = MagicMock()
-
-        mock_issue = MagicMock()
-        mock_issue.key = "TEST-123"
-        mock_jira.fetch_issues_with_ai_labels.return_value = [mock_issue]
-        mock_jira.get_ai_labels.return_value = ["ai-investigate"]
-
-        mock_jira_class = mocker.patch("alm_orchestrator.daemon.JiraClient", return_value=mock_jira)
-        mock_jira_class.PROCESSING_LABEL = "ai-processing"
-        mocker.patch("alm_orchestrator.daemon.GitHubClient", return_value=mock_github)
-        mocker.patch("alm_orchestrator.daemon.ClaudeExecutor", return_value=mock_claude)
-
-        mock_action = MagicMock()
-        mock_action.execute.side_effect = Exception("Action failed")
-        mock_router = MagicMock()
-        mock_router.has_action.return_value = True
-        mock_router.get_action.return_value = mock_action
-        mocker.patch("alm_orchestrator.daemon.discover_actions", return_value=mock_router)
+        clients.jira.remove_label.assert_called_once_with("TEST-123", "ai-processing")
+
+    def test_poll_processes_issues_concurrently(self, mock_config, clients):
+        clients.jira.fetch_issues_with_ai_labels.return_value = make_issues("TEST-1", "TEST-2")
+
+        # Each execute waits for the other; this only completes if both run at once
+        barrier = threading.Barrier(2, timeout=5)
+        clients.action.execute.side_effect = lambda **kwargs: barrier.wait()
 
         daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
         processed = daemon.poll_once()
 
-        # Should post error comment
-        mock_jira.add_comment.assert_called()
-        comment = mock_jira.add_comment.call_args[0][1]
-        assert "FAILED" in comment.upper()
-        assert "ai-investigate" in comment
+        assert processed == 2
+        assert clients.action.execute.call_count == 2
 
-        # Original label removed upfront, processing label removed in finally
-        remove_calls = mock_jira.remove_label.call_args_list
-        assert len(remove_calls) == 2
-        assert remove_calls[0] == mocker.call("TEST-123", "ai-investigate")
-        assert remove_calls[1] == mocker.call("TEST-123", "ai-processing")
+    def test_poll_keeps_results_when_one_issue_errors(self, mock_config, clients):
+        clients.jira.fetch_issues_with_ai_labels.return_value = make_issues("TEST-1", "TEST-2")
 
-    def test_run_can_be_stopped(self, mock_config, mocker):
-        mock_jira = MagicMock()
-        mock_jira.fetch_issues_with_ai_labels.return_value = []
+        # Jira rejects the label update for TEST-1 before the action runs
+        def update_labels(issue_key, add=(), remove=()):
+            if issue_key == "TEST-1":
+                raise RuntimeError("Jira unavailable")
+        clients.jira.update_labels.side_effect = update_labels
 
-        mocker.patch("alm_orchestrator.daemon.JiraClient", return_value=mock_jira)
-        mocker.patch("alm_orchestrator.daemon.GitHubClient")
-        mocker.patch("alm_orchestrator.daemon.ClaudeExecutor")
-        mocker.patch("alm_orchestrator.daemon.discover_actions")
+        daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
+        processed = daemon.poll_once()
 
+        assert processed == 1
+
+    def test_run_can_be_stopped(self, mock_config, clients):
         daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
 
         # Simulate stopping after first poll
         def stop_after_poll(*args):
             daemon.stop()
 
-        mock_jira.fetch_issues_with_ai_labels.side_effect = stop_after_poll
+        clients.jira.fetch_issues_with_ai_labels.side_effect = stop_after_poll
 
         daemon.run()
 
         assert daemon._running is False
 
+    def test_stop_interrupts_idle_wait(self, mock_config, clients, mocker):
+        """stop() ends the wait between polls instead of sleeping it out."""
+        daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
+        mocker.patch.object(daemon, "_next_poll_delay", return_value=60)
+        polled = threading.Event()
+        clients.jira.fetch_issues_with_ai_labels.side_effect = lambda: polled.set() or []
+
+        runner = threading.Thread(target=daemon.run)
+        start = time.monotonic()
+        runner.start()
+        assert polled.wait(5)
+        daemon.stop()
+        runner.join(5)
+
+        assert not runner.is_alive()
+        assert time.monotonic() - start < 5
+
+    def test_idle_polls_back_off_to_cap(self, mock_config, clients):
+        daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
+
+        delays = [daemon._next_poll_delay(idle_cycles) for idle_cycles in range(6)]
+
+        # poll_interval_seconds=1 in the fixture; capped at 10x
+        assert delays == [1, 2, 4, 8, 10, 10]
+
+    def test_idle_cycle_count_stops_at_cap(self, mock_config, clients, mocker):
+        daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
+        delay_spy = mocker.spy(daemon, "_next_poll_delay")
+        waits = []
+
+        def wait(delay):
+            waits.append(delay)
+            if len(waits) == 8:
+                daemon.stop()
+
+        mocker.patch.object(daemon._wakeup, "wait", side_effect=wait)
+        daemon.run()
+
+        idle_cycles = [call.args[0] for call in delay_spy.call_args_list]
+        assert idle_cycles == [1, 2, 3, 4, 4, 4, 4, 4]
+        assert waits[-1] == 10
+
+    def test_failing_issues_do_not_back_off(self, mock_config, clients, mocker):
+        """Polls that find issues keep the base interval even if every action fails."""
+        daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
+        clients.jira.fetch_issues_with_ai_labels.return_value = make_issues("TEST-123")
+        mocker.patch.object(daemon, "_process_issue", return_value=0)
+        delay_spy = mocker.spy(daemon, "_next_poll_delay")
+        waits = []
+
+        def wait(delay):
+            waits.append(delay)
+            if len(waits) == 3:
+                daemon.stop()
+
+        mocker.patch.object(daemon._wakeup, "wait", side_effect=wait)
+        daemon.run()
+
+        assert [call.args[0] for call in delay_spy.call_args_list] == [0, 0, 0]
+        assert waits == [1, 1, 1]
+
 
 class TestDaemonValidatorIntegration:
     def test_daemon_creates_validator(self):
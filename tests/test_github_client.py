@@ -1,13 +1,19 @@
+import base64
+import dataclasses
+import fcntl
+import json
 import os
 import tempfile
 import pytest
+import subprocess
 from unittest.mock import MagicMock
-from alm_orchestrator.github_client import GitHubClient, generate_branch_name
+from github import GithubException
+from alm_orchestrator.github_client import GitHubClient, _trash_remover, generate_branch_name
 from alm_orchestrator.config import Config
 
 
 @pytest.fixture
-def mock_config():
+def mock_config(tmp_path):
     return Config(
         jira_url="https://test.atlassian.net",
         jira_project_key="TEST",
@@ -16,6 +22,7 @@ def mock_config():
         jira_client_id="test-client-id",
         jira_client_secret="test-client-secret",
         anthropic_api_key="sk-ant-test",
+        cache_dir=str(tmp_path / "cache"),
     )
 
 
@@ -25,7 +32,13 @@ class TestGitHubClient:
 
         client = GitHubClient(mock_config)
 
-        mock_github_class.assert_called_once_with("ghp_test")
+        mock_github_class.assert_called_once_with("ghp_test", pool_size=10)
+
+    def test_connection_pool_covers_concurrent_workers(self, mock_config, mocker):
+        mock_github_class = mocker.patch("alm_orchestrator.github_client.Github")
+        GitHubClient(dataclasses.replace(mock_config, max_concurrent_issues=16))
+
+        assert mock_github_class.call_args.kwargs["pool_size"] == 16
 
     def test_clone_url_construction(self, mock_config, mocker):
         mocker.patch("alm_orchestrator.github_client.Github")
@@ -52,6 +65,131 @@ class TestGitHubClient:
         assert "git" in clone_call[0][0]
         assert "clone" in clone_call[0][0]
 
+    def test_clone_repo_creates_mirror_once_and_adds_worktrees(self, mock_config, mocker):
+        mocker.patch("alm_orchestrator.github_client.Github")
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.return_value = MagicMock(returncode=0)
+
+        client = GitHubClient(mock_config)
+        first_dir = client.clone_repo()
+        second_dir = client.clone_repo(branch="feature/x")
+
+        commands = [c[0][0] for c in mock_run.call_args_list]
+        clone_commands = [cmd for cmd in commands if "clone" in cmd]
+        assert len(clone_commands) == 1
+        assert "--bare" in clone_commands[0]
+        assert "--filter=blob:none" in clone_commands[0]
+
+        fetch_commands = [cmd for cmd in commands if "fetch" in cmd]
+        assert all("--no-tags" in cmd for cmd in clone_commands + fetch_commands)
+        assert fetch_commands[1][-1] == "+refs/heads/feature/x:refs/remotes/origin/feature/x"
+
+        worktree_commands = [cmd for cmd in commands if "worktree" in cmd]
+        assert worktree_commands[0][-2] == first_dir
+        assert worktree_commands[1][-2] == second_dir
+        assert worktree_commands[1][-1] == "refs/remotes/origin/feature/x"
+
+    def test_mirror_remote_never_contains_token(self, mock_config, mocker):
+        mocker.patch("alm_orchestrator.github_client.Github")
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.return_value = MagicMock(returncode=0)
+
+        GitHubClient(mock_config).clone_repo()
+        GitHubClient(mock_config).clone_repo()
+
+        commands = [c[0][0] for c in mock_run.call_args_list]
+        assert not any("ghp_test" in arg for cmd in commands for arg in cmd)
+        clone_command = next(cmd for cmd in commands if "clone" in cmd)
+        assert "https://github.com/acme-corp/recipe-api.git" in clone_command
+        set_url = next(cmd for cmd in commands if "set-url" in cmd)
+        assert set_url[-1] == "https://github.com/acme-corp/recipe-api.git"
+
+        fetch_call = next(c for c in mock_run.call_args_list if "fetch" in c[0][0])
+        env = fetch_call[1]["env"]
+        header = base64.b64encode(b"x-access-token:ghp_test").decode()
+        assert env["GIT_CONFIG_KEY_0"] == "http.extraheader"
+        assert env["GIT_CONFIG_VALUE_0"] == f"Authorization: Basic {header}"
+
+    def test_unusable_mirror_is_recloned(self, mock_config, mocker):
+        """A leftover directory from an interrupted clone is replaced."""
+        mocker.patch("alm_orchestrator.github_client.Github")
+        mirror_dir = os.path.join(mock_config.cache_dir, "mirrors", "acme-corp-recipe-api.git")
+        os.makedirs(mirror_dir)
+        open(os.path.join(mirror_dir, "HEAD.lock"), "w").close()
+
+        def run(cmd, **kwargs):
+            return MagicMock(returncode=128 if "rev-parse" in cmd else 0)
+
+        mock_run = mocker.patch("subprocess.run", side_effect=run)
+
+        GitHubClient(mock_config).clone_repo()
+
+        commands = [c[0][0] for c in mock_run.call_args_list]
+        clone_command = next(cmd for cmd in commands if "clone" in cmd)
+        assert clone_command[-1] == f"{mirror_dir}.partial"
+        assert os.listdir(mirror_dir) == []
+        assert not os.path.exists(f"{mirror_dir}.partial")
+
+    def test_clone_repo_checks_out_pr_head(self, mock_config, mocker):
+        """A PR is fetched via pull/<N>/head, so fork PRs work too."""
+        mocker.patch("alm_orchestrator.github_client.Github")
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.return_value = MagicMock(returncode=0)
+
+        client = GitHubClient(mock_config)
+        work_dir = client.clone_repo(pr_number=42)
+        client.clone_repo(pr_number=42)
+
+        commands = [c[0][0] for c in mock_run.call_args_list]
+        fetch_commands = [cmd for cmd in commands if "fetch" in cmd]
+        assert len(fetch_commands) == 1
+        assert "--filter=blob:none" in fetch_commands[0]
+        assert fetch_commands[0][-1] == "+refs/pull/42/head:refs/pull/42/head"
+        worktree_commands = [cmd for cmd in commands if "worktree" in cmd]
+        assert worktree_commands[0][-2:] == [work_dir, "refs/pull/42/head"]
+
+    def test_clone_repo_fetches_branch_once_per_poll_cycle(self, mock_config, mocker):
+        mocker.patch("alm_orchestrator.github_client.Github")
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.return_value = MagicMock(returncode=0)
+
+        client = GitHubClient(mock_config)
+        client.clone_repo()
+        client.clone_repo()
+        client.begin_poll_cycle()
+        client.clone_repo()
+
+        commands = [c[0][0] for c in mock_run.call_args_list]
+        assert len([cmd for cmd in commands if "fetch" in cmd]) == 2
+        assert len([cmd for cmd in commands if "worktree" in cmd]) == 3
+
+    def test_clone_repo_holds_file_lock_on_mirror(self, mock_config, mocker):
+        mocker.patch("alm_orchestrator.github_client.Github")
+        mocker.patch("subprocess.run", return_value=MagicMock(returncode=0))
+        mock_flock = mocker.patch("alm_orchestrator.github_client.fcntl.flock")
+
+        client = GitHubClient(mock_config)
+        client.clone_repo()
+
+        lock_path = os.path.join(mock_config.cache_dir, "mirrors", "acme-corp-recipe-api.git.lock")
+        assert os.path.exists(lock_path)
+        operations = [c[0][1] for c in mock_flock.call_args_list]
+        assert operations == [fcntl.LOCK_EX, fcntl.LOCK_UN]
+
+    def test_cleanup_prunes_mirror_worktree(self, mock_config, mocker):
+        mocker.patch("alm_orchestrator.github_client.Github")
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.return_value = MagicMock(returncode=0, stdout="fix-test-123\n")
+        mocker.patch("shutil.rmtree")
+        os.makedirs(os.path.join(mock_config.cache_dir, "mirrors", "acme-corp-recipe-api.git"))
+
+        client = GitHubClient(mock_config)
+        client.cleanup("/tmp/some-temp-dir")
+
+        commands = [c[0][0] for c in mock_run.call_args_list]
+        assert any("worktree" in cmd and "prune" in cmd for cmd in commands)
+        assert any(cmd[-3:] == ["branch", "-D", "fix-test-123"] for cmd in commands)
+
     def test_create_branch(self, mock_config, mocker):
         mocker.patch("alm_orchestrator.github_client.Github")
         mock_run = mocker.patch("subprocess.run")
@@ -77,10 +215,34 @@ class TestGitHubClient:
             issue_key="TEST-123",
         )
 
-        calls = [str(c) for c in mock_run.call_args_list]
-        assert any("add" in c for c in calls)
-        assert any("commit" in c for c in calls)
-        assert any("push" in c for c in calls)
+        # add, commit and push share one process instead of forking three times
+        mock_run.assert_called_once()
+        script = mock_run.call_args[0][0][2]
+        assert "git add -A" in script
+        assert "git commit" in script
+        assert "git push" in script
+
+    def test_commit_and_push_passes_message_verbatim(self, mock_config, mocker, tmp_path):
+        mocker.patch("alm_orchestrator.github_client.Github")
+        remote = tmp_path / "remote.git"
+        work_dir = tmp_path / "work"
+        subprocess.run(["git", "init", "-q", "--bare", str(remote)], check=True)
+        subprocess.run(["git", "init", "-q", str(work_dir)], check=True)
+        for key, value in [("user.name", "Test"), ("user.email", "test@example.com")]:
+            subprocess.run(["git", "-C", str(work_dir), "config", key, value], check=True)
+        subprocess.run(["git", "-C", str(work_dir), "remote", "add", "origin", str(remote)], check=True)
+        subprocess.run(["git", "-C", str(work_dir), "checkout", "-q", "-b", "fix-test-123"], check=True)
+        (work_dir / "app.py").write_text("print('hi')\n")
+
+        client = GitHubClient(mock_config)
+        message = 'fix: handle "quoted" $HOME && `ticks`'
+        client.commit_and_push(str(work_dir), "fix-test-123", message, "TEST-123")
+
+        log = subprocess.run(
+            ["git", "-C", str(remote), "log", "-1", "--format=%s", "fix-test-123"],
+            check=True, capture_output=True, text=True,
+        )
+        assert log.stdout.strip() == message
 
     def test_cleanup_work_dir(self, mock_config, mocker):
         mocker.patch("alm_orchestrator.github_client.Github")
@@ -91,6 +253,34 @@ class TestGitHubClient:
 
         mock_rmtree.assert_called_once_with("/tmp/some-temp-dir", ignore_errors=True)
 
+    def test_cleanup_renames_and_deletes_in_background(self, mock_config, mocker, tmp_path):
+        mocker.patch("alm_orchestrator.github_client.Github")
+        work_dir = tmp_path / "alm-orchestrator-work"
+        (work_dir / "src").mkdir(parents=True)
+        (work_dir / "src" / "app.py").write_text("print('hi')")
+
+        client = GitHubClient(mock_config)
+        client.cleanup(str(work_dir))
+
+        assert not work_dir.exists()
+        # The remover is single-threaded, so this runs after the delete
+        _trash_remover.submit(lambda: None).result()
+        assert not (tmp_path / "alm-orchestrator-work.trash").exists()
+
+    def test_workspace_cleans_up_when_block_raises(self, mock_config, mocker):
+        mocker.patch("alm_orchestrator.github_client.Github")
+        client = GitHubClient(mock_config)
+        mock_clone = mocker.patch.object(client, "clone_repo", return_value="/tmp/work")
+        mock_cleanup = mocker.patch.object(client, "cleanup")
+
+        with pytest.raises(RuntimeError):
+            with client.workspace(branch="feature/x") as work_dir:
+                assert work_dir == "/tmp/work"
+                raise RuntimeError("action failed")
+
+        mock_clone.assert_called_once_with(branch="feature/x", pr_number=None)
+        mock_cleanup.assert_called_once_with("/tmp/work")
+
 
 class TestGitHubClientPR:
     def test_create_pull_request(self, mock_config, mocker):
@@ -147,6 +337,9 @@ class TestGitHubClientPR:
 
         assert pr is not None
         assert pr.number == 42
+        mock_repo.get_pulls.assert_called_once_with(
+            state="open", head="acme-corp:ai/fix-TEST-123"
+        )
 
     def test_get_pr_by_branch_not_found(self, mock_config, mocker):
         mock_github = MagicMock()
@@ -162,21 +355,57 @@ class TestGitHubClientPR:
 
     def test_get_pr_info(self, mock_config, mocker):
         mock_github = MagicMock()
-        mock_repo = MagicMock()
-        mock_pr = MagicMock()
-        mock_pr.head.ref = "feature/add-user-auth"
-        mock_pr.base.ref = "main"
-        mock_pr.title = "Add user authentication"
-        mock_pr.body = "This PR adds OAuth2 authentication to the API."
 
-        mock_file1 = MagicMock()
-        mock_file1.filename = "src/auth.py"
-        mock_file2 = MagicMock()
-        mock_file2.filename = "tests/test_auth.py"
-        mock_pr.get_files.return_value = [mock_file1, mock_file2]
+        def page(paths, has_next, cursor=None):
+            return ({}, {"data": {"repository": {"pullRequest": {
+                "title": "Add user authentication",
+                "body": "This PR adds OAuth2 authentication to the API.",
+                "headRefName": "feature/add-user-auth",
+                "baseRefName": "main",
+                "files": {
+                    "nodes": [{"path": path} for path in paths],
+                    "pageInfo": {"hasNextPage": has_next, "endCursor": cursor},
+                },
+            }}}})
+
+        mock_github.requester.graphql_query.side_effect = [
+            page(["src/auth.py"], True, "cursor-1"),
+            page(["tests/test_auth.py"], False),
+        ]
+        mocker.patch("alm_orchestrator.github_client.Github", return_value=mock_github)
 
-        mock_repo.get_pull.return_value = mock_pr
-        mock_github.get_repo.return_value = mock_repo
+        client = GitHubClient(mock_config)
+        pr_info = client.get_pr_info(42)
+
+        assert pr_info == {
+            "head_branch": "feature/add-user-auth",
+            "base_branch": "main",
+            "changed_files": ["src/auth.py", "tests/test_auth.py"],
+            "title": "Add user authentication",
+            "body": "This PR adds OAuth2 authentication to the API.",
+        }
+        variables = mock_github.requester.graphql_query.call_args_list[1][0][1]
+        assert variables["owner"] == "acme-corp"
+        assert variables["name"] == "recipe-api"
+        assert variables["number"] == 42
+        assert variables["cursor"] == "cursor-1"
+        mock_github.requester.requestJson.assert_not_called()
+
+    def test_get_pr_info_falls_back_to_rest(self, mock_config, mocker):
+        mock_github = MagicMock()
+        mock_github.requester.graphql_query.side_effect = GithubException(502, None, None)
+        mock_github.get_repo.return_value.url = "https://api.github.com/repos/acme-corp/recipe-api"
+        pr_json = {
+            "head": {"ref": "feature/add-user-auth"},
+            "base": {"ref": "main"},
+            "title": "Add user authentication",
+            "body": "This PR adds OAuth2 authentication to the API.",
+        }
+        files_json = [{"filename": "src/auth.py"}, {"filename": "tests/test_auth.py"}]
+        mock_github.requester.requestJson.side_effect = [
+            (200, {"etag": '"pr-etag"'}, json.dumps(pr_json)),
+            (200, {"etag": '"files-etag"'}, json.dumps(files_json)),
+        ]
         mocker.patch("alm_orchestrator.github_client.Github", return_value=mock_github)
 
         client = GitHubClient(mock_config)
@@ -187,7 +416,87 @@ class TestGitHubClientPR:
         assert pr_info["changed_files"] == ["src/auth.py", "tests/test_auth.py"]
         assert pr_info["title"] == "Add user authentication"
         assert pr_info["body"] == "This PR adds OAuth2 authentication to the API."
-        mock_repo.get_pull.assert_called_once_with(42)
+
+    def test_get_pr_info_uses_cached_data_when_not_modified(self, mock_config, mocker):
+        mock_github = MagicMock()
+        mock_github.requester.graphql_query.side_effect = GithubException(502, None, None)
+        mock_github.get_repo.return_value.url = "https://api.github.com/repos/acme-corp/recipe-api"
+        pr_json = {
+            "head": {"ref": "feature/x"},
+            "base": {"ref": "main"},
+            "title": "Title",
+            "body": None,
+        }
+        mock_github.requester.requestJson.side_effect = [
+            (200, {"etag": '"pr-etag"'}, json.dumps(pr_json)),
+            (200, {"etag": '"files-etag"'}, json.dumps([{"filename": "a.py"}])),
+            (304, {}, ""),
+            (304, {}, ""),
+        ]
+        mocker.patch("alm_orchestrator.github_client.Github", return_value=mock_github)
+
+        client = GitHubClient(mock_config)
+        client.get_pr_info(42)
+        client.end_poll_cycle()
+        # A new client picks up the persisted ETags
+        pr_info = GitHubClient(mock_config).get_pr_info(42)
+
+        assert pr_info["changed_files"] == ["a.py"]
+        assert pr_info["body"] == ""
+        revalidation = mock_github.requester.requestJson.call_args_list[2]
+        assert revalidation[1]["headers"] == {"If-None-Match": '"pr-etag"'}
+
+    def test_etag_cache_saved_once_per_cycle(self, mock_config, mocker):
+        mock_github = MagicMock()
+        mock_github.requester.requestJson.side_effect = [
+            (200, {"etag": '"a"'}, "[1]"),
+            (200, {"etag": '"b"'}, "[2]"),
+        ]
+        mocker.patch("alm_orchestrator.github_client.Github", return_value=mock_github)
+        cache_path = os.path.join(mock_config.cache_dir, "gh-etags.json")
+
+        client = GitHubClient(mock_config)
+        client._conditional_get("https://api.github.com/a")
+        client._conditional_get("https://api.github.com/b")
+        assert not os.path.exists(cache_path)
+
+        client.end_poll_cycle()
+        with open(cache_path) as f:
+            assert list(json.load(f)) == ["https://api.github.com/a", "https://api.github.com/b"]
+
+    def test_etag_cache_evicts_least_recently_used(self, mock_config, mocker):
+        mocker.patch("alm_orchestrator.github_client.ETAG_CACHE_MAX_ENTRIES", 2)
+        mock_github = MagicMock()
+        mock_github.requester.requestJson.side_effect = [
+            (200, {"etag": '"a"'}, "[1]"),
+            (200, {"etag": '"b"'}, "[2]"),
+            (304, {}, ""),
+            (200, {"etag": '"c"'}, "[3]"),
+        ]
+        mocker.patch("alm_orchestrator.github_client.Github", return_value=mock_github)
+
+        client = GitHubClient(mock_config)
+        for name in ["a", "b", "a", "c"]:
+            client._conditional_get(f"https://api.github.com/{name}")
+
+        assert list(client._etag_cache) == ["https://api.github.com/a", "https://api.github.com/c"]
+
+    def test_not_modified_without_cached_copy_refetches(self, mock_config, mocker):
+        os.makedirs(mock_config.cache_dir)
+        with open(os.path.join(mock_config.cache_dir, "gh-etags.json"), "w") as f:
+            json.dump({"https://api.github.com/a": {"etag": '"stale"'}}, f)
+        mock_github = MagicMock()
+        mock_github.requester.requestJson.side_effect = [
+            (304, {}, ""),
+            (200, {"etag": '"a"'}, "[1]"),
+        ]
+        mocker.patch("alm_orchestrator.github_client.Github", return_value=mock_github)
+
+        data = GitHubClient(mock_config)._conditional_get("https://api.github.com/a")
+
+        assert data == [1]
+        retry = mock_github.requester.requestJson.call_args_list[1]
+        assert "headers" not in retry[1]
 
 
 class TestGenerateBranchName:
@@ -1,7 +1,10 @@
+import dataclasses
+import json
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from alm_orchestrator.jira_client import JiraClient, OAuthTokenManager
 from alm_orchestrator.config import Config
+from jira.client import TokenAuth
 
 
 @pytest.fixture
@@ -32,6 +35,27 @@ class TestJiraClient:
             token_auth="mock-access-token",
         )
 
+    def test_token_refresh_keeps_session(self, mock_config, mocker):
+        """A refreshed token is applied to the existing pooled session."""
+        mock_jira = MagicMock()
+        mock_jira_class = mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
+        mocker.patch.object(
+            OAuthTokenManager, "get_token", side_effect=["token-1", "token-1", "token-2"]
+        )
+        mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
+        mock_jira.myself.return_value = {"accountId": "bot"}
+
+        client = JiraClient(mock_config)
+        original_auth = mock_jira._session.auth
+        client._get_jira()
+        assert mock_jira._session.auth is original_auth
+
+        client._get_jira()
+
+        mock_jira_class.assert_called_once()
+        assert isinstance(mock_jira._session.auth, TokenAuth)
+        assert mock_jira._session.auth._token == "token-2"
+
     def test_fetch_issues_with_ai_labels(self, mock_config, mocker):
         mock_jira = MagicMock()
         mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
@@ -55,6 +79,9 @@ class TestJiraClient:
         jql = call_args[0][0]
         assert "ai-investigate" in jql or "labels in" in jql
 
+        # Every page is fetched rather than only the first
+        assert call_args[1]["maxResults"] is False
+
     def test_get_ai_labels_for_issue(self, mock_config, mocker):
         mock_jira = MagicMock()
         mock_myself = MagicMock()
@@ -106,6 +133,34 @@ class TestJiraClient:
         assert client.account_id == "abc123-account-id"
         mock_jira.myself.assert_called_once()
 
+    def test_each_http_request_is_rate_limited(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        send = mock_jira._session.send
+        mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
+        mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
+        mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
+        mock_acquire = mocker.patch("alm_orchestrator.jira_client.TokenBucket.acquire")
+
+        client = JiraClient(mock_config)
+        # e.g. the pages of one paged search
+        for page in range(3):
+            mock_jira._session.send(f"request-{page}")
+
+        assert mock_acquire.call_count == 3
+        assert send.call_count == 3
+
+    def test_rate_limit_comes_from_config(self, mock_config, mocker):
+        mocker.patch("alm_orchestrator.jira_client.JIRA")
+        mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
+        mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
+        mock_bucket = mocker.patch("alm_orchestrator.jira_client.TokenBucket")
+
+        JiraClient(dataclasses.replace(
+            mock_config, jira_requests_per_second=2.0, jira_request_burst=4
+        ))
+
+        mock_bucket.assert_called_once_with(2.0, 4)
+
 
 class TestJiraClientUpdates:
     def test_add_label(self, mock_config, mocker):
@@ -114,19 +169,14 @@ class TestJiraClientUpdates:
         mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
         mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
 
-        mock_issue = MagicMock()
-        mock_issue.key = "TEST-123"
-        mock_issue.fields.labels = ["bug"]
-        mock_jira.issue.return_value = mock_issue
-
         client = JiraClient(mock_config)
         client.add_label("TEST-123", "ai-processing")
 
-        mock_issue.update.assert_called_once()
-        update_call = mock_issue.update.call_args
-        new_labels = update_call[1]["fields"]["labels"]
-        assert "ai-processing" in new_labels
-        assert "bug" in new_labels
+        # One PUT with an "add" operation, no read-modify-write
+        mock_jira.issue.assert_not_called()
+        mock_jira._session.put.assert_called_once()
+        payload = json.loads(mock_jira._session.put.call_args[1]["data"])
+        assert payload == {"update": {"labels": [{"add": "ai-processing"}]}}
 
     def test_add_comment(self, mock_config, mocker):
         mock_jira = MagicMock()
@@ -142,29 +192,61 @@ class TestJiraClientUpdates:
             "AI analysis complete:\n\nRoot cause identified."
         )
 
-    def test_remove_label(self, mock_config, mocker):
+    def test_finish_action_single_put(self, mock_config, mocker):
         mock_jira = MagicMock()
+        mock_jira._get_url.return_value = "https://jira/rest/api/2/issue/TEST-123"
         mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
         mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
         mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
 
-        mock_issue = MagicMock()
-        mock_issue.key = "TEST-123"
-        mock_issue.fields.labels = ["ai-investigate", "bug", "priority-high"]
-        mock_jira.issue.return_value = mock_issue
+        client = JiraClient(mock_config)
+        client.finish_action("TEST-123", "Done.")
+
+        mock_jira._get_url.assert_called_once_with("issue/TEST-123")
+        mock_jira._session.put.assert_called_once()
+        payload = json.loads(mock_jira._session.put.call_args[1]["data"])
+        assert payload == {
+            "update": {
+                "comment": [{"add": {"body": "Done."}}],
+                "labels": [{"remove": "ai-processing"}],
+            }
+        }
+        mock_jira.add_comment.assert_not_called()
+        mock_jira.issue.assert_not_called()
+
+    def test_remove_label(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
+        mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
+        mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
 
         client = JiraClient(mock_config)
         client.remove_label("TEST-123", "ai-investigate")
 
-        # Should update issue with label removed
-        mock_issue.update.assert_called_once()
-        update_call = mock_issue.update.call_args
-        new_labels = update_call[1]["fields"]["labels"]
-        assert "ai-investigate" not in new_labels
-        assert "bug" in new_labels
-        assert "priority-high" in new_labels
+        mock_jira.issue.assert_not_called()
+        mock_jira._session.put.assert_called_once()
+        payload = json.loads(mock_jira._session.put.call_args[1]["data"])
+        assert payload == {"update": {"labels": [{"remove": "ai-investigate"}]}}
 
-    def test_remove_label_not_present(self, mock_config, mocker):
+    def test_update_labels_swaps_in_one_put(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
+        mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
+        mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
+
+        client = JiraClient(mock_config)
+        client.update_labels("TEST-123", add=["ai-processing"], remove=["ai-investigate"])
+        client.update_labels("TEST-123")
+
+        mock_jira._session.put.assert_called_once()
+        payload = json.loads(mock_jira._session.put.call_args[1]["data"])
+        assert payload == {"update": {"labels": [
+            {"remove": "ai-investigate"},
+            {"add": "ai-processing"},
+        ]}}
+
+    def test_label_change_keeps_polled_comments(self, mock_config, mocker):
+        """Swapping the trigger label must not discard the polled comments."""
         mock_jira = MagicMock()
         mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
         mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
@@ -172,14 +254,16 @@ class TestJiraClientUpdates:
 
         mock_issue = MagicMock()
         mock_issue.key = "TEST-123"
-        mock_issue.fields.labels = ["bug"]
-        mock_jira.issue.return_value = mock_issue
+        mock_issue.fields.comment.comments = []
+        mock_issue.fields.comment.total = 0
+        mock_jira.search_issues.return_value = [mock_issue]
 
         client = JiraClient(mock_config)
-        # Should not raise, just no-op
-        client.remove_label("TEST-123", "ai-investigate")
+        client.fetch_issues_with_ai_labels()
+        client.update_labels("TEST-123", add=["ai-processing"], remove=["ai-investigate"])
+        client.get_comments("TEST-123")
 
-        mock_issue.update.assert_not_called()
+        mock_jira.issue.assert_not_called()
 
 
 class TestJiraClientComments:
@@ -245,6 +329,73 @@ class TestJiraClientComments:
 
         assert result == []
 
+    def test_get_comments_uses_polled_issue(self, mock_config, mocker):
+        """Test that get_comments reuses comments from the last search."""
+        mock_jira = MagicMock()
+        mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
+        mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
+        mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
+
+        mock_comment = MagicMock()
+        mock_comment.body = "Cached comment"
+        mock_comment.created = "2024-01-01T10:00:00.000+0000"
+        mock_comment.author.accountId = "author-1"
+
+        mock_issue = MagicMock()
+        mock_issue.key = "TEST-123"
+        mock_issue.fields.comment.comments = [mock_comment]
+        mock_issue.fields.comment.total = 1
+        mock_jira.search_issues.return_value = [mock_issue]
+
+        client = JiraClient(mock_config)
+        client.fetch_issues_with_ai_labels()
+        result = client.get_comments("TEST-123")
+
+        assert result[0]["body"] == "Cached comment"
+        mock_jira.issue.assert_not_called()
+        assert mock_jira.search_issues.call_args[1]["fields"] == JiraClient.ISSUE_FIELDS
+
+    def test_add_comment_invalidates_polled_issue(self, mock_config, mocker):
+        """Test that comments are re-fetched after this client posts one."""
+        mock_jira = MagicMock()
+        mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
+        mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
+        mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
+
+        mock_issue = MagicMock()
+        mock_issue.key = "TEST-123"
+        mock_issue.fields.comment.comments = []
+        mock_issue.fields.comment.total = 0
+        mock_jira.search_issues.return_value = [mock_issue]
+        mock_jira.issue.return_value = mock_issue
+
+        client = JiraClient(mock_config)
+        client.fetch_issues_with_ai_labels()
+        client.add_comment("TEST-123", "New comment")
+        client.get_comments("TEST-123")
+
+        mock_jira.issue.assert_called_once_with("TEST-123", fields="comment")
+
+    def test_fetched_comments_reused_until_issue_modified(self, mock_config, mocker):
+        """Test that comments fetched from Jira are reused until a post."""
+        mock_jira = MagicMock()
+        mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
+        mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
+        mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
+
+        mock_issue = MagicMock()
+        mock_issue.fields.comment.comments = []
+        mock_jira.issue.return_value = mock_issue
+
+        client = JiraClient(mock_config)
+        client.get_investigation_comment("TEST-123")
+        client.get_recommendation_comment("TEST-123")
+        assert mock_jira.issue.call_count == 1
+
+        client.finish_action("TEST-123", "Done")
+        client.get_investigation_comment("TEST-123")
+        assert mock_jira.issue.call_count == 2
+
 
 class TestJiraClientInvestigation:
     """Tests for investigation comment retrieval."""
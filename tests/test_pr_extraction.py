@@ -24,6 +24,21 @@ class TestExtractPrNumber:
         text = "Pull Request: #789"
         assert extract_pr_number(text) == 789
 
+    def test_extracts_url_after_pr_label(self):
+        text = "PR: https://github.com/owner/repo/pull/42"
+        assert extract_pr_number(text) == 42
+
+    def test_url_wins_over_earlier_pr_text(self):
+        text = "Regressed in the Apr 2024 release, fix in https://github.com/o/r/pull/42"
+        assert extract_pr_number(text) == 42
+
+    @pytest.mark.parametrize("text", ["Released in Apr 2024", "MyPR: 12", "SPR #3"])
+    def test_ignores_pr_inside_words(self, text):
+        assert extract_pr_number(text) is None
+
+    def test_matches_pr_after_punctuation(self):
+        assert extract_pr_number("(PR #12)") == 12
+
     def test_case_insensitive(self):
         text = "pr #42"
         assert extract_pr_number(text) == 42
@@ -63,3 +78,10 @@ class TestFindPrInTexts:
     def test_returns_none_for_empty_inputs(self):
         result = find_pr_in_texts("", [])
         assert result is None
+
+    def test_scans_large_comment_stream(self):
+        # Near-miss prefixes must not cause backtracking blowups
+        filler = "PR: none yet, see github.com/owner " * 30000
+        comments = [filler] * 3 + ["Pull Request: #7"]
+        result = find_pr_in_texts(filler, comments)
+        assert result == 7
@@ -0,0 +1,40 @@
+"""Tests for the request rate limiter."""
+
+from alm_orchestrator.utils.rate_limit import TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_within_capacity_does_not_wait(self, mocker):
+        mocker.patch("time.monotonic", return_value=100.0)
+        mock_sleep = mocker.patch("time.sleep")
+
+        bucket = TokenBucket(rate=2.0, capacity=3)
+        for _ in range(3):
+            bucket.acquire()
+
+        mock_sleep.assert_not_called()
+
+    def test_waits_once_bucket_is_empty(self, mocker):
+        mocker.patch("time.monotonic", return_value=100.0)
+        mock_sleep = mocker.patch("time.sleep")
+
+        bucket = TokenBucket(rate=2.0, capacity=1)
+        bucket.acquire()
+        bucket.acquire()
+        bucket.acquire()
+
+        # Each caller reserves the next slot, so waits grow by 1/rate
+        assert [c[0][0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    def test_refills_over_time(self, mocker):
+        clock = mocker.patch("time.monotonic", return_value=100.0)
+        mock_sleep = mocker.patch("time.sleep")
+
+        bucket = TokenBucket(rate=2.0, capacity=1)
+        bucket.acquire()
+        clock.return_value = 100.5
+        bucket.acquire()
+
+        mock_sleep.assert_not_called()
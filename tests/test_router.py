@@ -102,6 +102,22 @@ class TestBaseAction:
         assert path == "/tmp/prompts/code-review.md"
 
 
+    def test_get_template_path_uses_scanned_templates(self, tmp_path):
+        (tmp_path / "investigate.md").write_text("template")
+        action = MockAction(str(tmp_path))
+
+        # Lookup is by name, so it follows label changes after construction
+        action._label = "ai-investigate"
+        assert action.get_template_path() == str(tmp_path / "investigate.md")
+
+    def test_template_name_override(self):
+        from alm_orchestrator.actions.code_review import CodeReviewAction
+
+        action = CodeReviewAction("/tmp/prompts", validator=MagicMock())
+
+        assert action.get_template_path() == "/tmp/prompts/code_review.md"
+
+
 class TestDiscoverActionsWithValidator:
     def test_validator_passed_to_actions(self):
         """Actions are instantiated with validator."""
@@ -122,3 +138,18 @@ class TestDiscoverActionsWithValidator:
         # Verify the action has a validator attribute and it's the one we passed
         assert hasattr(first_action, '_validator')
         assert first_action._validator is validator
+
+    def test_action_package_scanned_once(self, mocker):
+        """Repeated discovery reuses the classes found on the first scan."""
+        import pkgutil
+
+        discover_actions("/tmp/prompts")
+        spy = mocker.spy(pkgutil, "iter_modules")
+
+        first = discover_actions("/tmp/prompts")
+        second = discover_actions("/other/prompts")
+
+        spy.assert_not_called()
+        assert first.action_names == second.action_names
+        # Each call still gets its own action instances
+        assert first.get_action("ai-investigate") is not second.get_action("ai-investigate")